@@ -0,0 +1,167 @@
+"""
+Throughput benchmark: HTTP server with 1, 2, 4, ... worker processes.
+
+Starts the server with `--transport http --workers N` (stateless JSON mode)
+and drives concurrent search_products tool calls against it. Upstream
+responses are pre-seeded in the shared disk cache and the in-memory search
+cache is disabled, so every call does the CPU-bound part of a real request
+(JSON decode, pydantic validation, response formatting) without network.
+Throughput should scale with workers up to the number of CPU cores.
+
+사용법:
+    uv run python benchmarks/bench_http_workers.py
+    uv run python benchmarks/bench_http_workers.py --workers 1,2,4,8 --requests 2000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+
+import httpx
+
+# 프로젝트 루트를 경로에 추가
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+SEARCH_PATH = "/v2/providers/affiliate_open_api/apis/openapi/products/search"
+PRODUCTS_PER_RESPONSE = 100
+
+
+def make_response(keyword: str) -> dict:
+    """Build a realistic search response with 100 products."""
+    return {"rCode": "0", "rMessage": "", "data": {"productData": [
+        {
+            "productId": 7000000000 + i,
+            "productName": f"{keyword} 무선 블루투스 모델 {i}",
+            "productPrice": 10000 + (i * 7919) % 290000,
+            "productImage": f"https://thumbnail.coupangcdn.com/thumbnails/remote/492x492ex/image/{i}.jpg",
+            "productUrl": f"https://link.coupang.com/re/AFFSDP?lptag=AF1234567&pageKey={i}&itemId={i}",
+            "categoryName": ("이어폰", "헤드폰", "스피커")[i % 3],
+            "isRocket": i % 2 == 0,
+            "isFreeShipping": i % 3 == 0,
+            "discountRate": i % 40,
+        }
+        for i in range(PRODUCTS_PER_RESPONSE)
+    ]}}
+
+
+def seed_disk_cache(db_path: str, partner_id: str, keywords: list) -> None:
+    """Store search responses for the keywords the way the client caches them."""
+    import json
+
+    from src.utils.disk_cache import DiskCache
+
+    cache = DiskCache(db_path, {"search": 3600})
+
+    async def seed():
+        for keyword in keywords:
+            query = urlencode({"keyword": keyword, "limit": PRODUCTS_PER_RESPONSE})
+            payload = json.dumps(make_response(keyword), ensure_ascii=False).encode("utf-8")
+            await cache.set("search", f"{partner_id}:GET {SEARCH_PATH}?{query}", payload)
+
+    asyncio.run(seed())
+    cache.close()
+
+
+def start_server(workers: int, port: int, env: dict) -> subprocess.Popen:
+    """Start the HTTP server and wait until every worker can answer."""
+    process = subprocess.Popen(
+        [sys.executable, str(ROOT / "main.py"), "--transport", "http", "--port", str(port), "--workers", str(workers)],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                time.sleep(0.5 * workers)  # Let the remaining workers finish starting
+                return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"Server with {workers} worker(s) did not start")
+
+
+async def drive(port: int, keywords: list, requests: int, concurrency: int) -> tuple:
+    """Send tool calls with bounded concurrency; return (seconds, latencies)."""
+    url = f"http://127.0.0.1:{port}/mcp"
+    headers = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+    latencies = []
+    counter = iter(range(requests))
+
+    async def worker(client: httpx.AsyncClient):
+        for i in counter:
+            body = {
+                "jsonrpc": "2.0", "id": i, "method": "tools/call",
+                "params": {"name": "search_products",
+                           "arguments": {"keyword": keywords[i % len(keywords)], "limit": PRODUCTS_PER_RESPONSE}},
+            }
+            started = time.perf_counter()
+            response = await client.post(url, json=body, headers=headers)
+            latencies.append(time.perf_counter() - started)
+            text = response.json()["result"]["content"][0]["text"]
+            if not text.startswith(f"Found {PRODUCTS_PER_RESPONSE} product(s)"):
+                raise RuntimeError(f"Unexpected tool response: {text[:200]}")
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(timeout=60, limits=limits) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        return time.perf_counter() - started, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated worker counts")
+    parser.add_argument("--requests", type=int, default=1000, help="Tool calls per run")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent client connections")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    keywords = [f"상품{i}" for i in range(50)]
+    with tempfile.TemporaryDirectory() as directory:
+        env = {
+            **os.environ,
+            "COUPANG_ACCESS_KEY": os.environ.get("COUPANG_ACCESS_KEY", "bench"),
+            "COUPANG_SECRET_KEY": os.environ.get("COUPANG_SECRET_KEY", "bench"),
+            "COUPANG_PARTNER_ID": os.environ.get("COUPANG_PARTNER_ID", "bench"),
+            "COUPANG_DISK_CACHE_PATH": os.path.join(directory, "responses.db"),
+            "COUPANG_RATE_LIMIT_DB": os.path.join(directory, "rate_limit.db"),
+            "COUPANG_SEARCH_CACHE_TTL": "0",
+            "COUPANG_CACHE_SWR_WINDOW": "0",
+            "COUPANG_HTTP_WARMUP_CONNECTIONS": "0",
+            "COUPANG_CATEGORY_REFRESH_INTERVAL": "0",
+            "COUPANG_MCP_STATELESS": "true",
+            "COUPANG_MCP_JSON_RESPONSE": "true",
+        }
+        seed_disk_cache(env["COUPANG_DISK_CACHE_PATH"], env["COUPANG_PARTNER_ID"], keywords)
+
+        print(f"CPU cores: {os.cpu_count()}, requests: {args.requests}, concurrency: {args.concurrency}")
+        print(f"{'workers':>8} {'req/s':>10} {'p50 ms':>10} {'p95 ms':>10} {'speedup':>8}")
+        baseline = None
+        for workers in (int(count) for count in args.workers.split(",")):
+            process = start_server(workers, args.port, env)
+            try:
+                asyncio.run(drive(args.port, keywords, min(args.requests, 100), args.concurrency))  # warm-up
+                seconds, latencies = asyncio.run(drive(args.port, keywords, args.requests, args.concurrency))
+            finally:
+                process.terminate()
+                process.wait(timeout=30)
+
+            throughput = args.requests / seconds
+            baseline = baseline or throughput
+            latencies.sort()
+            print(
+                f"{workers:>8} {throughput:>10.1f} {statistics.median(latencies) * 1000:>10.1f} "
+                f"{latencies[int(len(latencies) * 0.95)] * 1000:>10.1f} {throughput / baseline:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Microbenchmark: per-response CPU cost of decoding and parsing product lists.
+
+Compares, for 10/50/100-product search responses:
+  - aiohttp-style str decode + stdlib json + per-item Product(**item)
+  - bytes + each installed decoder + batch parse_products
+  - typed decode straight from bytes (parse_products_json)
+
+사용법:
+    uv run python benchmarks/bench_json_decode.py
+"""
+
+import json
+import sys
+import timeit
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.product import Product, parse_products, parse_products_json
+from src.utils.json_codec import available_decoders, get_decoder
+
+
+def make_payload(count: int) -> bytes:
+    """Build a realistic search response body with `count` products."""
+    products = [
+        {
+            "productId": 7000000000 + i,
+            "productName": f"삼성전자 갤럭시북 노트북 15.6인치 모델 {i}",
+            "productPrice": 899000 + i * 1000,
+            "productImage": f"https://thumbnail.coupangcdn.com/thumbnails/remote/492x492ex/image/{i}.jpg",
+            "productUrl": f"https://link.coupang.com/re/AFFSDP?lptag=AF1234567&pageKey={i}&itemId={i}",
+            "categoryName": "노트북",
+            "isRocket": i % 2 == 0,
+            "isFreeShipping": i % 3 == 0,
+            "discountRate": i % 40,
+            "originalPrice": 999000 + i * 1000,
+        }
+        for i in range(count)
+    ]
+    body = {"rCode": "0", "rMessage": "", "data": {"landingUrl": "https://link.coupang.com/", "productData": products}}
+    return json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+
+def baseline(raw: bytes) -> list:
+    """Previous path: decode to str, stdlib json, one model per item."""
+    data = json.loads(raw.decode("utf-8"))
+    return [Product(**item) for item in data["data"]["productData"]]
+
+
+def with_decoder(decode):
+    """Bytes path: pluggable decoder, batch validation."""
+    def run(raw: bytes) -> list:
+        return parse_products(decode(raw)["data"]["productData"])
+    return run
+
+
+def measure(func, raw: bytes, number: int) -> float:
+    """Return mean microseconds per call."""
+    return timeit.timeit(lambda: func(raw), number=number) / number * 1e6
+
+
+def main():
+    """Run benchmark and print a table."""
+    cases = [("str+json+per-item (before)", baseline)]
+    for name in available_decoders():
+        cases.append((f"bytes+{name}+batch", with_decoder(get_decoder(name))))
+    cases.append(("bytes+typed (pydantic-core)", parse_products_json))
+
+    sizes = (10, 50, 100)
+    print(f"{'path':<30}" + "".join(f"{f'{n} items':>14}" for n in sizes))
+    print("-" * (30 + 14 * len(sizes)))
+
+    for label, func in cases:
+        row = f"{label:<30}"
+        for size in sizes:
+            raw = make_payload(size)
+            assert len(func(raw)) == size
+            row += f"{measure(func, raw, number=max(2000 // size, 20)):>11.1f} us"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
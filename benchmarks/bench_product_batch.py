@@ -0,0 +1,100 @@
+"""
+Microbenchmark: summary, filter and sort over object lists vs ProductBatch.
+
+For merged result sets of 100/1,000/10,000 products, compares:
+  - list of Product: three-pass summary, list-comprehension filter, key sort
+  - ProductBatch: column summary, column filter, column sort
+  - building each from raw API dicts (parse_products vs ProductBatch.from_api)
+
+사용법:
+    uv run python benchmarks/bench_product_batch.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.batch import ProductBatch
+from src.models.product import parse_products
+
+
+def make_items(count: int) -> list:
+    """Build realistic raw API product dicts."""
+    return [
+        {
+            "productId": 7000000000 + i,
+            "productName": f"무선 이어폰 블루투스 모델 {i}",
+            "productPrice": 10000 + (i * 7919) % 290000,
+            "productImage": f"https://thumbnail.coupangcdn.com/thumbnails/remote/492x492ex/image/{i}.jpg",
+            "productUrl": f"https://link.coupang.com/re/AFFSDP?lptag=AF1234567&pageKey={i}&itemId={i}",
+            "categoryName": ("이어폰", "헤드폰", "스피커")[i % 3],
+            "isRocket": i % 2 == 0,
+            "isFreeShipping": i % 3 == 0,
+            "discountRate": i % 40,
+        }
+        for i in range(count)
+    ]
+
+
+def list_summary(products: list) -> dict:
+    """Previous get_search_summary implementation."""
+    prices = [p.product_price for p in products]
+    return {
+        "total_count": len(products),
+        "avg_price": sum(prices) // len(prices),
+        "min_price": min(prices),
+        "max_price": max(prices),
+        "rocket_count": sum(1 for p in products if p.is_rocket),
+        "free_shipping_count": sum(1 for p in products if p.is_free_shipping),
+    }
+
+
+def list_filter_sort(products: list) -> list:
+    """Previous playground price filter: comprehension then key sort."""
+    filtered = [p for p in products if 50000 <= p.product_price <= 150000 and p.is_rocket]
+    filtered.sort(key=lambda p: p.product_price)
+    return filtered
+
+
+def measure(func, number: int) -> float:
+    """Return mean microseconds per call."""
+    return timeit.timeit(func, number=number) / number * 1e6
+
+
+def main():
+    """Run benchmark and print a table."""
+    sizes = (100, 1000, 10000)
+    print(f"{'operation':<34}" + "".join(f"{f'{n} items':>15}" for n in sizes))
+    print("-" * (34 + 15 * len(sizes)))
+
+    rows = {}
+    for size in sizes:
+        items = make_items(size)
+        products = parse_products(items)
+        batch = ProductBatch.from_api(items)
+        assert list_summary(products) == batch.summary()
+        assert [p.product_id for p in list_filter_sort(products)] == \
+            batch.filter(min_price=50000, max_price=150000, rocket=True).sort("price").product_ids
+
+        number = max(200000 // size, 5)
+        cases = {
+            "summary: list of Product": lambda: list_summary(products),
+            "summary: ProductBatch": batch.summary,
+            "filter+sort: list of Product": lambda: list_filter_sort(products),
+            "filter+sort: ProductBatch": lambda: batch.filter(
+                min_price=50000, max_price=150000, rocket=True).sort("price"),
+            "build: parse_products": lambda: parse_products(items),
+            "build: ProductBatch.from_api": lambda: ProductBatch.from_api(items),
+        }
+        for label, func in cases.items():
+            rows.setdefault(label, []).append(measure(func, number))
+
+    for label, timings in rows.items():
+        print(f"{label:<34}" + "".join(f"{t:>12.1f} us" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Microbenchmark: memory footprint and construction cost of product types.
+
+Compares pydantic Product with the compact ProductRecord for:
+  - retained memory per product when holding many products (tracemalloc)
+  - construction throughput from API dicts (parse_products vs parse_product_records)
+  - conversion between the two types
+
+사용법:
+    uv run python benchmarks/bench_product_record.py
+"""
+
+import gc
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.product import parse_products
+from src.models.record import ProductRecord, parse_product_records
+
+
+def make_items(count: int) -> list:
+    """Build realistic raw API product dicts."""
+    return [
+        {
+            "productId": 7000000000 + i,
+            "productName": f"삼성전자 갤럭시북 노트북 15.6인치 모델 {i}",
+            "productPrice": 899000 + i * 1000,
+            "productImage": f"https://thumbnail.coupangcdn.com/thumbnails/remote/492x492ex/image/{i}.jpg",
+            "productUrl": f"https://link.coupang.com/re/AFFSDP?lptag=AF1234567&pageKey={i}&itemId={i}",
+            "categoryName": "노트북",
+            "isRocket": i % 2 == 0,
+            "isFreeShipping": i % 3 == 0,
+            "discountRate": i % 40,
+            "originalPrice": 999000 + i * 1000,
+        }
+        for i in range(count)
+    ]
+
+
+def retained_bytes(parser, items: list) -> int:
+    """Return bytes still allocated after parsing `items` and keeping the result."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = parser(items)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(result) == len(items)
+    return after - before
+
+
+def measure(func, number: int) -> float:
+    """Return mean microseconds per call."""
+    return timeit.timeit(func, number=number) / number * 1e6
+
+
+def main():
+    """Run benchmark and print tables."""
+    parsers = [("Product (pydantic)", parse_products), ("ProductRecord (slots)", parse_product_records)]
+
+    # Field strings are shared with the input dicts, so this is per-object overhead
+    count = 10000
+    items = make_items(count)
+    print(f"Retained memory for {count:,} products (excluding shared field strings)")
+    print("-" * 56)
+    for label, parser in parsers:
+        size = retained_bytes(parser, items)
+        print(f"{label:<24}{size / 1024:>12.1f} KiB{size / count:>12.1f} B/item")
+    print()
+
+    sizes = (10, 100, 1000)
+    print(f"{'construction from dicts':<30}" + "".join(f"{f'{n} items':>14}" for n in sizes))
+    print("-" * (30 + 14 * len(sizes)))
+    for label, parser in parsers:
+        row = f"{label:<30}"
+        for size in sizes:
+            batch = make_items(size)
+            row += f"{measure(lambda: parser(batch), number=max(20000 // size, 20)):>11.1f} us"
+        print(row)
+    print()
+
+    products = parse_products(make_items(100))
+    records = parse_product_records(make_items(100))
+    print("conversion (100 items)")
+    print("-" * 44)
+    print(f"{'Product -> ProductRecord':<30}"
+          f"{measure(lambda: [ProductRecord.from_product(p) for p in products], 200):>11.1f} us")
+    print(f"{'ProductRecord -> Product':<30}"
+          f"{measure(lambda: [r.to_product() for r in records], 200):>11.1f} us")
+
+
+if __name__ == "__main__":
+    main()
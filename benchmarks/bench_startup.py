@@ -0,0 +1,104 @@
+"""
+Cold-start benchmark: server launch to the first list_tools response.
+
+Launches the stdio server as an MCP client would (`coupang-mcp-server`, i.e.
+src.server:main), sends initialize, the initialized notification and
+tools/list, and measures the time until the tools/list response arrives.
+Two startup modes are compared:
+
+- lazy: the server as shipped; config, the Coupang client (aiohttp) and the
+  request models are loaded on first use or in the background
+- eager: the client modules imported and the config loaded before main(),
+  like every launch did when they were imported at module level
+
+사용법:
+    uv run python benchmarks/bench_startup.py
+    uv run python benchmarks/bench_startup.py --runs 20
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+LAUNCHERS = {
+    "lazy": "from src.server import main; main()",
+    "eager": (
+        "import src.coupang_client, src.category_refresher, src.tools.search; "
+        "from src.utils.config import get_config; get_config(); "
+        "from src.server import main; main()"
+    ),
+}
+
+MESSAGES = [
+    {
+        "jsonrpc": "2.0", "id": 1, "method": "initialize",
+        "params": {"protocolVersion": "2025-03-26", "capabilities": {}, "clientInfo": {"name": "bench", "version": "1"}},
+    },
+    {"jsonrpc": "2.0", "method": "notifications/initialized"},
+    {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+]
+
+
+def time_to_list_tools(code: str, env: dict) -> float:
+    """Launch the server and return seconds until the tools/list response."""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", code], cwd=ROOT, env=env,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    try:
+        process.stdin.write("".join(json.dumps(message) + "\n" for message in MESSAGES).encode())
+        process.stdin.flush()
+        for line in process.stdout:
+            response = json.loads(line)
+            if response.get("id") == 2:
+                elapsed = time.perf_counter() - started
+                if not response["result"]["tools"]:
+                    raise RuntimeError("Server listed no tools")
+                return elapsed
+        raise RuntimeError("Server exited before answering tools/list")
+    finally:
+        process.kill()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=10, help="Launches per mode")
+    args = parser.parse_args()
+
+    env = {
+        **os.environ,
+        "COUPANG_ACCESS_KEY": os.environ.get("COUPANG_ACCESS_KEY", "bench"),
+        "COUPANG_SECRET_KEY": os.environ.get("COUPANG_SECRET_KEY", "bench"),
+        "COUPANG_PARTNER_ID": os.environ.get("COUPANG_PARTNER_ID", "bench"),
+        # Keep the benchmark offline
+        "COUPANG_HTTP_WARMUP_CONNECTIONS": "0",
+        "COUPANG_CATEGORY_REFRESH_INTERVAL": "0",
+    }
+
+    # One untimed launch so both modes start with compiled bytecode and a warm file cache
+    time_to_list_tools(LAUNCHERS["eager"], env)
+
+    print(f"Launch to first list_tools response ({args.runs} runs per mode)")
+    print(f"{'mode':>8} {'median ms':>10} {'min ms':>10} {'max ms':>10}")
+    results = {}
+    for mode, code in LAUNCHERS.items():
+        times = [time_to_list_tools(code, env) * 1000 for _ in range(args.runs)]
+        results[mode] = statistics.median(times)
+        print(f"{mode:>8} {results[mode]:>10.1f} {min(times):>10.1f} {max(times):>10.1f}")
+
+    print(f"\nlazy saves {results['eager'] - results['lazy']:.1f} ms per launch")
+
+
+if __name__ == "__main__":
+    main()
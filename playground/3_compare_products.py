@@ -40,12 +40,17 @@ async def main():
     print("-" * 60)
     print()
 
-    # 각 키워드로 검색
+    # 모든 키워드를 동시에 검색
     async with CoupangClient() as client:
         try:
-            for keyword in keywords:
-                print(f"\n[{keyword}] 검색 중...")
-                products = await client.search_products(keyword, limit=3)
+            results = await client.search_products_batch(keywords, limit=3)
+
+            for keyword, products in results.items():
+                print(f"\n[{keyword}]")
+
+                if isinstance(products, Exception):
+                    print(f"  오류: {products}")
+                    continue
 
                 if not products:
                     print(f"  결과 없음")
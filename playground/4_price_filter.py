@@ -13,6 +13,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.coupang_client import CoupangClient
+from src.models.batch import ProductBatch
 
 
 async def main():
@@ -34,11 +35,11 @@ async def main():
 
     # 최대 가격
     max_price_input = input("최대 가격 (원, 엔터시 제한 없음): ").strip()
-    max_price = int(max_price_input) if max_price_input else float('inf')
+    max_price = int(max_price_input) if max_price_input else None
 
     print()
     print(f"검색 중: '{keyword}'")
-    print(f"가격 범위: {min_price:,}원 ~ {max_price:,}원" if max_price != float('inf') else f"가격 범위: {min_price:,}원 이상")
+    print(f"가격 범위: {min_price:,}원 ~ {max_price:,}원" if max_price is not None else f"가격 범위: {min_price:,}원 이상")
     print("-" * 60)
     print()
 
@@ -51,23 +52,22 @@ async def main():
                 print("검색 결과가 없습니다.")
                 return
 
-            # 가격 필터링
-            filtered = [
-                p for p in products
-                if min_price <= p.product_price <= max_price
-            ]
+            # 열 기반 배치로 변환 후 가격 필터링
+            batch = ProductBatch.from_products(products)
+            filtered = batch.filter(min_price=min_price, max_price=max_price)
 
             if not filtered:
+                summary = batch.summary()
                 print(f"가격 범위 내 상품이 없습니다.")
-                print(f"\n전체 검색 결과: {len(products)}개")
-                print(f"최저가: {min(p.product_price for p in products):,}원")
-                print(f"최고가: {max(p.product_price for p in products):,}원")
+                print(f"\n전체 검색 결과: {summary['total_count']}개")
+                print(f"최저가: {summary['min_price']:,}원")
+                print(f"최고가: {summary['max_price']:,}원")
                 return
 
-            print(f">> {len(filtered)}개 상품 발견! (전체 {len(products)}개 중)\n")
+            print(f">> {len(filtered)}개 상품 발견! (전체 {len(batch)}개 중)\n")
 
             # 가격순 정렬
-            filtered.sort(key=lambda p: p.product_price)
+            filtered = filtered.sort("price")
 
             for i, product in enumerate(filtered[:10], 1):  # 상위 10개만
                 print(f"[{i}] {product.product_name}")
@@ -0,0 +1,162 @@
+"""
+Background prefetching of category best products.
+
+Keeps the client's category cache warm for every category in CATEGORY_MAP,
+so get_best_products_by_category tool calls are answered locally.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Iterable, Optional
+
+from src.coupang_client import CoupangClient
+from src.utils import rate_limit
+from src.utils.categories import CATEGORY_MAP
+
+logger = logging.getLogger(__name__)
+
+
+class CategoryRefresher:
+    """
+    Periodically refetches best products for a fixed set of categories.
+
+    Each cycle fetches every category once at `limit` and stores the result
+    in the client's category cache with a lifetime covering the next cycle.
+    Calls are spaced so the refresher uses at most `budget_share` of the
+    bestcategories rate limit, and a call is only made once the limiter has a
+    free slot, so tool calls never queue behind prefetching.
+    """
+
+    def __init__(
+        self,
+        client: CoupangClient,
+        interval: float = 600.0,
+        budget_share: float = 0.2,
+        rate_per_minute: float = 50.0,
+        limit: int = 100,
+        category_ids: Optional[Iterable[str]] = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ):
+        """
+        Initialize refresher.
+
+        Args:
+            client: Client whose category cache is kept warm
+            interval: Seconds between the starts of two refresh cycles
+            budget_share: Fraction of the bestcategories rate limit the refresher may use (0-1]
+            rate_per_minute: The bestcategories rate limit in calls per minute (0 = unlimited)
+            limit: Products fetched per category (1-100)
+            category_ids: Categories to refresh (all of CATEGORY_MAP if not provided)
+            sleep: Async sleep function (overridable for tests)
+        """
+        if not 0 < budget_share <= 1:
+            raise ValueError("budget_share must be in (0, 1]")
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+
+        self.client = client
+        self.interval = interval
+        self.limit = limit
+        self.category_ids = list(category_ids) if category_ids is not None else list(CATEGORY_MAP)
+        self._sleep = sleep
+
+        # Minimum seconds between refresh calls to stay within the budget share
+        self.spacing = 60.0 / (rate_per_minute * budget_share) if rate_per_minute > 0 else 0.0
+
+        # Cached lists must outlive a full cycle plus the time to fetch them again
+        cycle_time = self.spacing * len(self.category_ids)
+        self.ttl = max(client.category_cache.ttl, interval + cycle_time)
+
+        self._task: Optional[asyncio.Task] = None
+
+        self.cycles = 0
+        self.refreshed = 0
+        self.failed = 0
+        self.last_cycle_seconds = 0.0
+
+    async def refresh_all(self) -> int:
+        """
+        Run one refresh cycle over all categories.
+
+        Returns:
+            Number of categories refreshed successfully
+        """
+        started = time.monotonic()
+        refreshed = 0
+
+        for i, category_id in enumerate(self.category_ids):
+            if i and self.spacing:
+                await self._sleep(self.spacing)
+
+            # Let tool calls have the slots while the budget is in use
+            wait = self.client.time_until_available(rate_limit.BESTCATEGORIES)
+            while wait > 0:
+                await self._sleep(wait)
+                wait = self.client.time_until_available(rate_limit.BESTCATEGORIES)
+
+            try:
+                await self.client.refresh_category_best(category_id, limit=self.limit, ttl=self.ttl)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.warning(f"Failed to refresh best products for category {category_id}: {e}")
+                continue
+
+            refreshed += 1
+            self.refreshed += 1
+
+        self.cycles += 1
+        self.last_cycle_seconds = time.monotonic() - started
+        logger.info(
+            f"Refreshed best products for {refreshed}/{len(self.category_ids)} categories "
+            f"in {self.last_cycle_seconds:.1f}s"
+        )
+        return refreshed
+
+    async def run(self) -> None:
+        """Refresh all categories every `interval` seconds until cancelled."""
+        while True:
+            started = time.monotonic()
+            await self.refresh_all()
+            await self._sleep(max(self.interval - (time.monotonic() - started), 0.0))
+
+    def start(self) -> None:
+        """Start refreshing in a background task (no-op if already running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Stop the background task and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background task is active."""
+        return self._task is not None and not self._task.done()
+
+    def stats(self) -> dict:
+        """
+        Get refresher statistics.
+
+        Returns:
+            Dictionary with state, schedule and counters
+        """
+        return {
+            "running": self.running,
+            "categories": len(self.category_ids),
+            "interval": self.interval,
+            "spacing": round(self.spacing, 3),
+            "cycles": self.cycles,
+            "refreshed": self.refreshed,
+            "failed": self.failed,
+            "last_cycle_seconds": round(self.last_cycle_seconds, 3),
+        }
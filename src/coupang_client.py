@@ -4,20 +4,120 @@ Coupang API client implementation.
 Provides async methods for interacting with Coupang's affiliate API.
 """
 
+import asyncio
+import contextvars
+import json
+import logging
+import time
 import aiohttp
-from typing import List, Optional
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, Union
 from urllib.parse import urlencode
 
 from src.utils.config import config
 from src.utils.auth import CoupangAuth
-from src.models.product import Product, ProductSearchResponse, DeepLink
+from src.utils.cache import TTLCache
+from src.utils.disk_cache import DiskCache
+from src.utils.deeplink_store import DeepLinkStore, canonicalize_url
+from src.utils.coalesce import RequestCoalescer, make_request_key
+from src.utils.batcher import MicroBatcher
+from src.utils import rate_limit
+from src.utils.rate_limit import AnyRateLimiter, RateLimitTimeout, create_rate_limiter, endpoint_family
+from src.utils.retry import RetryPolicy, parse_retry_after
+from src.utils.metrics import LatencyStats
+from src.utils import deadline
+from src.utils.circuit_breaker import CircuitBreaker, OPEN
+from src.utils.json_codec import get_decoder
+from src.models.product import (
+    Product, ProductSearchResponse, DeepLink, DeepLinkBatchResult, parse_deeplinks, parse_products,
+    parse_products_json
+)
+from src.models.record import ProductRecord, parse_product_records
+from src.models.batch import ProductBatch
+
+logger = logging.getLogger(__name__)
+
+
+# Product list parsers by return format
+PRODUCT_PARSERS: Dict[str, Callable[[Any], list]] = {
+    "models": parse_products,
+    "records": parse_product_records,
+    "batch": ProductBatch.from_api,
+}
+
+# Product list type, depending on the client's product format
+ProductList = Union[List[Product], List[ProductRecord], ProductBatch]
 
 
 class CoupangAPIError(Exception):
     """Base exception for Coupang API errors."""
+
+    def __init__(
+        self,
+        message: str,
+        status: Optional[int] = None,
+        retry_after: Optional[float] = None
+    ):
+        """
+        Initialize error.
+
+        Args:
+            message: Error description
+            status: HTTP status code, or None for network and parsing errors
+            retry_after: Server-requested retry delay in seconds, if any
+        """
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class CoupangRateLimitError(CoupangAPIError):
+    """Raised when a request cannot get a rate-limit slot in time."""
+
+    def __init__(self, message: str, family: str, retry_after: float):
+        super().__init__(message, retry_after=retry_after)
+        self.family = family
+
+
+class CoupangTimeoutError(CoupangAPIError):
+    """Raised when a request cannot complete within the caller's deadline."""
     pass
 
 
+class CoupangCircuitOpenError(CoupangAPIError):
+    """Raised when requests to a failing endpoint family are short-circuited."""
+
+    def __init__(self, message: str, family: str, retry_after: float):
+        super().__init__(message, retry_after=retry_after)
+        self.family = family
+
+
+def _is_upstream_failure(status: Optional[int]) -> bool:
+    """Whether a failed attempt indicates a degraded gateway (network error or 5xx)."""
+    return status is None or status >= 500
+
+
+def _normalize_keyword(keyword: str) -> str:
+    """Normalize a search keyword for use as a cache key."""
+    return " ".join(keyword.split()).lower()
+
+
+def _raw_body(body: bytes) -> bytes:
+    """Response "decoder" returning the body bytes unchanged."""
+    return body
+
+
+def _covers_limit(entry: tuple, limit: int) -> bool:
+    """
+    Check whether a cached (fetched limit, products) entry can answer a limit.
+
+    An entry covers any limit up to the one it was fetched with, and any limit
+    at all if the API returned fewer products than requested.
+    """
+    fetched_limit, products = entry
+    return fetched_limit >= limit or len(products) < fetched_limit
+
+
 class CoupangClient:
     """
     Async client for Coupang Affiliate API.
@@ -29,7 +129,19 @@ class CoupangClient:
         self,
         access_key: Optional[str] = None,
         secret_key: Optional[str] = None,
-        partner_id: Optional[str] = None
+        partner_id: Optional[str] = None,
+        search_cache_ttl: Optional[float] = None,
+        search_cache_max_entries: Optional[int] = None,
+        search_overfetch: Optional[bool] = None,
+        rate_limiter: Optional[AnyRateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeouts: Optional[Dict[str, aiohttp.ClientTimeout]] = None,
+        json_decoder: Optional[str] = None,
+        product_format: Optional[str] = None,
+        typed_decode: Optional[bool] = None,
+        disk_cache: Optional[DiskCache] = None,
+        cache_swr_window: Optional[float] = None,
+        deeplink_store: Optional[DeepLinkStore] = None
     ):
         """
         Initialize Coupang API client.
@@ -38,6 +150,18 @@ class CoupangClient:
             access_key: Coupang API access key (uses config if not provided)
             secret_key: Coupang API secret key (uses config if not provided)
             partner_id: Coupang partner ID (uses config if not provided)
+            search_cache_ttl: Search result cache TTL in seconds, 0 disables (uses config if not provided)
+            search_cache_max_entries: Maximum cached searches (uses config if not provided)
+            search_overfetch: Fetch limit=100 on a cache miss so smaller limits hit the cache (uses config if not provided)
+            rate_limiter: Rate limiter shared by requests (built from config if not provided)
+            retry_policy: Retry policy for transient failures (built from config if not provided)
+            timeouts: Per-endpoint-family HTTP timeouts, with "default" as fallback (built from config if not provided)
+            json_decoder: Response JSON decoder: "auto", "orjson", "msgspec" or "json" (uses config if not provided)
+            product_format: Product list type: "models" (Product), "records" (compact ProductRecord) or "batch" (columnar ProductBatch) (uses config if not provided)
+            typed_decode: Validate search/category response bytes straight into Products, "models" format only (uses config if not provided)
+            disk_cache: Persistent response cache for GET requests (built from config if not provided and COUPANG_DISK_CACHE_PATH is set)
+            cache_swr_window: Seconds past expiry cached search/category results are served while refreshed, 0 disables (uses config if not provided)
+            deeplink_store: Persistent memo of created deeplinks (built from config if not provided and COUPANG_DEEPLINK_STORE_PATH is set)
         """
         self.access_key = access_key or config.access_key
         self.secret_key = secret_key or config.secret_key
@@ -50,9 +174,115 @@ class CoupangClient:
         self.auth = CoupangAuth(self.access_key, self.secret_key)
         self.session: Optional[aiohttp.ClientSession] = None
 
+        # Search results keyed on normalized keyword, stored as (fetched limit, products);
+        # expired entries are kept for a while to serve while refreshing or while the API circuit is open
+        self.swr_window = config.cache_swr_window if cache_swr_window is None else cache_swr_window
+        self.search_cache = TTLCache(
+            ttl=config.search_cache_ttl if search_cache_ttl is None else search_cache_ttl,
+            max_entries=search_cache_max_entries or config.search_cache_max_entries,
+            stale_ttl=max(config.search_cache_stale_ttl, self.swr_window)
+        )
+        self.search_overfetch = config.search_overfetch if search_overfetch is None else search_overfetch
+
+        # Category best products keyed on category ID, stored like searches
+        self.category_cache = TTLCache(
+            ttl=config.category_cache_ttl,
+            max_entries=config.category_cache_max_entries,
+            stale_ttl=max(config.category_cache_stale_ttl, self.swr_window)
+        )
+
+        # Background refreshes of recently expired cache entries, keyed on (family, cache key)
+        self._refreshes: Dict[Hashable, asyncio.Task] = {}
+        self.refreshes_started = 0
+        self.refreshes_skipped = 0
+        self.refreshes_failed = 0
+
+        # Identical concurrent requests share one upstream call
+        self.coalescer = RequestCoalescer()
+
+        # Per-endpoint call budgets enforced before each upstream call
+        # (shared across local processes when COUPANG_RATE_LIMIT_DB is set)
+        self.rate_limiter = rate_limiter or create_rate_limiter(
+            {
+                rate_limit.SEARCH: config.rate_limit_search,
+                rate_limit.BESTCATEGORIES: config.rate_limit_bestcategories,
+                rate_limit.PRODUCT: config.rate_limit_product,
+                rate_limit.DEEPLINK: config.rate_limit_deeplink,
+            },
+            max_queue_wait=config.rate_limit_max_wait,
+            db_path=config.rate_limit_db
+        )
+
+        # Retries for throttled and transient failures, with per-attempt latency per family
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_attempts=config.retry_max_attempts,
+            base_delay=config.retry_base_delay,
+            max_delay=config.retry_max_delay,
+            retry_non_idempotent=config.retry_post
+        )
+        self.attempt_latency: Dict[str, LatencyStats] = {}
+        self.retries = 0
+
+        # Time spent validating response payloads into models, per endpoint family
+        self.parse_latency: Dict[str, LatencyStats] = {}
+
+        # Connect/read/total timeouts per endpoint family
+        self.timeouts = timeouts or self._default_timeouts()
+
+        # Circuit breakers per endpoint family, created on first use
+        self.circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+        # Response bodies are read as bytes and decoded with the fastest available decoder
+        self.json_decoder = get_decoder(json_decoder or config.json_decoder)
+
+        # Search and category results as pydantic models, compact records or a columnar batch (also what gets cached)
+        self.product_format = product_format or config.product_format
+        if self.product_format not in PRODUCT_PARSERS:
+            raise ValueError(
+                f"Unknown product format: {self.product_format}. Choose from: {', '.join(PRODUCT_PARSERS)}"
+            )
+        self._parse_product_list = PRODUCT_PARSERS[self.product_format]
+
+        # Search and category bodies validated from bytes in one pydantic-core pass, skipping the dict stage
+        self.typed_decode = config.typed_decode if typed_decode is None else typed_decode
+        if self.typed_decode and self.product_format != "models":
+            raise ValueError(
+                f"Typed decode returns Product models and cannot be used with the {self.product_format} format"
+            )
+
+        # Raw GET responses persisted across restarts and shared by local processes,
+        # checked after the in-memory caches and before the network
+        self.disk_cache = disk_cache
+        if self.disk_cache is None and config.disk_cache_path:
+            self.disk_cache = DiskCache(
+                config.disk_cache_path,
+                {
+                    rate_limit.SEARCH: config.disk_cache_ttl_search,
+                    rate_limit.BESTCATEGORIES: config.disk_cache_ttl_bestcategories,
+                    rate_limit.PRODUCT: config.disk_cache_ttl_product,
+                },
+                max_bytes=int(config.disk_cache_max_mb * 1024 * 1024)
+            )
+
+        # Created deeplinks keyed on (canonical URL, sub ID), so only unseen URLs are sent upstream
+        self.deeplink_store = deeplink_store
+        if self.deeplink_store is None and config.deeplink_store_path:
+            self.deeplink_store = DeepLinkStore(config.deeplink_store_path, ttl=config.deeplink_store_ttl)
+
+        # Deeplink batches are split into API-sized chunks sent concurrently
+        self.deeplink_chunk_size = max(config.deeplink_chunk_size, 1)
+        self.deeplink_concurrency = max(config.deeplink_max_concurrency, 1)
+
+        # Concurrent deeplink calls with the same sub ID arriving within the window share one conversion
+        self.deeplink_batcher = MicroBatcher(
+            self._convert_deeplink_batch,
+            max_wait=config.deeplink_batch_window_ms / 1000,
+            max_batch_size=config.deeplink_batch_max_urls
+        )
+
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
+        await self._ensure_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -60,13 +290,125 @@ class CoupangClient:
         if self.session:
             await self.session.close()
 
+    def _create_session(self) -> aiohttp.ClientSession:
+        """
+        Create an HTTP session with a tuned connection pool.
+
+        Keep-alive pooling, DNS caching and happy eyeballs avoid paying
+        DNS + TCP + TLS setup on every request to the API gateway.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=config.http_pool_limit,
+            limit_per_host=config.http_pool_limit_per_host,
+            keepalive_timeout=config.http_keepalive_timeout,
+            ttl_dns_cache=config.http_dns_cache_ttl,
+            happy_eyeballs_delay=config.http_happy_eyeballs_delay
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    @staticmethod
+    def _default_timeouts() -> Dict[str, aiohttp.ClientTimeout]:
+        """Build per-endpoint-family HTTP timeouts from config."""
+        totals = {
+            rate_limit.DEFAULT: config.http_total_timeout,
+            rate_limit.SEARCH: config.http_timeout_search,
+            rate_limit.BESTCATEGORIES: config.http_timeout_bestcategories,
+            rate_limit.PRODUCT: config.http_timeout_product,
+            rate_limit.DEEPLINK: config.http_timeout_deeplink,
+        }
+        return {
+            family: aiohttp.ClientTimeout(
+                total=total or config.http_total_timeout,
+                connect=config.http_connect_timeout,
+                sock_read=config.http_read_timeout
+            )
+            for family, total in totals.items()
+        }
+
+    def _attempt_timeout(self, family: str) -> aiohttp.ClientTimeout:
+        """
+        Get the HTTP timeout for one attempt, bounded by the current deadline.
+
+        Raises:
+            CoupangTimeoutError: If the deadline has already passed
+        """
+        timeout = self.timeouts.get(family) or self.timeouts[rate_limit.DEFAULT]
+        time_left = deadline.remaining()
+        if time_left is None:
+            return timeout
+        if time_left <= 0:
+            raise CoupangTimeoutError("Request deadline exceeded")
+        if timeout.total is None or time_left < timeout.total:
+            return aiohttp.ClientTimeout(
+                total=time_left,
+                connect=timeout.connect,
+                sock_read=timeout.sock_read
+            )
+        return timeout
+
     async def _ensure_session(self):
         """Ensure aiohttp session exists."""
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            self.session = self._create_session()
+
+    async def warm_up(self, connections: Optional[int] = None) -> int:
+        """
+        Pre-open keep-alive connections to the API gateway.
+
+        Sends concurrent unauthenticated HEAD requests so DNS resolution and
+        TCP/TLS handshakes happen before the first real API call. Failures are
+        ignored; warm-up is best effort.
+
+        Args:
+            connections: Number of connections to open (uses config if not provided)
+
+        Returns:
+            Number of connections successfully opened
+        """
+        count = config.http_warmup_connections if connections is None else connections
+        if count <= 0:
+            return 0
+
+        await self._ensure_session()
+        timeout = aiohttp.ClientTimeout(total=10)
+
+        async def open_connection() -> bool:
+            try:
+                async with self.session.head(self.base_url, timeout=timeout) as response:
+                    await response.read()
+                return True
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                return False
+
+        results = await asyncio.gather(*[open_connection() for _ in range(count)])
+        return sum(results)
+
+    def pool_stats(self) -> dict:
+        """
+        Get connection pool statistics.
+
+        Returns:
+            Dictionary with pool limits and acquired/idle connection counts
+        """
+        connector = self.session.connector if self.session else None
+        if connector is None or connector.closed:
+            return {"open": False}
+
+        idle_connections = getattr(connector, "_conns", {})
+        return {
+            "open": True,
+            "limit": connector.limit,
+            "limit_per_host": connector.limit_per_host,
+            "acquired": len(getattr(connector, "_acquired", ())),
+            "idle": sum(len(conns) for conns in idle_connections.values()),
+        }
 
     async def close(self):
-        """Close the HTTP session."""
+        """Close the HTTP session, cancelling background refreshes."""
+        for task in list(self._refreshes.values()):
+            task.cancel()
+        self._refreshes.clear()
+
         if self.session:
             await self.session.close()
             self.session = None
@@ -76,28 +418,280 @@ class CoupangClient:
         method: str,
         path: str,
         params: Optional[dict] = None,
-        json_body: Optional[dict] = None
-    ) -> dict:
+        json_body: Optional[dict] = None,
+        revalidate: bool = False,
+        decode: Optional[Callable[[bytes], Any]] = None
+    ) -> Any:
         """
         Make authenticated request to Coupang API.
 
+        Concurrent identical requests (same method, path, query and body) are
+        coalesced into a single upstream call whose parsed result is shared.
+        GET responses are served from and stored in the disk cache when one is
+        configured for the endpoint family.
+        If a deadline is set (see src.utils.deadline), the caller stops waiting
+        once it passes, even when joined to another caller's request.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             path: API endpoint path
             params: Query parameters
             json_body: JSON request body for POST requests
+            revalidate: Skip the disk cache read and fetch upstream (the fresh
+                response is still stored); used by background refreshes
+            decode: Decode the response body with this instead of the JSON
+                decoder (e.g. straight into models); cached on disk as raw bytes
 
         Returns:
-            JSON response as dictionary
+            JSON response as dictionary, or what `decode` returns
 
         Raises:
+            CoupangTimeoutError: If the deadline passes before a response
             CoupangAPIError: If request fails
         """
-        await self._ensure_session()
-
         # Build query string
         query = urlencode(params) if params else ""
 
+        key = make_request_key(method, path, query, json_body)
+        family = endpoint_family(path)
+        if method == "GET" and self.disk_cache is not None and self.disk_cache.enabled_for(family):
+            factory = partial(self._fetch_through_disk_cache, family, path, query, revalidate, decode)
+            if revalidate:
+                # Must not join a request that may be answered from disk
+                key = ("revalidate", *key)
+        else:
+            factory = partial(self._send_request, method, path, query, json_body, decode)
+        if decode is not None:
+            # Callers joining this request must get the same result type
+            key = ("decoded", *key)
+        shared = self.coalescer.run(key, factory)
+
+        time_left = deadline.remaining()
+        if time_left is None:
+            return await shared
+        try:
+            return await asyncio.wait_for(shared, timeout=max(time_left, 0))
+        except asyncio.TimeoutError:
+            raise CoupangTimeoutError(f"Request deadline exceeded waiting for {path}")
+
+    async def _fetch_through_disk_cache(
+        self,
+        family: str,
+        path: str,
+        query: str,
+        revalidate: bool = False,
+        decode: Optional[Callable[[bytes], Any]] = None
+    ) -> Any:
+        """
+        Get a GET response from the disk cache, or from the API and store it.
+
+        Args:
+            family: Endpoint family of the path
+            path: API endpoint path
+            query: URL query string (without leading '?')
+            revalidate: Fetch from the API even if the disk cache has the response
+            decode: Body decoder used instead of the JSON decoder
+
+        Returns:
+            JSON response as dictionary, or what `decode` returns
+        """
+        # Responses carry partner-specific affiliate URLs, so keys are per partner
+        cache_key = f"{self.partner_id}:GET {path}?{query}"
+
+        payload = None if revalidate else await self.disk_cache.get(family, cache_key)
+        if payload is not None:
+            try:
+                return (decode or self.json_decoder)(payload)
+            except Exception as e:
+                logger.warning(f"Ignoring undecodable disk cache entry for {path}: {e}")
+
+        if decode is not None:
+            # Keep the body bytes to store them as is
+            payload = await self._send_request("GET", path, query, decode=_raw_body)
+            try:
+                response_data = decode(payload)
+            except Exception as e:
+                raise CoupangAPIError(f"Failed to decode JSON response: {str(e)}", status=200)
+            await self.disk_cache.set(family, cache_key, payload)
+            return response_data
+
+        response_data = await self._send_request("GET", path, query)
+        payload = json.dumps(response_data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        await self.disk_cache.set(family, cache_key, payload)
+        return response_data
+
+    async def _send_request(
+        self,
+        method: str,
+        path: str,
+        query: str,
+        json_body: Optional[dict] = None,
+        decode: Optional[Callable[[bytes], Any]] = None
+    ) -> Any:
+        """
+        Send an authenticated request, retrying transient failures.
+
+        Each attempt takes its own rate-limit slot. Non-idempotent requests
+        (POST) are only retried if the retry policy opts in. Rate-limit waits,
+        backoff delays and HTTP timeouts never exceed the current deadline.
+        Attempts go through the endpoint family's circuit breaker, which fails
+        fast while the gateway is degraded.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API endpoint path
+            query: URL query string (without leading '?')
+            json_body: JSON request body for POST requests
+            decode: Body decoder used instead of the JSON decoder
+
+        Returns:
+            JSON response as dictionary, or what `decode` returns
+
+        Raises:
+            CoupangCircuitOpenError: If the endpoint family's circuit is open
+            CoupangRateLimitError: If no rate-limit slot is available in time
+            CoupangTimeoutError: If the deadline leaves no time for another attempt
+            CoupangAPIError: If the last attempt fails
+        """
+        family = endpoint_family(path)
+        latency = self.attempt_latency.setdefault(family, LatencyStats())
+        breaker = self._circuit_breaker(family)
+        retryable = self.retry_policy.allows_method(method)
+        attempt = 0
+
+        while True:
+            attempt += 1
+
+            # Fail fast before spending a rate-limit slot on an open circuit
+            if breaker.state == OPEN:
+                self._raise_circuit_open(family, breaker)
+
+            await self._acquire_slot(family)
+
+            if not breaker.allow_request():
+                self._raise_circuit_open(family, breaker)
+
+            started = time.perf_counter()
+            try:
+                result = await self._send_once(method, path, query, json_body, decode)
+            except CoupangTimeoutError:
+                breaker.release()
+                raise
+            except CoupangAPIError as e:
+                latency.record(time.perf_counter() - started, ok=False)
+                if _is_upstream_failure(e.status):
+                    breaker.record_failure()
+                elif e.status == 429:
+                    breaker.release()
+                else:
+                    breaker.record_success()
+
+                if not retryable or not self.retry_policy.should_retry(attempt, e.status):
+                    raise
+
+                delay = self.retry_policy.delay(attempt, e.retry_after)
+                time_left = deadline.remaining()
+                if time_left is not None and delay >= time_left:
+                    raise CoupangTimeoutError(
+                        f"Request deadline exceeded after {attempt} attempt(s): {e}",
+                        status=e.status
+                    )
+
+                self.retries += 1
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                breaker.release()
+                raise
+
+            breaker.record_success()
+            latency.record(time.perf_counter() - started)
+            return result
+
+    async def _acquire_slot(self, family: str) -> None:
+        """
+        Wait for a rate-limit slot, never longer than the caller has left.
+
+        Raises:
+            CoupangTimeoutError: If the deadline passes before a slot is free
+            CoupangRateLimitError: If the wait would exceed the queue limit
+        """
+        max_wait = self.rate_limiter.max_queue_wait
+        time_left = deadline.remaining()
+        bounded_by_deadline = time_left is not None and (max_wait is None or time_left < max_wait)
+        if bounded_by_deadline:
+            max_wait = max(time_left, 0)
+
+        try:
+            await self.rate_limiter.acquire(family, max_wait)
+        except RateLimitTimeout as e:
+            if bounded_by_deadline:
+                raise CoupangTimeoutError(
+                    f"Request deadline exceeded waiting for a '{e.family}' rate-limit slot"
+                )
+            raise CoupangRateLimitError(str(e), e.family, e.wait)
+
+    def _circuit_breaker(self, family: str) -> CircuitBreaker:
+        """Get or create the circuit breaker for an endpoint family."""
+        breaker = self.circuit_breakers.get(family)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                failure_threshold=config.circuit_failure_threshold,
+                recovery_timeout=config.circuit_recovery_timeout
+            )
+            self.circuit_breakers[family] = breaker
+        return breaker
+
+    @staticmethod
+    def _raise_circuit_open(family: str, breaker: CircuitBreaker) -> None:
+        """Raise the error for a short-circuited request."""
+        retry_in = breaker.time_until_probe()
+        raise CoupangCircuitOpenError(
+            f"Coupang API '{family}' endpoint is failing; requests paused for {retry_in:.1f}s",
+            family,
+            retry_in
+        )
+
+    def circuit_state(self, family: str) -> str:
+        """
+        Get the circuit breaker state of an endpoint family.
+
+        Args:
+            family: Endpoint family ("search", "bestcategories", "product", "deeplink")
+
+        Returns:
+            "closed", "open" or "half_open"
+        """
+        return self._circuit_breaker(family).state
+
+    async def _send_once(
+        self,
+        method: str,
+        path: str,
+        query: str,
+        json_body: Optional[dict] = None,
+        decode: Optional[Callable[[bytes], Any]] = None
+    ) -> Any:
+        """
+        Send a single authenticated HTTP request.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API endpoint path
+            query: URL query string (without leading '?')
+            json_body: JSON request body for POST requests
+            decode: Body decoder used instead of the JSON decoder
+
+        Returns:
+            JSON response as dictionary, or what `decode` returns
+
+        Raises:
+            CoupangTimeoutError: If the deadline has already passed
+            CoupangAPIError: If request fails or times out
+        """
+        timeout = self._attempt_timeout(endpoint_family(path))
+        await self._ensure_session()
+
         # Generate authentication headers
         headers = self.auth.generate_headers(method, path, query)
 
@@ -113,34 +707,53 @@ class CoupangClient:
         # Make request
         try:
             async with self.session.request(
-                method, url, headers=headers, json=json_body
+                method, url, headers=headers, json=json_body, timeout=timeout
             ) as response:
                 if response.status != 200:
                     error_text = await response.text()
+                    retry_after = None
+                    if response.status in self.retry_policy.retry_statuses:
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
                     raise CoupangAPIError(
-                        f"API request failed with status {response.status}: {error_text}"
+                        f"API request failed with status {response.status}: {error_text}",
+                        status=response.status,
+                        retry_after=retry_after
                     )
 
-                return await response.json()
+                body = await response.read()
 
         except aiohttp.ClientError as e:
             raise CoupangAPIError(f"HTTP request failed: {str(e)}")
+        except asyncio.TimeoutError:
+            raise CoupangAPIError(f"HTTP request timed out after {timeout.total}s")
+
+        # Decode raw bytes after the connection is back in the pool
+        try:
+            return (decode or self.json_decoder)(body)
+        except Exception as e:
+            raise CoupangAPIError(f"Failed to decode JSON response: {str(e)}", status=200)
 
     async def search_products(
         self,
         keyword: str,
         limit: int = 10
-    ) -> List[Product]:
+    ) -> ProductList:
         """
         Search for products by keyword.
         검색 키워드에 대한 쿠팡 검색 결과와 상세 상품 정보를 생성합니다 (1 분당 최대 50번 호출 가능합니다.)
 
+        Results are cached in memory per keyword, so repeated searches are served
+        locally and do not count against the search rate limit. A cached result
+        fetched with a larger limit also answers smaller limits by slicing.
+        Recently expired results are served immediately while a background
+        task refreshes them (stale-while-revalidate).
+
         Args:
             keyword: Search query keyword
             limit: Maximum number of results (1-100, default: 10)
 
         Returns:
-            List of Product objects
+            List of Product objects (ProductRecords or a ProductBatch with the records/batch product format)
 
         Raises:
             CoupangAPIError: If search fails
@@ -155,17 +768,94 @@ class CoupangClient:
         if not 1 <= limit <= 100:
             raise ValueError("Limit must be between 1 and 100")
 
+        # Optionally fetch the full page so later limit variations are cache hits
+        fetch_limit = 100 if self.search_overfetch and self.search_cache.enabled else limit
+
+        cache_key = _normalize_keyword(keyword)
+        return await self._cached_product_list(
+            self.search_cache,
+            rate_limit.SEARCH,
+            cache_key,
+            limit,
+            fetch_limit,
+            partial(self._fetch_search, keyword, cache_key)
+        )
+
+    async def search_products_batch(
+        self,
+        keywords: List[str],
+        limit: int = 10
+    ) -> Dict[str, Union[ProductList, CoupangAPIError]]:
+        """
+        Search for several keywords concurrently.
+        여러 키워드를 동시에 검색합니다.
+
+        Keywords with the same normalized form (case and whitespace) are
+        searched once, and each distinct keyword goes through search_products,
+        so cached keywords are answered locally and uncached searches wait for
+        their own rate-limit slot. A failing keyword does not fail the others.
+
+        Args:
+            keywords: Search query keywords
+            limit: Maximum number of results per keyword (1-100, default: 10)
+
+        Returns:
+            Mapping of keyword (in input order, duplicates removed) to its product list,
+            or to the CoupangAPIError raised for it; variants of one keyword map to the same result
+
+        Raises:
+            ValueError: If limit is out of range
+
+        Example:
+            >>> results = await client.search_products_batch(["노트북", "마우스"], limit=3)
+            >>> for keyword, products in results.items():
+            ...     print(keyword, len(products))
+        """
+        if not 1 <= limit <= 100:
+            raise ValueError("Limit must be between 1 and 100")
+
+        # Normalized keyword -> first spelling given, which is the one searched
+        searched: Dict[str, str] = {}
+        for keyword in keywords:
+            searched.setdefault(_normalize_keyword(keyword), keyword)
+
+        outcomes = await asyncio.gather(
+            *(self.search_products(keyword, limit) for keyword in searched.values()),
+            return_exceptions=True
+        )
+        by_normalized = dict(zip(searched, outcomes))
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException) and not isinstance(outcome, CoupangAPIError):
+                raise outcome
+
+        return {keyword: by_normalized[_normalize_keyword(keyword)] for keyword in keywords}
+
+    async def _fetch_search(
+        self,
+        keyword: str,
+        cache_key: str,
+        fetch_limit: int,
+        revalidate: bool = False
+    ) -> ProductList:
+        """Fetch a search result page from the API and cache it (revalidate: bypass the disk cache)."""
         # API endpoint for product search
         path = "/v2/providers/affiliate_open_api/apis/openapi/products/search"
 
         # Query parameters
         params = {
             "keyword": keyword,
-            "limit": limit
+            "limit": fetch_limit
         }
 
+        if self.typed_decode:
+            products = await self._make_request(
+                "GET", path, params, revalidate=revalidate, decode=self._typed_decoder(rate_limit.SEARCH)
+            )
+            self.search_cache.set(cache_key, (fetch_limit, products))
+            return products
+
         # Make request
-        response_data = await self._make_request("GET", path, params)
+        response_data = await self._make_request("GET", path, params, revalidate=revalidate)
 
         # Parse response
         try:
@@ -179,22 +869,15 @@ class CoupangClient:
             else:
                 products_data = []
 
-            # Convert to Product objects
-            products = []
-            for item in products_data:
-                try:
-                    product = Product(**item)
-                    products.append(product)
-                except Exception as e:
-                    # Skip invalid products but log the error
-                    print(f"Warning: Failed to parse product: {e}")
-                    continue
-
-            return products
+            # Convert to Product objects or records (invalid items are skipped and logged)
+            products = self._timed_parse(rate_limit.SEARCH, self._parse_product_list, products_data)
 
         except Exception as e:
             raise CoupangAPIError(f"Failed to parse search response: {str(e)}")
 
+        self.search_cache.set(cache_key, (fetch_limit, products))
+        return products
+
     async def get_product_details(self, product_id: str) -> Optional[Product]:
         """
         Get detailed information for a specific product.
@@ -237,17 +920,20 @@ class CoupangClient:
         self,
         category_id: str,
         limit: int = 20
-    ) -> List[Product]:
+    ) -> ProductList:
         """
         Get best products by category.
         카테고리 별 베스트 상품에 대한 상세 상품 정보를 생성합니다.
 
+        Results are cached in memory per category like search results,
+        including slicing of larger cached results and stale-while-revalidate.
+
         Args:
             category_id: Coupang category ID (예: "1001")
             limit: Maximum number of results (1-100, default: 20)
 
         Returns:
-            List of Product objects
+            List of Product objects (ProductRecords or a ProductBatch with the records/batch product format)
 
         Raises:
             CoupangAPIError: If request fails
@@ -262,16 +948,70 @@ class CoupangClient:
         if not 1 <= limit <= 100:
             raise ValueError("Limit must be between 1 and 100")
 
+        cache_key = str(category_id)
+        return await self._cached_product_list(
+            self.category_cache,
+            rate_limit.BESTCATEGORIES,
+            cache_key,
+            limit,
+            limit,
+            partial(self._fetch_category_best, category_id, cache_key)
+        )
+
+    async def refresh_category_best(
+        self,
+        category_id: str,
+        limit: int = 100,
+        ttl: Optional[float] = None
+    ) -> ProductList:
+        """
+        Fetch a category's best products and store them in the category cache.
+
+        Unlike get_best_products_by_category, any cached entry (in memory or
+        on disk) is ignored and the API is always called, so this is meant for
+        prefetching (see CategoryRefresher). The disk cache gets the fresh response.
+
+        Args:
+            category_id: Coupang category ID (예: "1001")
+            limit: Number of products to fetch (1-100, default: 100)
+            ttl: Cache lifetime in seconds (uses the category cache TTL if not provided)
+
+        Returns:
+            Fetched products
+
+        Raises:
+            CoupangAPIError: If request fails
+        """
+        if not 1 <= limit <= 100:
+            raise ValueError("Limit must be between 1 and 100")
+        return await self._fetch_category_best(category_id, str(category_id), limit, ttl=ttl, revalidate=True)
+
+    async def _fetch_category_best(
+        self,
+        category_id: str,
+        cache_key: str,
+        fetch_limit: int,
+        ttl: Optional[float] = None,
+        revalidate: bool = False
+    ) -> ProductList:
+        """Fetch a category's best products from the API and cache them (revalidate: bypass the disk cache)."""
         # API endpoint for category best products
         path = f"/v2/providers/affiliate_open_api/apis/openapi/products/bestcategories/{category_id}"
 
         # Query parameters
         params = {
-            "limit": limit
+            "limit": fetch_limit
         }
 
+        if self.typed_decode:
+            products = await self._make_request(
+                "GET", path, params, revalidate=revalidate, decode=self._typed_decoder(rate_limit.BESTCATEGORIES)
+            )
+            self.category_cache.set(cache_key, (fetch_limit, products), ttl=ttl)
+            return products
+
         # Make request
-        response_data = await self._make_request("GET", path, params)
+        response_data = await self._make_request("GET", path, params, revalidate=revalidate)
 
         # Parse response
         try:
@@ -282,22 +1022,102 @@ class CoupangClient:
             else:
                 products_data = []
 
-            # Convert to Product objects
-            products = []
-            for item in products_data:
-                try:
-                    product = Product(**item)
-                    products.append(product)
-                except Exception as e:
-                    # Skip invalid products but log the error
-                    print(f"Warning: Failed to parse product: {e}")
-                    continue
-
-            return products
+            # Convert to Product objects or records (invalid items are skipped and logged)
+            products = self._timed_parse(rate_limit.BESTCATEGORIES, self._parse_product_list, products_data)
 
         except Exception as e:
             raise CoupangAPIError(f"Failed to parse category best products response: {str(e)}")
 
+        self.category_cache.set(cache_key, (fetch_limit, products), ttl=ttl)
+        return products
+
+    async def _cached_product_list(
+        self,
+        cache: TTLCache,
+        family: str,
+        cache_key: str,
+        limit: int,
+        fetch_limit: int,
+        fetch: Callable[..., Awaitable[ProductList]]
+    ) -> ProductList:
+        """
+        Serve a product list from cache, falling back to the API.
+
+        Fresh entries are returned directly. Entries expired for less than the
+        stale-while-revalidate window are returned too, while a background
+        refresh fetches them from the API (bypassing the disk cache) and
+        replaces them. Otherwise the list is fetched, and an expired
+        entry is served instead if the endpoint's circuit is open.
+
+        Args:
+            cache: Cache holding (fetched limit, products) entries
+            family: Endpoint family of the request
+            cache_key: Cache key of the list
+            limit: Number of products requested
+            fetch_limit: Number of products to fetch on a miss
+            fetch: Coroutine function fetching, caching and returning a list for a fetch limit
+                (and a `revalidate` flag that bypasses the disk cache)
+
+        Returns:
+            Up to `limit` products
+        """
+        accept = lambda entry: _covers_limit(entry, limit)
+
+        cached = cache.get(cache_key, accept=accept)
+        if cached is not None:
+            return cached[1][:limit]
+
+        if self.swr_window > 0:
+            stale = cache.get_stale(cache_key, accept=accept, max_staleness=self.swr_window)
+            if stale is not None:
+                self._schedule_refresh((family, cache_key), family, partial(fetch, stale[0], revalidate=True))
+                return stale[1][:limit]
+
+        # Fetch, falling back to an expired cached result while the circuit is open
+        try:
+            products = await fetch(fetch_limit)
+        except CoupangCircuitOpenError:
+            stale = cache.get_stale(cache_key, accept=accept)
+            if stale is None:
+                raise
+            return stale[1][:limit]
+
+        return products[:limit]
+
+    def _schedule_refresh(
+        self,
+        key: Hashable,
+        family: str,
+        refresh: Callable[[], Awaitable[Any]]
+    ) -> None:
+        """
+        Start a background refresh unless one is running or the family has no free rate-limit slot.
+
+        Refreshes run outside the caller's deadline, since nobody waits for them.
+        """
+        if key in self._refreshes:
+            return
+        if self.time_until_available(family) > 0:
+            self.refreshes_skipped += 1
+            return
+
+        self._refreshes[key] = asyncio.create_task(
+            self._run_refresh(key, refresh), context=contextvars.Context()
+        )
+        self.refreshes_started += 1
+
+    async def _run_refresh(self, key: Hashable, refresh: Callable[[], Awaitable[Any]]) -> None:
+        """Run a background refresh, logging failures."""
+        try:
+            await refresh()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.refreshes_failed += 1
+            logger.warning(f"Background refresh of {key} failed: {e}")
+        finally:
+            self._refreshes.pop(key, None)
+
     async def create_deeplinks(
         self,
         coupang_urls: List[str],
@@ -307,15 +1127,18 @@ class CoupangClient:
         Convert Coupang URLs to tracking deeplinks.
         쿠팡 URL을 회원 트래킹 코드가 포함된 단축 URL로 변환합니다.
 
+        Any number of URLs can be given; see create_deeplinks_batch. URLs that
+        cannot be converted are logged and left out of the result.
+
         Args:
             coupang_urls: List of Coupang product URLs to convert
             sub_id: Optional tracking/sub ID (uses config default if not provided)
 
         Returns:
-            List of DeepLink objects with shortened and landing URLs
+            List of DeepLink objects with shortened and landing URLs, in request order
 
         Raises:
-            CoupangAPIError: If deeplink creation fails
+            CoupangAPIError: If deeplink creation fails for every URL
 
         Example:
             >>> async with CoupangClient() as client:
@@ -324,9 +1147,139 @@ class CoupangClient:
             ...     for link in deeplinks:
             ...         print(f"Short: {link.shorten_url}")
         """
+        result, error = await self._convert_deeplinks(coupang_urls, sub_id)
+        if error is not None and not result.links:
+            raise error
+        if result.errors:
+            logger.warning(f"{len(result.errors)} of {len(coupang_urls)} URL(s) could not be converted to deeplinks")
+        return result.links
+
+    async def create_deeplinks_batch(
+        self,
+        coupang_urls: List[str],
+        sub_id: Optional[str] = None
+    ) -> DeepLinkBatchResult:
+        """
+        Convert any number of Coupang URLs, reporting failures per URL.
+        여러 쿠팡 URL을 나누어 동시에 변환하고, 실패한 URL은 URL별로 알려줍니다.
+
+        URLs are deduplicated after canonicalization (see
+        src.utils.deeplink_store), split into chunks of the API's maximum
+        size and sent concurrently under the rate limiter. A failed chunk only
+        fails its own URLs. With a deeplink store, URLs already converted for
+        the sub ID are answered locally and only unseen URLs are sent.
+
+        Args:
+            coupang_urls: Coupang URLs to convert
+            sub_id: Optional tracking/sub ID (uses config default if not provided)
+
+        Returns:
+            DeepLinkBatchResult with links in request order and errors keyed on URL
+
+        Example:
+            >>> result = await client.create_deeplinks_batch(urls)
+            >>> for url, error in result.errors.items():
+            ...     print(f"{url}: {error}")
+        """
+        result, _ = await self._convert_deeplinks(coupang_urls, sub_id)
+        return result
+
+    async def _convert_deeplinks(
+        self,
+        coupang_urls: List[str],
+        sub_id: Optional[str]
+    ) -> Tuple[DeepLinkBatchResult, Optional[Exception]]:
+        """Convert URLs through the micro-batcher, returning this caller's part of the result."""
         # Use provided sub_id or fall back to config
         effective_sub_id = sub_id or config.sub_id
+        if self.deeplink_batcher.max_wait <= 0:
+            return await self._convert_deeplink_batch(effective_sub_id, coupang_urls)
 
+        merged, error = await self.deeplink_batcher.submit(effective_sub_id, coupang_urls)
+        links = {link.original_url: link for link in merged.links}
+
+        result = DeepLinkBatchResult()
+        for url in coupang_urls:
+            if url in links:
+                result.links.append(links[url])
+            else:
+                result.errors[url] = merged.errors[url]
+        return result, error if result.errors else None
+
+    async def _convert_deeplink_batch(
+        self,
+        effective_sub_id: Optional[str],
+        coupang_urls: List[str]
+    ) -> Tuple[DeepLinkBatchResult, Optional[Exception]]:
+        """Convert URLs, returning the batch result and the first chunk error (if any)."""
+
+        # Resolve previously converted URLs locally
+        canonical_urls = [canonicalize_url(url) for url in coupang_urls]
+        stored: Dict[str, Tuple[str, str]] = {}
+        if self.deeplink_store is not None:
+            stored = await self.deeplink_store.get_many(self.partner_id, effective_sub_id, canonical_urls)
+
+        # Send each unseen canonical URL once, as first given by the caller
+        unseen: Dict[str, str] = {}
+        for url, canonical in zip(coupang_urls, canonical_urls):
+            if canonical not in stored:
+                unseen.setdefault(canonical, url)
+
+        failed: Dict[str, str] = {}
+        first_error: Optional[Exception] = None
+        if unseen:
+            sent = {url: canonical for canonical, url in unseen.items()}
+            urls = list(unseen.values())
+            chunks = [urls[i:i + self.deeplink_chunk_size] for i in range(0, len(urls), self.deeplink_chunk_size)]
+            semaphore = asyncio.Semaphore(self.deeplink_concurrency)
+
+            async def convert(chunk: List[str]) -> List[DeepLink]:
+                async with semaphore:
+                    return await self._request_deeplinks(chunk, effective_sub_id)
+
+            outcomes = await asyncio.gather(*(convert(chunk) for chunk in chunks), return_exceptions=True)
+
+            created = {}
+            for chunk, outcome in zip(chunks, outcomes):
+                if isinstance(outcome, Exception):
+                    first_error = first_error or outcome
+                    for url in chunk:
+                        failed[sent[url]] = str(outcome)
+                    continue
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                for link in outcome:
+                    canonical = sent.get(link.original_url) or canonicalize_url(link.original_url)
+                    created[canonical] = (link.shorten_url, link.landing_url)
+
+            if self.deeplink_store is not None:
+                await self.deeplink_store.set_many(self.partner_id, effective_sub_id, created)
+            stored.update(created)
+
+        # One result per requested URL, in request order
+        result = DeepLinkBatchResult()
+        for url, canonical in zip(coupang_urls, canonical_urls):
+            if canonical in stored:
+                shorten_url, landing_url = stored[canonical]
+                result.links.append(DeepLink(original_url=url, shorten_url=shorten_url, landing_url=landing_url))
+            else:
+                result.errors[url] = failed.get(canonical, "Not converted by the API")
+        return result, first_error
+
+    async def _request_deeplinks(self, coupang_urls: List[str], sub_id: Optional[str]) -> List[DeepLink]:
+        """
+        Create deeplinks with the API.
+
+        Args:
+            coupang_urls: Coupang URLs to convert
+            sub_id: Tracking sub ID (omitted from the request if empty)
+
+        Returns:
+            List of DeepLink objects as returned by the API
+
+        Raises:
+            CoupangAPIError: If deeplink creation fails
+        """
         # API endpoint for deeplink creation
         path = "/v2/providers/affiliate_open_api/apis/openapi/deeplink"
 
@@ -336,8 +1289,8 @@ class CoupangClient:
         }
 
         # Add subId if provided
-        if effective_sub_id:
-            request_body["subId"] = effective_sub_id
+        if sub_id:
+            request_body["subId"] = sub_id
 
         # Make request
         response_data = await self._make_request("POST", path, json_body=request_body)
@@ -351,22 +1304,73 @@ class CoupangClient:
             else:
                 deeplinks_data = []
 
-            # Convert to DeepLink objects
-            deeplinks = []
-            for item in deeplinks_data:
-                try:
-                    deeplink = DeepLink(**item)
-                    deeplinks.append(deeplink)
-                except Exception as e:
-                    # Skip invalid deeplinks but log the error
-                    print(f"Warning: Failed to parse deeplink: {e}")
-                    continue
-
-            return deeplinks
+            # Convert to DeepLink objects (invalid items are skipped and logged)
+            return self._timed_parse(rate_limit.DEEPLINK, parse_deeplinks, deeplinks_data)
 
         except Exception as e:
             raise CoupangAPIError(f"Failed to parse deeplink response: {str(e)}")
 
+    def _typed_decoder(self, family: str) -> Callable[[bytes], List[Product]]:
+        """Body decoder validating a product list response straight into Products, timed as parsing."""
+        return partial(self._timed_parse, family, parse_products_json)
+
+    def _timed_parse(self, family: str, parser: Callable[[Any], list], items: Any) -> list:
+        """Run a response parser and record its duration for the endpoint family."""
+        started = time.perf_counter()
+        try:
+            return parser(items)
+        finally:
+            latency = self.parse_latency.setdefault(family, LatencyStats())
+            latency.record(time.perf_counter() - started)
+
+    def time_until_available(self, family: str) -> float:
+        """
+        Estimate how long a new request in an endpoint family would wait.
+
+        Lets callers decide whether to wait for a slot or degrade.
+
+        Args:
+            family: Endpoint family ("search", "bestcategories", "product", "deeplink")
+
+        Returns:
+            Seconds until a rate-limit slot would be granted (0 if immediately available)
+        """
+        return self.rate_limiter.time_until_available(family)
+
+    def get_stats(self) -> dict:
+        """
+        Get runtime statistics for monitoring.
+
+        Returns:
+            Dictionary of component name to statistics
+        """
+        return {
+            "search_cache": self.search_cache.stats(),
+            "category_cache": self.category_cache.stats(),
+            "revalidation": {
+                "in_flight": len(self._refreshes),
+                "started": self.refreshes_started,
+                "skipped": self.refreshes_skipped,
+                "failed": self.refreshes_failed,
+            },
+            "disk_cache": self.disk_cache.stats() if self.disk_cache is not None else None,
+            "deeplink_store": self.deeplink_store.stats() if self.deeplink_store is not None else None,
+            "coalescer": self.coalescer.stats(),
+            "deeplink_batcher": self.deeplink_batcher.stats(),
+            "rate_limiter": self.rate_limiter.stats(),
+            "retries": self.retries,
+            "connection_pool": self.pool_stats(),
+            "circuit_breakers": {
+                family: breaker.stats() for family, breaker in self.circuit_breakers.items()
+            },
+            "attempt_latency": {
+                family: stats.stats() for family, stats in self.attempt_latency.items()
+            },
+            "parse_latency": {
+                family: stats.stats() for family, stats in self.parse_latency.items()
+            },
+        }
+
     def __repr__(self) -> str:
         """String representation."""
         return f"CoupangClient(partner_id={self.partner_id})"
@@ -0,0 +1,464 @@
+"""
+Columnar product batches.
+
+Stores a product list column by column (typed arrays for numbers, flag maps
+for booleans, interned category names) so statistics, filtering and sorting
+over large merged result sets run over compact columns instead of objects.
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right
+import logging
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from src.models.product import Product
+from src.models.record import ProductRecord, _api_values
+
+logger = logging.getLogger(__name__)
+
+
+# Sentinel for missing optional integers in array columns
+MISSING = -1
+
+# Flag map values (one byte per product)
+_FALSE = 0
+_TRUE = 1
+_UNSET = 2
+
+# Bounds of the "q" price columns
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+# Sortable columns
+SORT_KEYS = ("price", "discount_rate", "original_price", "name")
+
+_EMPTY_SUMMARY = {
+    "total_count": 0,
+    "avg_price": 0,
+    "min_price": 0,
+    "max_price": 0,
+    "rocket_count": 0,
+    "free_shipping_count": 0
+}
+
+
+def _flag(value: Optional[bool]) -> int:
+    """Encode an optional boolean as a flag map byte."""
+    if value is None:
+        return _UNSET
+    return _TRUE if value else _FALSE
+
+
+def _unflag(value: int) -> Optional[bool]:
+    """Decode a flag map byte."""
+    if value == _UNSET:
+        return None
+    return value == _TRUE
+
+
+def _summarize(prices: Sequence[int], rocket_flags: Sequence[int], free_shipping_flags: Sequence[int]) -> dict:
+    """Compute summary statistics from gathered columns."""
+    if not prices:
+        return dict(_EMPTY_SUMMARY)
+    return {
+        "total_count": len(prices),
+        "avg_price": sum(prices) // len(prices),
+        "min_price": min(prices),
+        "max_price": max(prices),
+        "rocket_count": rocket_flags.count(_TRUE),
+        "free_shipping_count": free_shipping_flags.count(_TRUE)
+    }
+
+
+class _Columns:
+    """Immutable column storage shared by a batch and everything selected from it."""
+
+    __slots__ = (
+        "product_ids", "product_names", "product_images", "product_urls",
+        "prices", "original_prices", "discount_rates", "category_codes",
+        "rocket_flags", "free_shipping_flags", "categories", "category_index",
+        "price_order", "sorted_prices", "summary",
+    )
+
+    def __init__(self, rows: Iterable[Sequence[Any]]):
+        """
+        Build columns from product field values.
+
+        Args:
+            rows: Field value tuples in Product field order
+        """
+        ids: List[str] = []
+        names: List[str] = []
+        images: List[str] = []
+        urls: List[str] = []
+        prices: List[int] = []
+        original_prices: List[int] = []
+        discount_rates: List[int] = []
+        category_codes: List[int] = []
+        rocket_flags = bytearray()
+        free_shipping_flags = bytearray()
+        categories: List[str] = []
+        category_index: Dict[str, int] = {}
+
+        for (product_id, product_name, product_price, product_image, product_url,
+             category_name, is_rocket, is_free_shipping, discount_rate, original_price) in rows:
+            ids.append(product_id)
+            names.append(product_name)
+            images.append(product_image)
+            urls.append(product_url)
+            prices.append(product_price)
+            original_prices.append(MISSING if original_price is None else original_price)
+            discount_rates.append(MISSING if discount_rate is None else discount_rate)
+            rocket_flags.append(_flag(is_rocket))
+            free_shipping_flags.append(_flag(is_free_shipping))
+
+            # Intern category names: each distinct name is stored once
+            if category_name is None:
+                category_codes.append(MISSING)
+            else:
+                code = category_index.get(category_name)
+                if code is None:
+                    code = category_index[category_name] = len(categories)
+                    categories.append(category_name)
+                category_codes.append(code)
+
+        self.product_ids = ids
+        self.product_names = names
+        self.product_images = images
+        self.product_urls = urls
+        self.prices = array("q", prices)
+        self.original_prices = array("q", original_prices)
+        self.discount_rates = array("i", discount_rates)
+        self.category_codes = array("i", category_codes)
+        self.rocket_flags = rocket_flags
+        self.free_shipping_flags = free_shipping_flags
+        self.categories = categories
+        self.category_index = category_index
+
+        # Rows in ascending price order, for price range lookups by bisection and price sorts
+        order = sorted(range(len(prices)), key=prices.__getitem__)
+        self.price_order = array("i", order)
+        self.sorted_prices = array("q", [prices[row] for row in order])
+
+        # Whole-batch statistics, computed while prices are still plain ints
+        self.summary = _summarize(prices, rocket_flags, free_shipping_flags)
+
+    def __len__(self) -> int:
+        """Number of stored products."""
+        return len(self.prices)
+
+
+class ProductBatch:
+    """
+    Column-oriented list of products.
+
+    Behaves like a read-only sequence of ProductRecord (len, indexing, slicing,
+    iteration), so it can be passed wherever a product list is only read.
+    Filtering, sorting and slicing return new batches that share the same
+    columns and only carry the selected row positions, so no column data is
+    copied until products are read out.
+
+    Example:
+        >>> batch = ProductBatch.from_products(products)
+        >>> cheap_rocket = batch.filter(max_price=50000, rocket=True).sort("price")
+        >>> print(cheap_rocket.summary()["avg_price"])
+    """
+
+    def __init__(self, columns: Optional[_Columns] = None, rows: Optional[Sequence[int]] = None):
+        """
+        Initialize batch (use from_api, from_products or concat to build one).
+
+        Args:
+            columns: Column storage (empty if not provided)
+            rows: Selected row positions in output order (all rows if not provided)
+        """
+        self._columns = columns if columns is not None else _Columns(())
+        self._rows: Sequence[int] = rows if rows is not None else range(len(self._columns))
+
+    @classmethod
+    def from_api(cls, items: Any) -> "ProductBatch":
+        """
+        Build a batch from a raw productData array.
+
+        Args:
+            items: Raw product dicts from the API
+
+        Returns:
+            ProductBatch (invalid items are skipped and logged)
+
+        Example:
+            >>> batch = ProductBatch.from_api(response["data"]["productData"])
+        """
+        def rows():
+            for item in items:
+                try:
+                    yield _api_values(item)
+                except ValueError as e:
+                    logger.warning(f"Skipping invalid product in batch: {e}")
+
+        return cls(_Columns(rows()))
+
+    @classmethod
+    def from_products(cls, products: Iterable[Union[Product, ProductRecord]]) -> "ProductBatch":
+        """
+        Build a batch from Product or ProductRecord objects.
+
+        Args:
+            products: Products to store
+
+        Returns:
+            ProductBatch with the same products in the same order
+        """
+        return cls(_Columns(
+            (p.product_id, p.product_name, p.product_price, p.product_image, p.product_url,
+             p.category_name, p.is_rocket, p.is_free_shipping, p.discount_rate, p.original_price)
+            for p in products
+        ))
+
+    @classmethod
+    def concat(cls, batches: Iterable["ProductBatch"], dedupe: bool = False) -> "ProductBatch":
+        """
+        Merge several batches into one.
+
+        Args:
+            batches: Batches to merge, in order
+            dedupe: Keep only the first product for each product ID
+
+        Returns:
+            Merged ProductBatch
+        """
+        def rows():
+            seen = set()
+            for batch in batches:
+                ids = batch._columns.product_ids
+                for row in batch._rows:
+                    if dedupe:
+                        if ids[row] in seen:
+                            continue
+                        seen.add(ids[row])
+                    yield batch._values(row)
+
+        return cls(_Columns(rows()))
+
+    def _values(self, row: int) -> tuple:
+        """Field values of a stored row in Product field order."""
+        columns = self._columns
+        category_code = columns.category_codes[row]
+        discount_rate = columns.discount_rates[row]
+        original_price = columns.original_prices[row]
+        return (
+            columns.product_ids[row],
+            columns.product_names[row],
+            columns.prices[row],
+            columns.product_images[row],
+            columns.product_urls[row],
+            None if category_code == MISSING else columns.categories[category_code],
+            _unflag(columns.rocket_flags[row]),
+            _unflag(columns.free_shipping_flags[row]),
+            None if discount_rate == MISSING else discount_rate,
+            None if original_price == MISSING else original_price,
+        )
+
+    def _select(self, rows: Sequence[int]) -> "ProductBatch":
+        """New batch over the same columns with other selected rows."""
+        return ProductBatch(self._columns, rows)
+
+    def _is_full(self) -> bool:
+        """Whether every stored row is selected in stored order."""
+        return isinstance(self._rows, range) and self._rows == range(len(self._columns))
+
+    @property
+    def product_ids(self) -> List[str]:
+        """Product IDs in batch order."""
+        ids = self._columns.product_ids
+        return [ids[row] for row in self._rows]
+
+    @property
+    def prices(self) -> array:
+        """Prices in batch order."""
+        if self._is_full():
+            return self._columns.prices
+        prices = self._columns.prices
+        return array("q", [prices[row] for row in self._rows])
+
+    @property
+    def categories(self) -> List[str]:
+        """Distinct category names stored in the batch's columns."""
+        return self._columns.categories
+
+    def filter(
+        self,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        rocket: Optional[bool] = None,
+        free_shipping: Optional[bool] = None,
+        min_discount: Optional[int] = None,
+        category: Optional[str] = None
+    ) -> "ProductBatch":
+        """
+        Select products matching all given conditions.
+
+        On a whole batch the price range is found by bisecting the price
+        index; every other condition scans one column, and only over rows
+        that passed the previous conditions. No column data is copied.
+
+        Args:
+            min_price: Minimum price (inclusive)
+            max_price: Maximum price (inclusive)
+            rocket: Require rocket delivery (True) or its absence (False)
+            free_shipping: Require free shipping (True) or its absence (False)
+            min_discount: Minimum discount rate percentage
+            category: Exact category name
+
+        Returns:
+            New ProductBatch with matching products in their original order
+
+        Example:
+            >>> batch.filter(min_price=10000, max_price=50000, rocket=True)
+        """
+        columns = self._columns
+        rows = self._rows
+
+        if min_price is not None or max_price is not None:
+            # Integer bounds keep comparisons int-to-int (much cheaper than against float infinities)
+            low = min_price if min_price is not None else _INT64_MIN
+            high = max_price if max_price is not None else _INT64_MAX
+            if self._is_full():
+                start = bisect_left(columns.sorted_prices, low)
+                end = bisect_right(columns.sorted_prices, high)
+                rows = sorted(columns.price_order[start:end])
+            else:
+                prices = columns.prices
+                rows = [row for row in rows if low <= prices[row] <= high]
+        if category is not None:
+            code = columns.category_index.get(category)
+            if code is None:
+                return self._select([])
+            codes = columns.category_codes
+            rows = [row for row in rows if codes[row] == code]
+        if rocket is not None:
+            rows = self._filter_flag(columns.rocket_flags, rows, rocket)
+        if free_shipping is not None:
+            rows = self._filter_flag(columns.free_shipping_flags, rows, free_shipping)
+        if min_discount is not None:
+            rates = columns.discount_rates
+            rows = [row for row in rows if rates[row] >= min_discount]
+
+        return self._select(rows)
+
+    @staticmethod
+    def _filter_flag(flags: bytearray, rows: Sequence[int], wanted: bool) -> List[int]:
+        """Keep rows whose flag is set (wanted=True) or not set (wanted=False)."""
+        if wanted:
+            return [row for row in rows if flags[row] == _TRUE]
+        return [row for row in rows if flags[row] != _TRUE]
+
+    def _sort_column(self, by: str) -> Sequence:
+        """Get the column a sort key refers to."""
+        columns = {
+            "price": self._columns.prices,
+            "discount_rate": self._columns.discount_rates,
+            "original_price": self._columns.original_prices,
+            "name": self._columns.product_names,
+        }
+        if by not in columns:
+            raise ValueError(f"Unknown sort key: {by}. Choose from: {', '.join(SORT_KEYS)}")
+        return columns[by]
+
+    def sort(self, by: str = "price", descending: bool = False) -> "ProductBatch":
+        """
+        Sort products by a column.
+
+        The sort is stable, and missing discount rates or original prices
+        sort below every present value.
+
+        Args:
+            by: "price", "discount_rate", "original_price" or "name"
+            descending: Sort from highest to lowest
+
+        Returns:
+            New sorted ProductBatch
+        """
+        column = self._sort_column(by)
+        if by == "price" and not descending and self._is_full():
+            return self._select(list(self._columns.price_order))
+        return self._select(sorted(self._rows, key=column.__getitem__, reverse=descending))
+
+    def top_k(self, k: int, by: str = "price", descending: bool = False) -> "ProductBatch":
+        """
+        Get the first `k` products in sort order without sorting the whole batch.
+
+        Args:
+            k: Number of products to keep
+            by: "price", "discount_rate", "original_price" or "name"
+            descending: Take the highest values instead of the lowest
+
+        Returns:
+            New ProductBatch with at most `k` products, in sort order
+        """
+        column = self._sort_column(by)
+        pick = heapq.nlargest if descending else heapq.nsmallest
+        return self._select(pick(k, self._rows, key=column.__getitem__))
+
+    def summary(self) -> dict:
+        """
+        Get summary statistics.
+
+        Statistics of a whole batch are computed once when it is built;
+        selections gather only the price and flag columns.
+
+        Returns:
+            Dictionary with total_count, avg_price, min_price, max_price,
+            rocket_count and free_shipping_count (same keys as get_search_summary)
+        """
+        columns = self._columns
+        if self._is_full():
+            return dict(columns.summary)
+
+        prices, rocket, free_shipping = columns.prices, columns.rocket_flags, columns.free_shipping_flags
+        rows = self._rows
+        return _summarize(
+            [prices[row] for row in rows],
+            [rocket[row] for row in rows],
+            [free_shipping[row] for row in rows],
+        )
+
+    def record(self, i: int) -> ProductRecord:
+        """
+        Get one product as a ProductRecord.
+
+        Args:
+            i: Position in the batch
+
+        Returns:
+            ProductRecord for the product
+        """
+        return ProductRecord(*self._values(self._rows[i]))
+
+    def to_records(self) -> List[ProductRecord]:
+        """Get all products as ProductRecord objects."""
+        return [ProductRecord(*self._values(row)) for row in self._rows]
+
+    def to_products(self) -> List[Product]:
+        """Get all products as Product models."""
+        return [record.to_product() for record in self.to_records()]
+
+    def __len__(self) -> int:
+        """Number of products."""
+        return len(self._rows)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ProductRecord, "ProductBatch"]:
+        """Get a product record by position, or a sub-batch by slice."""
+        if isinstance(index, slice):
+            return self._select(self._rows[index])
+        return self.record(index)
+
+    def __iter__(self) -> Iterator[ProductRecord]:
+        """Iterate over products as ProductRecord objects."""
+        for row in self._rows:
+            yield ProductRecord(*self._values(row))
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"ProductBatch(size={len(self)}, categories={len(self.categories)})"
@@ -4,8 +4,14 @@ Data models for Coupang products.
 Defines Pydantic models for product search results and product details.
 """
 
-from typing import Optional, List, Union
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+import json
+import logging
+from typing import Any, Dict, Literal, Optional, List, Type, TypeVar, Union
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, ValidationError, field_validator, model_validator
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
 class ProductImage(BaseModel):
@@ -88,6 +94,96 @@ class SearchParams(BaseModel):
     )
 
 
+class CategoryBestParams(BaseModel):
+    """
+    Parameters for category best products.
+
+    Used to validate category best product requests.
+    """
+    category_id: str = Field(description="Category ID")
+    limit: int = Field(default=20, ge=1, le=100, description="Number of results (1-100)")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "category_id": "1016",
+                "limit": 20
+            }
+        }
+    )
+
+
+class ProductFilter(BaseModel):
+    """
+    Server-side filter and sort options for product list tools.
+
+    Used to narrow cached results before they are returned to the AI.
+    """
+    min_price: Optional[int] = Field(None, ge=0, description="Minimum price in KRW (inclusive)")
+    max_price: Optional[int] = Field(None, ge=0, description="Maximum price in KRW (inclusive)")
+    rocket_only: bool = Field(False, description="Only products with rocket delivery")
+    free_shipping_only: bool = Field(False, description="Only products with free shipping")
+    min_discount: Optional[int] = Field(None, ge=0, le=100, description="Minimum discount rate percentage")
+    sort_by: Optional[Literal["price", "discount_rate", "original_price", "name"]] = Field(
+        None, description="Sort key (API order if not set)"
+    )
+    sort_order: Literal["asc", "desc"] = Field("asc", description="Sort direction")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "max_price": 50000,
+                "rocket_only": True,
+                "sort_by": "price"
+            }
+        }
+    )
+
+    @model_validator(mode="after")
+    def check_price_range(self) -> "ProductFilter":
+        """Ensure the price range is not empty."""
+        if self.min_price is not None and self.max_price is not None and self.min_price > self.max_price:
+            raise ValueError("min_price must not exceed max_price")
+        return self
+
+    @property
+    def is_active(self) -> bool:
+        """Whether any filter or sort option is set."""
+        return (
+            self.min_price is not None or self.max_price is not None or self.rocket_only
+            or self.free_shipping_only or self.min_discount is not None or self.sort_by is not None
+        )
+
+
+class BatchSearchParams(BaseModel):
+    """
+    Parameters for searching several keywords at once.
+
+    Used to validate multi-keyword search requests.
+    """
+    keywords: List[str] = Field(min_length=1, max_length=20, description="Search keywords (1-20)")
+    limit: int = Field(default=5, ge=1, le=100, description="Number of results per keyword (1-100)")
+
+    @field_validator("keywords")
+    @classmethod
+    def strip_keywords(cls, v: List[str]) -> List[str]:
+        """Strip each keyword and reject blank ones, which would spend search quota on nothing."""
+        keywords = [keyword.strip() for keyword in v]
+        blank = [i for i, keyword in enumerate(keywords) if not keyword]
+        if blank:
+            raise ValueError(f"keywords must not be empty or blank (index {', '.join(map(str, blank))})")
+        return keywords
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "keywords": ["노트북", "마우스", "키보드"],
+                "limit": 5
+            }
+        }
+    )
+
+
 class DeepLink(BaseModel):
     """
     Deeplink conversion result.
@@ -110,6 +206,17 @@ class DeepLink(BaseModel):
     )
 
 
+class DeepLinkBatchResult(BaseModel):
+    """
+    Result of converting a batch of URLs.
+
+    Holds one DeepLink per converted URL in request order, plus the URLs that
+    could not be converted with the reason.
+    """
+    links: List[DeepLink] = Field(default_factory=list, description="Converted deeplinks in request order")
+    errors: Dict[str, str] = Field(default_factory=dict, description="Unconverted URL to error message")
+
+
 class DeepLinkRequest(BaseModel):
     """
     Request parameters for deeplink creation.
@@ -127,3 +234,105 @@ class DeepLinkRequest(BaseModel):
             }
         }
     )
+
+
+class _ProductPage(BaseModel):
+    """Search response payload: {"productData": [...]}."""
+    product_data: List[Product] = Field(default_factory=list, alias="productData")
+
+
+class _ProductListEnvelope(BaseModel):
+    """Product list response as sent by the API (search or category best)."""
+    data: Union[_ProductPage, List[Product]] = Field(default_factory=list)
+
+
+# Prebuilt validators for whole API result arrays
+_product_list_adapter = TypeAdapter(List[Product])
+_deeplink_list_adapter = TypeAdapter(List[DeepLink])
+_product_envelope_adapter = TypeAdapter(_ProductListEnvelope)
+
+
+def _parse_list(adapter: TypeAdapter, model: Type[ModelT], items: Any) -> List[ModelT]:
+    """
+    Validate an API result array in one pass, skipping invalid items on failure.
+
+    Args:
+        adapter: Prebuilt TypeAdapter for a list of `model`
+        model: Model class used to validate items one at a time
+        items: Raw API items (normally a list of dicts)
+
+    Returns:
+        List of validated models
+    """
+    try:
+        return adapter.validate_python(items)
+    except ValidationError:
+        pass
+
+    # Fall back to per-item validation so one bad item does not drop the batch
+    results = []
+    for item in items:
+        try:
+            results.append(model.model_validate(item))
+        except Exception as e:
+            logger.warning(f"Skipping invalid {model.__name__}: {e}")
+    return results
+
+
+def parse_products(items: Any) -> List[Product]:
+    """
+    Parse a productData array into Product objects.
+
+    Args:
+        items: Raw product dicts from the API
+
+    Returns:
+        List of Product objects (invalid items are skipped and logged)
+
+    Example:
+        >>> products = parse_products(response["data"]["productData"])
+    """
+    return _parse_list(_product_list_adapter, Product, items)
+
+
+def parse_deeplinks(items: Any) -> List[DeepLink]:
+    """
+    Parse a deeplink result array into DeepLink objects.
+
+    Args:
+        items: Raw deeplink dicts from the API
+
+    Returns:
+        List of DeepLink objects (invalid items are skipped and logged)
+    """
+    return _parse_list(_deeplink_list_adapter, DeepLink, items)
+
+
+def parse_products_json(raw: bytes) -> List[Product]:
+    """
+    Decode a product list response body straight into Product objects.
+
+    Validates the raw JSON bytes in a single pydantic-core pass without
+    building intermediate dicts. Falls back to decoding and per-item
+    validation if any item is invalid.
+
+    Args:
+        raw: Response body of a search or category best products request
+
+    Returns:
+        List of Product objects
+
+    Example:
+        >>> products = parse_products_json(b'{"data": {"productData": []}}')
+    """
+    try:
+        envelope = _product_envelope_adapter.validate_json(raw)
+    except ValidationError:
+        data = json.loads(raw).get("data", [])
+        if isinstance(data, dict):
+            data = data.get("productData", [])
+        return parse_products(data)
+
+    if isinstance(envelope.data, _ProductPage):
+        return envelope.data.product_data
+    return envelope.data
@@ -0,0 +1,234 @@
+"""
+Compact product records.
+
+Defines a lightweight `__slots__` counterpart of the Product model for holding
+large numbers of products in memory (caching, comparison, merging).
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from src.models.product import Product
+
+logger = logging.getLogger(__name__)
+
+
+# (attribute, API field) pairs in Product field order
+_FIELDS = (
+    ("product_id", "productId"),
+    ("product_name", "productName"),
+    ("product_price", "productPrice"),
+    ("product_image", "productImage"),
+    ("product_url", "productUrl"),
+    ("category_name", "categoryName"),
+    ("is_rocket", "isRocket"),
+    ("is_free_shipping", "isFreeShipping"),
+    ("discount_rate", "discountRate"),
+    ("original_price", "originalPrice"),
+)
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    """Coerce an optional integer field."""
+    return None if value is None else int(value)
+
+
+def _optional_bool(value: Any) -> Optional[bool]:
+    """Coerce an optional boolean field, accepting "true"/"false" strings like Product does."""
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in ("true", "1", "yes", "y", "on"):
+            return True
+        if lowered in ("false", "0", "no", "n", "off"):
+            return False
+        raise ValueError(f"Invalid boolean value: {value!r}")
+    return bool(value)
+
+
+def _api_values(item: Dict[str, Any]) -> tuple:
+    """
+    Extract and coerce product field values from a raw API dict.
+
+    Args:
+        item: Product dict with API field names
+
+    Returns:
+        Field values in _FIELDS order
+
+    Raises:
+        ValueError: If a required field is missing or has the wrong type
+    """
+    try:
+        product_name = item["productName"]
+        product_image = item["productImage"]
+        product_url = item["productUrl"]
+        if not isinstance(product_name, str) or not isinstance(product_image, str) \
+                or not isinstance(product_url, str):
+            raise ValueError("productName, productImage and productUrl must be strings")
+
+        return (
+            str(item["productId"]),
+            product_name,
+            int(item["productPrice"]),
+            product_image,
+            product_url,
+            item.get("categoryName"),
+            _optional_bool(item.get("isRocket")),
+            _optional_bool(item.get("isFreeShipping")),
+            _optional_int(item.get("discountRate")),
+            _optional_int(item.get("originalPrice")),
+        )
+    except KeyError as e:
+        raise ValueError(f"Missing required product field: {e.args[0]}")
+    except (TypeError, AttributeError) as e:
+        raise ValueError(f"Invalid product data: {e}")
+
+
+class ProductRecord:
+    """
+    Memory-compact product record.
+
+    Has the same attributes as Product, so it can be used anywhere products are
+    only read (formatting, filtering, sorting), but without pydantic's
+    per-instance overhead. Construction from API dicts does only the type
+    coercion the API actually needs.
+    """
+
+    __slots__ = tuple(name for name, _ in _FIELDS)
+
+    def __init__(
+        self,
+        product_id: str,
+        product_name: str,
+        product_price: int,
+        product_image: str,
+        product_url: str,
+        category_name: Optional[str] = None,
+        is_rocket: Optional[bool] = None,
+        is_free_shipping: Optional[bool] = None,
+        discount_rate: Optional[int] = None,
+        original_price: Optional[int] = None
+    ):
+        """
+        Initialize record.
+
+        Args:
+            product_id: Unique product ID
+            product_name: Product name
+            product_price: Product price in KRW
+            product_image: Main product image URL
+            product_url: Affiliate product URL
+            category_name: Product category
+            is_rocket: Rocket delivery available
+            is_free_shipping: Free shipping available
+            discount_rate: Discount rate percentage
+            original_price: Original price before discount
+        """
+        self.product_id = product_id
+        self.product_name = product_name
+        self.product_price = product_price
+        self.product_image = product_image
+        self.product_url = product_url
+        self.category_name = category_name
+        self.is_rocket = is_rocket
+        self.is_free_shipping = is_free_shipping
+        self.discount_rate = discount_rate
+        self.original_price = original_price
+
+    @classmethod
+    def from_api(cls, item: Dict[str, Any]) -> "ProductRecord":
+        """
+        Build a record from a raw API product dict.
+
+        Args:
+            item: Product dict with API field names (productId, productName, ...)
+
+        Returns:
+            ProductRecord instance
+
+        Raises:
+            ValueError: If a required field is missing or has the wrong type
+
+        Example:
+            >>> record = ProductRecord.from_api(response["data"]["productData"][0])
+        """
+        return cls(*_api_values(item))
+
+    @classmethod
+    def from_product(cls, product: Product) -> "ProductRecord":
+        """
+        Build a record from a Product model.
+
+        Args:
+            product: Product instance
+
+        Returns:
+            ProductRecord with the same field values
+        """
+        return cls(*(getattr(product, name) for name, _ in _FIELDS))
+
+    def to_product(self) -> Product:
+        """
+        Convert back to a Product model.
+
+        Returns:
+            Product instance with the same field values
+        """
+        return Product.model_validate(self.to_dict())
+
+    def to_dict(self, by_alias: bool = False) -> Dict[str, Any]:
+        """
+        Get record fields as a dictionary.
+
+        Args:
+            by_alias: Use API field names (productId, ...) instead of attribute names
+
+        Returns:
+            Dictionary of all fields, matching Product.model_dump()
+        """
+        if by_alias:
+            return {alias: getattr(self, name) for name, alias in _FIELDS}
+        return {name: getattr(self, name) for name, _ in _FIELDS}
+
+    def _values(self) -> tuple:
+        """Field values in declaration order."""
+        return tuple(getattr(self, name) for name, _ in _FIELDS)
+
+    def __eq__(self, other: object) -> bool:
+        """Records are equal when all fields are equal."""
+        if not isinstance(other, ProductRecord):
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"ProductRecord(product_id={self.product_id!r}, "
+            f"product_name={self.product_name!r}, product_price={self.product_price})"
+        )
+
+
+def parse_product_records(items: Any) -> List[ProductRecord]:
+    """
+    Parse a productData array into ProductRecord objects.
+
+    Args:
+        items: Raw product dicts from the API
+
+    Returns:
+        List of ProductRecord objects (invalid items are skipped and logged)
+
+    Example:
+        >>> records = parse_product_records(response["data"]["productData"])
+    """
+    records = []
+    for item in items:
+        try:
+            records.append(ProductRecord.from_api(item))
+        except ValueError as e:
+            logger.warning(f"Skipping invalid ProductRecord: {e}")
+    return records
@@ -2,18 +2,33 @@
 MCP Server for Coupang integration.
 
 Provides tools for searching products and retrieving product details.
+
+The Coupang client (aiohttp) and the request models are imported on first
+use, so the server answers initialize and list_tools without loading them.
 """
 
 import asyncio
+import importlib
 import logging
-from typing import Any
+import os
+import stat
+from typing import TYPE_CHECKING, Any, Dict
 
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 
-from src.coupang_client import CoupangClient, CoupangAPIError
-from src.models.product import SearchParams, DeepLinkRequest
 from src.utils.categories import get_category_list_text, is_valid_category
+from src.utils.config import config
+from src.utils.deadline import deadline_scope
+from src.tools.output import (
+    OUTPUT_FORMATS, PRODUCT_FIELDS, format_deeplinks, format_product_groups, format_products,
+    validate_output_options
+)
+from src.utils.metrics import SizeStats
+
+if TYPE_CHECKING:
+    from src.category_refresher import CategoryRefresher
+    from src.coupang_client import CoupangClient
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -23,7 +38,96 @@ logger = logging.getLogger("coupang-mcp-server")
 app = Server("coupang-mcp-server")
 
 # Global client instance
-client: CoupangClient = None
+client: "CoupangClient" = None
+
+# Background connection warm-up started with the server
+warmup_task: asyncio.Task = None
+
+# Set once list_tools is answered; a deferred client is only loaded after that (stdio)
+tools_listed: asyncio.Event = None
+
+# Longest wait for list_tools before loading a deferred client anyway
+CLIENT_PRELOAD_DELAY = 2.0
+
+# Background prefetch of category best products (if enabled)
+category_refresher: "CategoryRefresher" = None
+
+# Lock file held by the one process prefetching categories for a shared rate budget
+refresher_lock = None
+
+# Candidate products considered when filter or sort options are given (one full, cached result page)
+FILTER_CANDIDATES = 100
+
+# Optional filter/sort options shared by product list tools (see ProductFilter)
+FILTER_PROPERTIES = {
+    "min_price": {
+        "type": "integer",
+        "description": "Only products priced at least this much (KRW)",
+        "minimum": 0
+    },
+    "max_price": {
+        "type": "integer",
+        "description": "Only products priced at most this much (KRW)",
+        "minimum": 0
+    },
+    "rocket_only": {
+        "type": "boolean",
+        "description": "Only products with rocket delivery",
+        "default": False
+    },
+    "free_shipping_only": {
+        "type": "boolean",
+        "description": "Only products with free shipping",
+        "default": False
+    },
+    "min_discount": {
+        "type": "integer",
+        "description": "Only products discounted at least this many percent",
+        "minimum": 0,
+        "maximum": 100
+    },
+    "sort_by": {
+        "type": "string",
+        "enum": ["price", "discount_rate", "original_price", "name"],
+        "description": "Sort results by this field (API ranking order if omitted)"
+    },
+    "sort_order": {
+        "type": "string",
+        "enum": ["asc", "desc"],
+        "description": "Sort direction (default: asc)",
+        "default": "asc"
+    }
+}
+
+FILTER_DESCRIPTION = (
+    " Optional filter and sort options are applied server-side over the top "
+    f"{FILTER_CANDIDATES} results before 'limit' is taken, so ask for exactly what is needed "
+    "(e.g., the 5 cheapest rocket-delivery items under 50,000원) instead of filtering large lists yourself."
+)
+
+# Optional output options shared by product list tools (see src.tools.output)
+OUTPUT_PROPERTIES = {
+    "output_format": {
+        "type": "string",
+        "enum": list(OUTPUT_FORMATS),
+        "description": (
+            "Response format: 'text' (readable, default), 'compact_json' (JSON with only the "
+            "requested fields) or 'table' (tab-separated header and rows, smallest)"
+        ),
+        "default": "text"
+    },
+    "fields": {
+        "type": "array",
+        "items": {"type": "string", "enum": list(PRODUCT_FIELDS)},
+        "description": (
+            "Product fields for compact_json/table output "
+            "(default: id, name, price, rocket, free_shipping, discount, url)"
+        )
+    }
+}
+
+# Response sizes per tool and output format ("tool:format")
+output_stats: Dict[str, SizeStats] = {}
 
 
 @app.list_tools()
@@ -34,6 +138,9 @@ async def list_tools() -> list[Tool]:
     Returns:
         List of Tool objects that can be called by the AI.
     """
+    if tools_listed is not None:
+        tools_listed.set()
+
     return [
         Tool(
             name="search_products",
@@ -41,6 +148,7 @@ async def list_tools() -> list[Tool]:
                 "Search for products on Coupang by keyword. "
                 "Returns a list of products with names, prices, images, and affiliate URLs. "
                 "Useful for finding products, comparing prices, or discovering items."
+                + FILTER_DESCRIPTION
             ),
             inputSchema={
                 "type": "object",
@@ -55,11 +163,42 @@ async def list_tools() -> list[Tool]:
                         "minimum": 1,
                         "maximum": 100,
                         "default": 10
-                    }
+                    },
+                    **FILTER_PROPERTIES,
+                    **OUTPUT_PROPERTIES
                 },
                 "required": ["keyword"]
             }
         ),
+        Tool(
+            name="search_products_batch",
+            description=(
+                "Search for products on Coupang by several keywords at once. "
+                "Runs the searches concurrently and returns results grouped by keyword. "
+                "Use this instead of repeated search_products calls when comparing several items."
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "keywords": {
+                        "type": "array",
+                        "items": {"type": "string", "minLength": 1},
+                        "description": "Search query keywords (e.g., ['노트북', '마우스', '키보드'])",
+                        "minItems": 1,
+                        "maxItems": 20
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of results per keyword (1-100, default: 5)",
+                        "minimum": 1,
+                        "maximum": 100,
+                        "default": 5
+                    },
+                    **OUTPUT_PROPERTIES
+                },
+                "required": ["keywords"]
+            }
+        ),
         # Tool(
         #     name="get_product_details",
         #     description=(
@@ -88,7 +227,8 @@ async def list_tools() -> list[Tool]:
                 "1001-여성패션, 1002-남성패션, 1010-뷰티, 1012-식품, 1013-주방용품, "
                 "1014-생활용품, 1015-홈인테리어, 1016-가전디지털, 1017-스포츠/레저, "
                 "1018-자동차용품, 1019-도서/음반/DVD, 1020-완구/취미, 1021-문구/오피스, "
-                "1024-헬스/건강식품, 1025-국내여행, 1026-해외여행, 1029-반려동물용품, 1030-유아동패션"
+                "1024-헬스/건강식품, 1025-국내여행, 1026-해외여행, 1029-반려동물용품, 1030-유아동패션\n"
+                + FILTER_DESCRIPTION
             ),
             inputSchema={
                 "type": "object",
@@ -103,7 +243,9 @@ async def list_tools() -> list[Tool]:
                         "minimum": 1,
                         "maximum": 100,
                         "default": 20
-                    }
+                    },
+                    **FILTER_PROPERTIES,
+                    **OUTPUT_PROPERTIES
                 },
                 "required": ["category_id"]
             }
@@ -126,7 +268,8 @@ async def list_tools() -> list[Tool]:
                     "sub_id": {
                         "type": "string",
                         "description": "Optional tracking/sub ID for analytics (uses environment default if not provided)"
-                    }
+                    },
+                    "output_format": OUTPUT_PROPERTIES["output_format"]
                 },
                 "required": ["coupang_urls"]
             }
@@ -139,6 +282,9 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     """
     Handle tool calls from the AI.
 
+    Each call runs under a deadline (COUPANG_TOOL_TIMEOUT) that bounds rate-limit
+    waits, retries and HTTP timeouts in the client.
+
     Args:
         name: Name of the tool to call
         arguments: Dictionary of arguments for the tool
@@ -149,24 +295,31 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
     Raises:
         ValueError: If tool name is unknown
     """
-    global client
-
     # Ensure client is initialized
-    if client is None:
-        client = CoupangClient()
+    get_client()
+    from src.coupang_client import CoupangAPIError, CoupangTimeoutError
 
     try:
-        if name == "search_products":
-            return await handle_search_products(arguments)
-        # elif name == "get_product_details":
-        #     return await handle_get_product_details(arguments)
-        elif name == "get_best_products_by_category":
-            return await handle_get_best_products_by_category(arguments)
-        elif name == "create_deeplinks":
-            return await handle_create_deeplinks(arguments)
-        else:
-            raise ValueError(f"Unknown tool: {name}")
-
+        with deadline_scope(config.tool_timeout):
+            if name == "search_products":
+                result = await handle_search_products(arguments)
+            elif name == "search_products_batch":
+                result = await handle_search_products_batch(arguments)
+            # elif name == "get_product_details":
+            #     result = await handle_get_product_details(arguments)
+            elif name == "get_best_products_by_category":
+                result = await handle_get_best_products_by_category(arguments)
+            elif name == "create_deeplinks":
+                result = await handle_create_deeplinks(arguments)
+            else:
+                raise ValueError(f"Unknown tool: {name}")
+
+    except CoupangTimeoutError as e:
+        logger.warning(f"Timeout in {name}: {e}")
+        return [TextContent(
+            type="text",
+            text=f"Error: Coupang API did not respond within {config.tool_timeout:g}s. {str(e)}"
+        )]
     except CoupangAPIError as e:
         logger.error(f"Coupang API error in {name}: {e}")
         return [TextContent(
@@ -180,17 +333,49 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             text=f"Error: An unexpected error occurred. {str(e)}"
         )]
 
+    _record_output_size(name, arguments, result)
+    return result
+
+
+def _record_output_size(name: str, arguments: Any, result: list[TextContent]) -> None:
+    """Account the size of a tool response per tool and output format."""
+    output_format = (arguments or {}).get("output_format")
+    if output_format not in OUTPUT_FORMATS:
+        output_format = "text"
+    stats = output_stats.setdefault(f"{name}:{output_format}", SizeStats())
+    text = "".join(content.text for content in result)
+    stats.record(text)
+    logger.debug(f"{name} returned {len(text)} chars as {output_format}")
+
+
+def get_output_stats() -> dict:
+    """
+    Get tool response size statistics.
+
+    Returns:
+        Dictionary of "tool:format" to size statistics
+    """
+    return {key: stats.stats() for key, stats in output_stats.items()}
+
+
+def _filter_arguments(arguments: dict) -> dict:
+    """Pick the filter/sort options (see FILTER_PROPERTIES) out of tool arguments."""
+    return {name: arguments[name] for name in FILTER_PROPERTIES if arguments.get(name) is not None}
+
 
 async def handle_search_products(arguments: dict) -> list[TextContent]:
     """
     Handle search_products tool call.
 
     Args:
-        arguments: Dictionary with 'keyword' and optional 'limit'
+        arguments: Dictionary with 'keyword' and optional 'limit' and filter/sort options
 
     Returns:
         List of TextContent with search results
     """
+    from src.models.product import SearchParams, ProductFilter
+    from src.tools.search import refine_products
+
     # Validate and extract arguments
     keyword = arguments.get("keyword")
     limit = arguments.get("limit", 10)
@@ -204,6 +389,8 @@ async def handle_search_products(arguments: dict) -> list[TextContent]:
     # Validate parameters using Pydantic model
     try:
         params = SearchParams(keyword=keyword, limit=limit)
+        filters = ProductFilter.model_validate(_filter_arguments(arguments))
+        output_format, fields = validate_output_options(arguments.get("output_format"), arguments.get("fields"))
     except Exception as e:
         return [TextContent(
             type="text",
@@ -212,22 +399,38 @@ async def handle_search_products(arguments: dict) -> list[TextContent]:
 
     logger.info(f"Searching products: keyword='{params.keyword}', limit={params.limit}")
 
-    # Search products
+    # Search products (a full page when filtering, served from the search cache after the first call)
     products = await client.search_products(
         keyword=params.keyword,
-        limit=params.limit
+        limit=FILTER_CANDIDATES if filters.is_active else params.limit
     )
+    if filters.is_active:
+        candidates = len(products)
+        products = refine_products(products, filters, params.limit)
+
+    # Compact output for agents that post-process results
+    if output_format != "text":
+        meta = {"keyword": params.keyword}
+        if filters.is_active:
+            meta["candidates"] = candidates
+        return [TextContent(
+            type="text",
+            text=format_products(products, output_format, fields, meta)
+        )]
 
     # Format response
     if not products:
         return [TextContent(
             type="text",
             text=f"No products found for keyword: '{params.keyword}'"
+            + (" matching the given filters" if filters.is_active else "")
         )]
 
     # Build response text
     response_lines = [
-        f"Found {len(products)} product(s) for '{params.keyword}':\n"
+        f"Found {len(products)} product(s) for '{params.keyword}'"
+        + (f" matching filters (of {candidates} searched)" if filters.is_active else "")
+        + ":\n"
     ]
 
     for i, product in enumerate(products, 1):
@@ -256,6 +459,82 @@ async def handle_search_products(arguments: dict) -> list[TextContent]:
     )]
 
 
+async def handle_search_products_batch(arguments: dict) -> list[TextContent]:
+    """
+    Handle search_products_batch tool call.
+
+    Args:
+        arguments: Dictionary with 'keywords' and optional 'limit'
+
+    Returns:
+        List of TextContent with search results grouped by keyword
+    """
+    from src.coupang_client import CoupangAPIError
+    from src.models.product import BatchSearchParams
+
+    # Validate parameters using Pydantic model
+    try:
+        params = BatchSearchParams(
+            keywords=arguments.get("keywords") or [],
+            limit=arguments.get("limit", 5)
+        )
+        output_format, fields = validate_output_options(arguments.get("output_format"), arguments.get("fields"))
+    except Exception as e:
+        return [TextContent(
+            type="text",
+            text=f"Error: Invalid parameters. {str(e)}"
+        )]
+
+    logger.info(f"Searching products for {len(params.keywords)} keyword(s), limit={params.limit}")
+
+    # Search all keywords concurrently
+    results = await client.search_products_batch(
+        keywords=params.keywords,
+        limit=params.limit
+    )
+
+    # Compact output for agents that post-process results
+    if output_format != "text":
+        return [TextContent(
+            type="text",
+            text=format_product_groups(results, output_format, fields)
+        )]
+
+    # Build response text, one section per keyword
+    response_lines = []
+
+    for keyword, products in results.items():
+        if isinstance(products, CoupangAPIError):
+            response_lines.append(f"## '{keyword}': Error: {str(products)}\n")
+            continue
+        if not products:
+            response_lines.append(f"## '{keyword}': No products found\n")
+            continue
+
+        response_lines.append(f"## '{keyword}': {len(products)} product(s)\n")
+
+        for i, product in enumerate(products, 1):
+            response_lines.append(f"{i}. {product.product_name}")
+            response_lines.append(f"   Price: {product.product_price:,}원")
+            response_lines.append(f"   ID: {product.product_id}")
+
+            # Add optional fields
+            if product.is_rocket:
+                response_lines.append("   🚀 Rocket Delivery")
+            if product.is_free_shipping:
+                response_lines.append("   📦 Free Shipping")
+            if product.discount_rate:
+                response_lines.append(f"   💰 Discount: {product.discount_rate}%")
+
+            response_lines.append(f"   URL: {product.product_url}")
+            response_lines.append("")  # Empty line between products
+
+    return [TextContent(
+        type="text",
+        text="\n".join(response_lines)
+    )]
+
+
 async def handle_get_product_details(arguments: dict) -> list[TextContent]:
     """
     Handle get_product_details tool call.
@@ -329,11 +608,14 @@ async def handle_get_best_products_by_category(arguments: dict) -> list[TextCont
     Handle get_best_products_by_category tool call.
 
     Args:
-        arguments: Dictionary with 'category_id' and optional 'limit'
+        arguments: Dictionary with 'category_id' and optional 'limit' and filter/sort options
 
     Returns:
         List of TextContent with category best products
     """
+    from src.models.product import CategoryBestParams, ProductFilter
+    from src.tools.search import refine_products
+
     # Extract arguments
     category_id = arguments.get("category_id")
     limit = arguments.get("limit", 20)
@@ -344,24 +626,52 @@ async def handle_get_best_products_by_category(arguments: dict) -> list[TextCont
             text="Error: 'category_id' parameter is required"
         )]
 
+    # Validate parameters using Pydantic model (the client never sees limit when filtering)
+    try:
+        params = CategoryBestParams(category_id=category_id, limit=limit)
+        filters = ProductFilter.model_validate(_filter_arguments(arguments))
+        output_format, fields = validate_output_options(arguments.get("output_format"), arguments.get("fields"))
+    except Exception as e:
+        return [TextContent(
+            type="text",
+            text=f"Error: Invalid parameters. {str(e)}"
+        )]
+    category_id, limit = params.category_id, params.limit
+
     logger.info(f"Fetching best products for category: category_id='{category_id}', limit={limit}")
 
-    # Get best products
+    # Get best products (the full list when filtering, served from the category cache after the first call)
     products = await client.get_best_products_by_category(
         category_id=category_id,
-        limit=limit
+        limit=FILTER_CANDIDATES if filters.is_active else limit
     )
+    if filters.is_active:
+        candidates = len(products)
+        products = refine_products(products, filters, limit)
+
+    # Compact output for agents that post-process results
+    if output_format != "text":
+        meta = {"category_id": category_id}
+        if filters.is_active:
+            meta["candidates"] = candidates
+        return [TextContent(
+            type="text",
+            text=format_products(products, output_format, fields, meta)
+        )]
 
     # Format response
     if not products:
         return [TextContent(
             type="text",
             text=f"No products found for category: '{category_id}'"
+            + (" matching the given filters" if filters.is_active else "")
         )]
 
     # Build response text
     response_lines = [
-        f"Found {len(products)} best product(s) in category '{category_id}':\n"
+        f"Found {len(products)} best product(s) in category '{category_id}'"
+        + (f" matching filters (of {candidates} best products)" if filters.is_active else "")
+        + ":\n"
     ]
 
     for i, product in enumerate(products, 1):
@@ -418,16 +728,32 @@ async def handle_create_deeplinks(arguments: dict) -> list[TextContent]:
             text="Error: 'coupang_urls' must be a non-empty list of URLs"
         )]
 
+    try:
+        output_format, _ = validate_output_options(arguments.get("output_format"))
+    except ValueError as e:
+        return [TextContent(
+            type="text",
+            text=f"Error: Invalid parameters. {str(e)}"
+        )]
+
     logger.info(f"Creating deeplinks for {len(coupang_urls)} URL(s), sub_id={sub_id or 'default'}")
 
-    # Create deeplinks
-    deeplinks = await client.create_deeplinks(
+    # Create deeplinks (large batches are chunked; failures are reported per URL)
+    result = await client.create_deeplinks_batch(
         coupang_urls=coupang_urls,
         sub_id=sub_id
     )
+    deeplinks = result.links
+
+    # Compact output for agents that post-process results
+    if output_format != "text":
+        return [TextContent(
+            type="text",
+            text=format_deeplinks(deeplinks, result.errors, output_format)
+        )]
 
     # Format response
-    if not deeplinks:
+    if not deeplinks and not result.errors:
         return [TextContent(
             type="text",
             text=f"No deeplinks created for provided URLs"
@@ -444,6 +770,12 @@ async def handle_create_deeplinks(arguments: dict) -> list[TextContent]:
         response_lines.append(f"   Landing: {link.landing_url}")
         response_lines.append("")  # Empty line between links
 
+    if result.errors:
+        response_lines.append(f"Failed to convert {len(result.errors)} URL(s):")
+        for url, error in result.errors.items():
+            response_lines.append(f"- {url}: {error}")
+        response_lines.append("")
+
     if sub_id:
         response_lines.append(f"Tracking ID: {sub_id}")
 
@@ -453,27 +785,334 @@ async def handle_create_deeplinks(arguments: dict) -> list[TextContent]:
     )]
 
 
+def get_client() -> "CoupangClient":
+    """
+    Get the shared Coupang client, importing and creating it on first use.
+
+    Returns:
+        Shared CoupangClient instance
+    """
+    global client
+    if client is None:
+        from src.coupang_client import CoupangClient
+        client = CoupangClient()
+    return client
+
+
+async def warm_up_client(preload: bool = False):
+    """
+    Pre-open connections to the Coupang API gateway.
+
+    Args:
+        preload: Create the client first, once list_tools has been answered
+            (MCP clients list tools right after initialize) or after
+            CLIENT_PRELOAD_DELAY; the modules are imported in a worker thread
+            so the event loop keeps answering requests meanwhile
+    """
+    if preload:
+        try:
+            await asyncio.wait_for(tools_listed.wait(), timeout=CLIENT_PRELOAD_DELAY)
+        except asyncio.TimeoutError:
+            pass
+        await asyncio.to_thread(importlib.import_module, "src.coupang_client")
+        get_client()
+        start_category_refresher()
+
+    opened = await client.warm_up()
+    logger.info(f"Warmed up {opened} connection(s) to Coupang API gateway")
+
+
+async def startup(defer_client: bool = False):
+    """
+    Create the Coupang client, start warming its connection pool and prefetching categories.
+
+    Args:
+        defer_client: Create the client in the background warm-up task instead
+            of before serving (stdio, where every MCP client launches a fresh
+            process and waits for initialize and list_tools)
+    """
+    global warmup_task, tools_listed
+    if defer_client:
+        tools_listed = asyncio.Event()
+        warmup_task = asyncio.create_task(warm_up_client(preload=True))
+        return
+
+    get_client()
+    warmup_task = asyncio.create_task(warm_up_client())
+    start_category_refresher()
+
+
+def _acquire_refresher_lock() -> bool:
+    """
+    Claim category prefetching among processes sharing COUPANG_RATE_LIMIT_DB.
+
+    HTTP worker processes spend one shared rate budget, so only the process
+    holding an exclusive lock next to the rate limit database runs the
+    refresher; the others read its results from the shared disk cache. The
+    lock is held until cleanup() or process exit.
+
+    Returns:
+        True if this process should run the refresher
+    """
+    global refresher_lock
+    if not config.rate_limit_db:
+        return True
+    try:
+        import fcntl
+    except ImportError:  # No advisory file locks (Windows): every process refreshes
+        return True
+
+    lock_file = open(f"{config.rate_limit_db}.refresh.lock", "a")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    refresher_lock = lock_file
+    return True
+
+
+def start_category_refresher():
+    """Start prefetching category best products if COUPANG_CATEGORY_REFRESH_INTERVAL is set."""
+    global category_refresher
+    if config.category_refresh_interval > 0 and category_refresher is None:
+        from src.category_refresher import CategoryRefresher
+
+        if not _acquire_refresher_lock():
+            logger.info("Category best products are prefetched by another process sharing COUPANG_RATE_LIMIT_DB")
+            return
+
+        category_refresher = CategoryRefresher(
+            client,
+            interval=config.category_refresh_interval,
+            budget_share=config.category_refresh_budget_share,
+            rate_per_minute=config.rate_limit_bestcategories
+        )
+        category_refresher.start()
+        logger.info(
+            f"Refreshing best products for {len(category_refresher.category_ids)} categories "
+            f"every {category_refresher.interval:.0f}s"
+        )
+
+
 async def cleanup():
     """Cleanup resources on server shutdown."""
-    global client
+    global client, refresher_lock
+    if warmup_task and not warmup_task.done():
+        warmup_task.cancel()
+    if category_refresher:
+        await category_refresher.stop()
+    if refresher_lock:
+        refresher_lock.close()
+        refresher_lock = None
     if client:
         await client.close()
         logger.info("Coupang client closed")
 
 
-def main():
-    """Main entry point for the MCP server."""
-    logger.info("Starting Coupang MCP Server...")
-    
+class _SessionManagerApp:
+    """ASGI app handing requests to the streamable HTTP session manager."""
+
+    def __init__(self, session_manager):
+        self.session_manager = session_manager
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.session_manager.handle_request(scope, receive, send)
+
+
+def create_http_app():
+    """
+    Create the ASGI app for the streamable HTTP transport.
+
+    All MCP sessions are served by this process and share one CoupangClient,
+    so its connection pool, caches and rate limiter are warm for every client.
+    The app's lifespan starts and cleans up the client like the stdio transport.
+
+    Returns:
+        Starlette app serving MCP at config.http_path and a /health endpoint
+    """
+    import contextlib
+
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+    from starlette.applications import Starlette
+    from starlette.responses import JSONResponse
+    from starlette.routing import Route
+
+    session_manager = StreamableHTTPSessionManager(
+        app=app,
+        json_response=config.http_json_response,
+        stateless=config.http_stateless
+    )
+
+    async def health(request):
+        """Report liveness and shared client statistics."""
+        return JSONResponse({
+            "status": "ok",
+            "client": client.get_stats() if client is not None else None,
+            "output": get_output_stats(),
+        })
+
+    @contextlib.asynccontextmanager
+    async def lifespan(starlette_app):
+        await startup()
+        try:
+            async with session_manager.run():
+                yield
+        finally:
+            await cleanup()
+
+    return Starlette(
+        routes=[
+            Route(config.http_path, endpoint=_SessionManagerApp(session_manager)),
+            Route("/health", endpoint=health, methods=["GET"]),
+        ],
+        lifespan=lifespan
+    )
+
+
+def _private_store_directory(port: int) -> str:
+    """
+    Create (or reuse) the per-user directory for the shared worker stores.
+
+    Uses $XDG_RUNTIME_DIR/coupang-mcp-<port>, or ~/.cache/coupang-mcp/<port>
+    when no runtime directory is set. The directory must be owned by the
+    current user and closed to everyone else, since other local users could
+    otherwise pre-create it and read or poison the cache and rate limits.
+
+    Args:
+        port: HTTP port of the server
+
+    Returns:
+        Path of the directory
+
+    Raises:
+        PermissionError: If the directory belongs to another user or is open to other users
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        directory = os.path.join(runtime_dir, f"coupang-mcp-{port}")
+    else:
+        directory = os.path.join(os.path.expanduser("~"), ".cache", "coupang-mcp", str(port))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f"Shared store directory is not a directory: {directory}")
+    if hasattr(os, "getuid") and info.st_uid != os.getuid():
+        raise PermissionError(f"Shared store directory is owned by another user: {directory}")
+    if info.st_mode & 0o077:
+        raise PermissionError(
+            f"Shared store directory is accessible to other users (mode {stat.S_IMODE(info.st_mode):o}), "
+            f"run chmod 700 {directory} or set COUPANG_RATE_LIMIT_DB and COUPANG_DISK_CACHE_PATH"
+        )
+    return directory
+
+
+def share_local_stores(port: int) -> Dict[str, str]:
+    """
+    Point worker processes at shared SQLite stores.
+
+    Sets COUPANG_RATE_LIMIT_DB and COUPANG_DISK_CACHE_PATH, unless already
+    configured, to files in a private per-user, per-port directory (see
+    _private_store_directory), so all workers enforce one set of rate limits
+    and answer each other's cache misses. Workers read them when they load
+    the config.
+
+    Args:
+        port: HTTP port of the server (keeps servers on different ports apart)
+
+    Returns:
+        Mapping of environment variable to the path the workers will use
+
+    Raises:
+        PermissionError: If the default directory is not private to the current user
+    """
+    files = {"COUPANG_RATE_LIMIT_DB": "rate_limit.db", "COUPANG_DISK_CACHE_PATH": "responses.db"}
+    missing = [name for name in files if not os.environ.get(name)]
+    if missing:
+        directory = _private_store_directory(port)
+        for name in missing:
+            os.environ[name] = os.path.join(directory, files[name])
+    return {name: os.environ[name] for name in files}
+
+
+def main(argv: list[str] = None):
+    """
+    Main entry point for the MCP server.
+
+    Args:
+        argv: Command line arguments (sys.argv[1:] if not provided)
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="coupang-mcp-server", description="Coupang MCP Server")
+    parser.add_argument(
+        "--transport", choices=["stdio", "http"],
+        help="stdio: one process per client (default); http: streamable HTTP shared by many clients"
+    )
+    parser.add_argument("--host", help="HTTP bind address")
+    parser.add_argument("--port", type=int, help="HTTP port")
+    parser.add_argument(
+        "--workers", type=int,
+        help="HTTP worker processes sharing the port, rate limits and disk cache (http transport only)"
+    )
+    args = parser.parse_args(argv)
+
+    # Defaults come from the config, which is only loaded once --help and usage errors are ruled out
+    args.transport = args.transport or config.transport
+    args.host = args.host or config.http_host
+    args.port = args.port or config.http_port
+    args.workers = args.workers if args.workers is not None else config.http_workers
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.workers > 1 and args.transport != "http":
+        parser.error("--workers requires --transport http")
+
+    logger.info(f"Starting Coupang MCP Server ({args.transport})...")
+
+    if args.transport == "http":
+        import uvicorn
+
+        logger.info(f"Serving MCP at http://{args.host}:{args.port}{config.http_path}")
+        if args.workers == 1:
+            uvicorn.run(create_http_app(), host=args.host, port=args.port, log_level="info")
+            return
+
+        # Workers are separate processes, started from the app factory with the shared stores in their environment
+        try:
+            shared = share_local_stores(args.port)
+        except PermissionError as e:
+            parser.error(str(e))
+        for name, path in shared.items():
+            logger.info(f"Workers share {name}={path}")
+        # A session lives in the worker that created it, and a client's next request may land on another one
+        if not (config.http_stateless and config.http_json_response):
+            logger.info("Workers serve stateless JSON responses (COUPANG_MCP_STATELESS and COUPANG_MCP_JSON_RESPONSE on)")
+        os.environ["COUPANG_MCP_STATELESS"] = "true"
+        os.environ["COUPANG_MCP_JSON_RESPONSE"] = "true"
+        uvicorn.run(
+            "src.server:create_http_app",
+            factory=True,
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            log_level="info"
+        )
+        return
+
     # Run server
     async def run():
         from mcp.server.stdio import stdio_server
-        async with stdio_server() as (read_stream, write_stream):
-            await app.run(
-                read_stream,
-                write_stream,
-                app.create_initialization_options()
-            )
+        await startup(defer_client=True)
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await app.run(
+                    read_stream,
+                    write_stream,
+                    app.create_initialization_options()
+                )
+        finally:
+            await cleanup()
     
     try:
         asyncio.run(run())
@@ -0,0 +1,202 @@
+"""
+Compact output formats for tool responses.
+
+Renders product lists and deeplinks as minimal JSON or a tab-separated
+table with only the requested fields, for agents that post-process results.
+"""
+
+import json
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from src.models.product import DeepLink
+
+
+# Output formats: human-readable text (default), JSON objects, or a header + rows table
+OUTPUT_FORMATS = ("text", "compact_json", "table")
+
+# Output field name -> product attribute
+PRODUCT_FIELDS = {
+    "id": "product_id",
+    "name": "product_name",
+    "price": "product_price",
+    "url": "product_url",
+    "image": "product_image",
+    "category": "category_name",
+    "rocket": "is_rocket",
+    "free_shipping": "is_free_shipping",
+    "discount": "discount_rate",
+    "original_price": "original_price",
+}
+
+# Fields included when none are requested (what the text format shows)
+DEFAULT_FIELDS = ("id", "name", "price", "rocket", "free_shipping", "discount", "url")
+
+# Deeplink output fields
+DEEPLINK_FIELDS = ("url", "short", "landing")
+
+
+def validate_output_options(
+    output_format: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None
+) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Validate output options from tool arguments.
+
+    Args:
+        output_format: "text", "compact_json" or "table" (text if not provided)
+        fields: Product fields to include (DEFAULT_FIELDS if not provided)
+
+    Returns:
+        (output format, product fields) tuple
+
+    Raises:
+        ValueError: If the format or a field is unknown, or fields is not a list of names
+    """
+    output_format = output_format or "text"
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output_format: {output_format}. Choose from: {', '.join(OUTPUT_FORMATS)}")
+
+    if fields is None:
+        return output_format, DEFAULT_FIELDS
+    # A bare string would otherwise be checked character by character
+    if not isinstance(fields, (list, tuple)) or not all(isinstance(field, str) for field in fields):
+        raise ValueError(
+            'fields must be a list of field names, e.g. ["id", "price"]. '
+            f"Choose from: {', '.join(PRODUCT_FIELDS)}"
+        )
+    if not fields:
+        return output_format, DEFAULT_FIELDS
+    unknown = [field for field in fields if field not in PRODUCT_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Choose from: {', '.join(PRODUCT_FIELDS)}")
+    return output_format, tuple(dict.fromkeys(fields))
+
+
+def _dumps(value: Any) -> str:
+    """Serialize JSON without whitespace or ASCII escaping."""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _cell(value: Any) -> str:
+    """Render a table cell: missing values and false flags empty, true flags as 1."""
+    if value is None or value is False:
+        return ""
+    if value is True:
+        return "1"
+    return str(value).replace("\t", " ").replace("\n", " ")
+
+
+def _table(header: Sequence[str], rows: Iterable[Sequence[Any]]) -> List[str]:
+    """Render tab-separated lines: a header, then one line per row."""
+    lines = ["\t".join(header)]
+    for row in rows:
+        lines.append("\t".join(_cell(value) for value in row))
+    return lines
+
+
+def format_products(
+    products: Iterable[Any],
+    output_format: str,
+    fields: Sequence[str] = DEFAULT_FIELDS,
+    meta: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Render products in a compact output format.
+
+    compact_json emits {..meta, "count": n, "products": [{field: value}]},
+    leaving out missing values and false flags. table emits meta as
+    "# key: value" lines, then a tab-separated header and one row per product
+    (missing values and false flags empty, true flags as 1).
+
+    Args:
+        products: Products (Product, ProductRecord or a ProductBatch)
+        output_format: "compact_json" or "table"
+        fields: Output fields to include (see PRODUCT_FIELDS)
+        meta: Context such as keyword or category, emitted before the products
+
+    Returns:
+        Rendered string
+
+    Example:
+        >>> format_products(products, "table", fields=("id", "price"), meta={"keyword": "laptop"})
+        '# keyword: laptop\\nid\\tprice\\n123\\t1500000'
+    """
+    attributes = [PRODUCT_FIELDS[field] for field in fields]
+    rows = [tuple(getattr(product, attribute) for attribute in attributes) for product in products]
+    meta = meta or {}
+
+    if output_format == "table":
+        lines = [f"# {key}: {value}" for key, value in meta.items()]
+        return "\n".join(lines + _table(fields, rows))
+
+    return _dumps({
+        **meta,
+        "count": len(rows),
+        "products": [
+            {field: value for field, value in zip(fields, row) if value is not None and value is not False}
+            for row in rows
+        ],
+    })
+
+
+def format_product_groups(
+    groups: Dict[str, Any],
+    output_format: str,
+    fields: Sequence[str] = DEFAULT_FIELDS
+) -> str:
+    """
+    Render products grouped by keyword in a compact output format.
+
+    Args:
+        groups: Keyword -> products, or -> the exception raised for the keyword
+        output_format: "compact_json" or "table"
+        fields: Output fields to include (see PRODUCT_FIELDS)
+
+    Returns:
+        Rendered string (JSON array with one object per keyword, or one table per keyword)
+    """
+    rendered = []
+    for keyword, products in groups.items():
+        if isinstance(products, Exception):
+            meta = {"keyword": keyword, "error": str(products)}
+            products = ()
+        else:
+            meta = {"keyword": keyword}
+        rendered.append(format_products(products, output_format, fields, meta))
+
+    if output_format == "table":
+        return "\n\n".join(rendered)
+    return "[" + ",".join(rendered) + "]"
+
+
+def format_deeplinks(
+    links: Sequence["DeepLink"],
+    errors: Dict[str, str],
+    output_format: str
+) -> str:
+    """
+    Render deeplink results in a compact output format.
+
+    Args:
+        links: Converted deeplinks
+        errors: Unconverted URL -> error message
+        output_format: "compact_json" or "table"
+
+    Returns:
+        Rendered string with url, short and landing per link, plus errors
+    """
+    rows = [(link.original_url, link.shorten_url, link.landing_url) for link in links]
+
+    if output_format == "table":
+        lines = _table(DEEPLINK_FIELDS, rows)
+        lines.extend(f"# error: {url}: {error}" for url, error in errors.items())
+        return "\n".join(lines)
+
+    result: Dict[str, Any] = {
+        "count": len(rows),
+        "links": [dict(zip(DEEPLINK_FIELDS, row)) for row in rows],
+    }
+    if errors:
+        result["errors"] = errors
+    return _dumps(result)
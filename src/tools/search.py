@@ -4,8 +4,10 @@ Product search tool implementation.
 Provides functionality for searching Coupang products by keyword.
 """
 
-from typing import List
-from src.models.product import Product, SearchParams
+from typing import List, Union
+from src.models.product import Product, ProductFilter, SearchParams
+from src.models.record import ProductRecord
+from src.models.batch import ProductBatch
 
 
 def format_search_results(products: List[Product], keyword: str) -> str:
@@ -79,12 +81,15 @@ def validate_search_params(keyword: str, limit: int) -> SearchParams:
     return SearchParams(keyword=keyword, limit=limit)
 
 
-def get_search_summary(products: List[Product]) -> dict:
+def get_search_summary(products: Union[List[Product], List[ProductRecord], ProductBatch]) -> dict:
     """
     Generate summary statistics from search results.
 
+    Lists are summarized in one pass over the products; a ProductBatch
+    returns the statistics it computed when it was built.
+
     Args:
-        products: List of Product objects
+        products: List of Product/ProductRecord objects or a ProductBatch
 
     Returns:
         Dictionary with summary statistics
@@ -94,6 +99,9 @@ def get_search_summary(products: List[Product]) -> dict:
         >>> summary = get_search_summary(products)
         >>> print(f"Average price: {summary['avg_price']}원")
     """
+    if isinstance(products, ProductBatch):
+        return products.summary()
+
     if not products:
         return {
             "total_count": 0,
@@ -104,15 +112,59 @@ def get_search_summary(products: List[Product]) -> dict:
             "free_shipping_count": 0
         }
 
-    prices = [p.product_price for p in products]
-    rocket_count = sum(1 for p in products if p.is_rocket)
-    free_shipping_count = sum(1 for p in products if p.is_free_shipping)
+    prices = []
+    rocket_count = 0
+    free_shipping_count = 0
+    for product in products:
+        prices.append(product.product_price)
+        if product.is_rocket:
+            rocket_count += 1
+        if product.is_free_shipping:
+            free_shipping_count += 1
 
     return {
-        "total_count": len(products),
+        "total_count": len(prices),
         "avg_price": sum(prices) // len(prices),
         "min_price": min(prices),
         "max_price": max(prices),
         "rocket_count": rocket_count,
         "free_shipping_count": free_shipping_count
     }
+
+
+def refine_products(
+    products: Union[List[Product], List[ProductRecord], ProductBatch],
+    filters: ProductFilter,
+    limit: int
+) -> ProductBatch:
+    """
+    Filter, sort and truncate products server-side.
+
+    Runs over a columnar ProductBatch; with a sort key only the first `limit`
+    products are selected (partial sort) instead of sorting everything.
+
+    Args:
+        products: Candidate products (list or ProductBatch)
+        filters: Filter and sort options
+        limit: Maximum number of products to keep
+
+    Returns:
+        ProductBatch with at most `limit` matching products
+
+    Example:
+        >>> filters = ProductFilter(max_price=50000, rocket_only=True, sort_by="price")
+        >>> cheapest = refine_products(products, filters, limit=5)
+    """
+    if not isinstance(products, ProductBatch):
+        products = ProductBatch.from_products(products)
+
+    matching = products.filter(
+        min_price=filters.min_price,
+        max_price=filters.max_price,
+        rocket=True if filters.rocket_only else None,
+        free_shipping=True if filters.free_shipping_only else None,
+        min_discount=filters.min_discount
+    )
+    if filters.sort_by is not None:
+        return matching.top_k(limit, by=filters.sort_by, descending=filters.sort_order == "desc")
+    return matching[:limit]
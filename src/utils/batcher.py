@@ -0,0 +1,125 @@
+"""
+Micro-batching of concurrent requests.
+
+Items submitted by concurrent callers within a short window are merged into
+one call per group, and every caller receives the merged result.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+
+class _PendingBatch:
+    """Items collected for one group, waiting to be flushed."""
+
+    __slots__ = ("items", "future", "timer")
+
+    def __init__(self, future: asyncio.Future):
+        self.items: List[Any] = []
+        self.future = future
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class MicroBatcher:
+    """
+    Merges concurrent submissions per group into one call.
+
+    The first submission for a group opens a batch that is flushed after
+    `max_wait` seconds, or as soon as it holds `max_batch_size` items. All
+    callers of a batch await the same call and receive the same result or
+    exception, so each caller picks its own items out of the merged result.
+    A caller being cancelled does not cancel the shared call.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[Hashable, List[Any]], Awaitable[Any]],
+        max_wait: float = 0.005,
+        max_batch_size: int = 100
+    ):
+        """
+        Initialize batcher.
+
+        Args:
+            flush: Async callable run with (group, merged items) for each batch
+            max_wait: Seconds a batch stays open for more submissions (0 = no batching)
+            max_batch_size: Item count at which a batch is flushed immediately
+        """
+        self._flush = flush
+        self.max_wait = max_wait
+        self.max_batch_size = max(max_batch_size, 1)
+        self._pending: Dict[Hashable, _PendingBatch] = {}
+
+        self.submissions = 0
+        self.batches = 0
+
+    async def submit(self, group: Hashable, items: List[Any]) -> Any:
+        """
+        Add items to the group's open batch and wait for its result.
+
+        Args:
+            group: Batch group; only submissions of the same group are merged
+            items: Items to add
+
+        Returns:
+            Result of the flush call for the merged batch
+        """
+        self.submissions += 1
+        if self.max_wait <= 0:
+            self.batches += 1
+            return await self._flush(group, list(items))
+
+        batch = self._pending.get(group)
+        if batch is not None and len(batch.items) + len(items) > self.max_batch_size:
+            self._flush_now(group)
+            batch = None
+
+        if batch is None:
+            batch = _PendingBatch(asyncio.get_running_loop().create_future())
+            # Callers may all be cancelled; mark the outcome as retrieved
+            batch.future.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self._pending[group] = batch
+            batch.timer = asyncio.get_running_loop().call_later(self.max_wait, self._flush_now, group)
+
+        batch.items.extend(items)
+        future = batch.future
+        if len(batch.items) >= self.max_batch_size:
+            self._flush_now(group)
+
+        return await asyncio.shield(future)
+
+    def _flush_now(self, group: Hashable) -> None:
+        """Close the group's open batch and start its flush call."""
+        batch = self._pending.pop(group, None)
+        if batch is None:
+            return
+        batch.timer.cancel()
+        self.batches += 1
+
+        task = asyncio.ensure_future(self._flush(group, batch.items))
+        task.add_done_callback(lambda done: self._resolve(batch.future, done))
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, task: asyncio.Task) -> None:
+        """Hand the flush call's outcome to the batch's callers."""
+        if future.done():
+            return
+        if task.cancelled():
+            future.cancel()
+        elif task.exception() is not None:
+            future.set_exception(task.exception())
+        else:
+            future.set_result(task.result())
+
+    def stats(self) -> dict:
+        """
+        Get batching statistics.
+
+        Returns:
+            Dictionary with open batches, submissions and executed batch counts
+        """
+        return {
+            "open": len(self._pending),
+            "submissions": self.submissions,
+            "batches": self.batches,
+        }
@@ -0,0 +1,191 @@
+"""
+In-memory result cache for Coupang API responses.
+
+Provides a bounded TTL + LRU cache with hit/miss counters.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Bounded cache with per-entry expiry and least-recently-used eviction.
+
+    All operations are synchronous and guarded by a lock, so the cache is
+    safe to share between coroutines and worker threads.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_entries: int = 256,
+        stale_ttl: float = 0.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Default time-to-live in seconds (0 disables caching)
+            max_entries: Maximum number of entries kept before LRU eviction
+            stale_ttl: Seconds an expired entry is kept for get_stale
+            clock: Monotonic time source (overridable for tests)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stale_ttl = stale_ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.ttl > 0
+
+    def get(
+        self,
+        key: Hashable,
+        accept: Optional[Callable[[Any], bool]] = None
+    ) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            accept: Optional predicate; a stored value it rejects counts as a miss
+                but is kept in the cache
+
+        Returns:
+            Cached value, or None if missing, expired or not accepted
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = entry
+            now = self._clock()
+            if expires_at <= now:
+                if expires_at + self.stale_ttl <= now:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            if accept is not None and not accept(value):
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def get_stale(
+        self,
+        key: Hashable,
+        accept: Optional[Callable[[Any], bool]] = None,
+        max_staleness: Optional[float] = None
+    ) -> Optional[Any]:
+        """
+        Get a value even if expired, as long as it is within the stale window.
+
+        Used as a fallback when fresh data cannot be fetched, and to serve
+        expired entries while they are refreshed in the background.
+
+        Args:
+            key: Cache key
+            accept: Optional predicate the stored value must satisfy
+            max_staleness: Maximum seconds past expiry (limited by the stale window)
+
+        Returns:
+            Cached value, or None if missing, too stale or not accepted
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            now = self._clock()
+            if expires_at + self.stale_ttl <= now:
+                del self._entries[key]
+                return None
+            if max_staleness is not None and expires_at + max_staleness < now:
+                return None
+
+            if accept is not None and not accept(value):
+                return None
+
+            self.stale_hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time-to-live in seconds (uses cache default if not provided)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, capacity, hits, misses, evictions and hit rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale_hits": self.stale_hits,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        """Number of stored entries (including expired ones not yet purged)."""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"TTLCache(size={len(self._entries)}, max_entries={self.max_entries}, ttl={self.ttl})"
@@ -0,0 +1,142 @@
+"""
+Circuit breaker for the Coupang API gateway.
+
+Stops sending requests to an endpoint family after repeated upstream
+failures, so a degraded gateway fails fast instead of tying up every call.
+"""
+
+import time
+from typing import Callable
+
+
+# Circuit states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker.
+
+    While closed, requests flow and consecutive failures are counted. After
+    `failure_threshold` consecutive failures the circuit opens and requests
+    are refused for `recovery_timeout` seconds. It then becomes half-open and
+    lets up to `half_open_max_calls` probe requests through: a successful
+    probe closes the circuit, a failed one opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open before probing
+            half_open_max_calls: Concurrent probe requests allowed while half-open
+            clock: Monotonic time source (overridable for tests)
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Current state, moving from open to half-open once the recovery timeout passes."""
+        if self._state == OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+        return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Ask permission to send a request.
+
+        Every granted request must be followed by record_success,
+        record_failure or release.
+
+        Returns:
+            True if the request may be sent
+        """
+        state = self.state
+        if state == CLOSED:
+            return True
+        if state == HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+            self._probes_in_flight += 1
+            return True
+
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        """Record a request that reached a healthy upstream."""
+        if self._state == HALF_OPEN:
+            self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+        self._state = CLOSED
+        self._consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        """Record an upstream failure (5xx, network error or timeout)."""
+        if self._state == HALF_OPEN:
+            self._open()
+            return
+
+        self._consecutive_failures += 1
+        if self._state == CLOSED and self._consecutive_failures >= self.failure_threshold:
+            self._open()
+
+    def release(self) -> None:
+        """Give back a granted request that was never sent."""
+        if self._state == HALF_OPEN:
+            self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+
+    def time_until_probe(self) -> float:
+        """
+        Get seconds until the circuit will let a probe through.
+
+        Returns:
+            Seconds remaining while open, otherwise 0
+        """
+        if self.state != OPEN:
+            return 0.0
+        return max(self._opened_at + self.recovery_timeout - self._clock(), 0.0)
+
+    def _open(self) -> None:
+        """Open the circuit."""
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._probes_in_flight = 0
+        self.times_opened += 1
+
+    def stats(self) -> dict:
+        """
+        Get circuit statistics.
+
+        Returns:
+            Dictionary with state, consecutive failures and counters
+        """
+        return {
+            "state": self.state,
+            "consecutive_failures": self._consecutive_failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "retry_in": round(self.time_until_probe(), 3),
+        }
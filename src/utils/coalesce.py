@@ -0,0 +1,94 @@
+"""
+Single-flight request coalescing.
+
+Concurrent callers asking for the same request share one in-flight call.
+"""
+
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+def make_request_key(
+    method: str,
+    path: str,
+    query: str = "",
+    json_body: Optional[Any] = None
+) -> tuple:
+    """
+    Build a coalescing key for an API request.
+
+    Args:
+        method: HTTP method (GET, POST, etc.)
+        path: API endpoint path
+        query: URL query string (without leading '?')
+        json_body: JSON request body, hashed so large bodies stay cheap to compare
+
+    Returns:
+        Hashable (method, path, query, body hash) tuple
+    """
+    body_hash = None
+    if json_body is not None:
+        encoded = json.dumps(json_body, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        body_hash = hashlib.sha256(encoded).hexdigest()
+
+    return (method.upper(), path, query, body_hash)
+
+
+class RequestCoalescer:
+    """
+    Shares one in-flight call between concurrent identical requests.
+
+    The first caller for a key starts the call as a task; callers arriving
+    while it runs await the same task and receive the same result or
+    exception. A caller being cancelled does not cancel the shared call.
+    """
+
+    def __init__(self):
+        """Initialize coalescer with no in-flight calls."""
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.folded = 0
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a call, joining an identical in-flight call if there is one.
+
+        Args:
+            key: Request key (see make_request_key)
+            factory: Zero-argument callable creating the awaitable to run
+
+        Returns:
+            Result of the shared call
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+            self.calls += 1
+        else:
+            self.folded += 1
+
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a completed call and mark its exception as retrieved."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dictionary with in-flight, executed and folded call counts
+        """
+        return {
+            "in_flight": len(self._in_flight),
+            "calls": self.calls,
+            "folded": self.folded,
+        }
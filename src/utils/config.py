@@ -1,13 +1,16 @@
 """
 Configuration management for Coupang MCP Server.
 
-Loads environment variables and provides configuration settings.
+Loads environment variables and provides configuration settings. The
+configuration is loaded on first use, so importing modules that depend on
+it reads no files and raises nothing.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
-from typing import Optional
+from typing import Any, Optional
 
 
 class Config:
@@ -28,6 +31,113 @@ class Config:
         # API base URL
         self.api_base_url: str = "https://api-gateway.coupang.com"
 
+        # Search result cache (TTL of 0 disables caching)
+        self.search_cache_ttl: float = float(os.getenv("COUPANG_SEARCH_CACHE_TTL", "300"))
+        self.search_cache_max_entries: int = int(os.getenv("COUPANG_SEARCH_CACHE_MAX_ENTRIES", "256"))
+        # Expired searches are kept this long to serve while the API circuit is open
+        self.search_cache_stale_ttl: float = float(os.getenv("COUPANG_SEARCH_CACHE_STALE_TTL", "3600"))
+        # Fetch the maximum page (limit=100) on a cache miss so later limits are served locally
+        self.search_overfetch: bool = os.getenv("COUPANG_SEARCH_OVERFETCH", "false").lower() in ("1", "true", "yes")
+
+        # Category best products cache, keyed on category ID (TTL of 0 disables caching)
+        self.category_cache_ttl: float = float(os.getenv("COUPANG_CATEGORY_CACHE_TTL", "600"))
+        self.category_cache_max_entries: int = int(os.getenv("COUPANG_CATEGORY_CACHE_MAX_ENTRIES", "64"))
+        self.category_cache_stale_ttl: float = float(os.getenv("COUPANG_CATEGORY_CACHE_STALE_TTL", "3600"))
+
+        # Background prefetch of best products for every category (interval in seconds, 0 disables)
+        self.category_refresh_interval: float = float(os.getenv("COUPANG_CATEGORY_REFRESH_INTERVAL", "0"))
+        # Share of the bestcategories rate limit the prefetch may use
+        self.category_refresh_budget_share: float = float(os.getenv("COUPANG_CATEGORY_REFRESH_BUDGET_SHARE", "0.2"))
+
+        # Seconds past expiry a cached search or category result is still served
+        # while it is refreshed in the background (0 disables stale-while-revalidate)
+        self.cache_swr_window: float = float(os.getenv("COUPANG_CACHE_SWR_WINDOW", "300"))
+
+        # Persistent response cache shared by local server processes (disabled if no path is set)
+        self.disk_cache_path: Optional[str] = os.getenv("COUPANG_DISK_CACHE_PATH") or None
+        self.disk_cache_max_mb: float = float(os.getenv("COUPANG_DISK_CACHE_MAX_MB", "64"))
+        # Entry lifetime per endpoint family in seconds (0 disables disk caching for the family)
+        self.disk_cache_ttl_search: float = float(os.getenv("COUPANG_DISK_CACHE_TTL_SEARCH", "3600"))
+        self.disk_cache_ttl_bestcategories: float = float(os.getenv("COUPANG_DISK_CACHE_TTL_BESTCATEGORIES", "3600"))
+        self.disk_cache_ttl_product: float = float(os.getenv("COUPANG_DISK_CACHE_TTL_PRODUCT", "3600"))
+
+        # Persistent memo of created deeplinks (empty = disabled); entries live for DEEPLINK_STORE_TTL seconds (0 = forever)
+        self.deeplink_store_path: str = os.getenv("COUPANG_DEEPLINK_STORE_PATH", "")
+        self.deeplink_store_ttl: float = float(os.getenv("COUPANG_DEEPLINK_STORE_TTL", "0"))
+
+        # URLs per deeplink API request (API maximum: 20) and chunks sent at once
+        self.deeplink_chunk_size: int = int(os.getenv("COUPANG_DEEPLINK_CHUNK_SIZE", "20"))
+        self.deeplink_max_concurrency: int = int(os.getenv("COUPANG_DEEPLINK_MAX_CONCURRENCY", "4"))
+
+        # Concurrent deeplink calls arriving within this many ms are merged per sub ID (0 = disabled),
+        # up to this many URLs per merged batch
+        self.deeplink_batch_window_ms: float = float(os.getenv("COUPANG_DEEPLINK_BATCH_WINDOW_MS", "0"))
+        self.deeplink_batch_max_urls: int = int(os.getenv("COUPANG_DEEPLINK_BATCH_MAX_URLS", "100"))
+
+        # Client-side rate limits in calls per minute (0 disables the limit)
+        self.rate_limit_search: float = float(os.getenv("COUPANG_RATE_LIMIT_SEARCH", "50"))
+        self.rate_limit_bestcategories: float = float(os.getenv("COUPANG_RATE_LIMIT_BESTCATEGORIES", "50"))
+        self.rate_limit_product: float = float(os.getenv("COUPANG_RATE_LIMIT_PRODUCT", "50"))
+        self.rate_limit_deeplink: float = float(os.getenv("COUPANG_RATE_LIMIT_DEEPLINK", "50"))
+        # Maximum seconds a request may queue for a rate-limit slot
+        self.rate_limit_max_wait: float = float(os.getenv("COUPANG_RATE_LIMIT_MAX_WAIT", "30"))
+        # SQLite file shared by local server processes to enforce one combined budget
+        self.rate_limit_db: Optional[str] = os.getenv("COUPANG_RATE_LIMIT_DB") or None
+
+        # Retries for throttled (429) and transient (5xx, network) failures
+        self.retry_max_attempts: int = int(os.getenv("COUPANG_RETRY_MAX_ATTEMPTS", "3"))
+        self.retry_base_delay: float = float(os.getenv("COUPANG_RETRY_BASE_DELAY", "0.25"))
+        self.retry_max_delay: float = float(os.getenv("COUPANG_RETRY_MAX_DELAY", "8"))
+        # POST (deeplink) requests are not idempotent, so retrying them is opt-in
+        self.retry_post: bool = os.getenv("COUPANG_RETRY_POST", "false").lower() in ("1", "true", "yes")
+
+        # HTTP connection pool
+        self.http_pool_limit: int = int(os.getenv("COUPANG_HTTP_POOL_LIMIT", "100"))
+        self.http_pool_limit_per_host: int = int(os.getenv("COUPANG_HTTP_POOL_LIMIT_PER_HOST", "20"))
+        self.http_keepalive_timeout: float = float(os.getenv("COUPANG_HTTP_KEEPALIVE_TIMEOUT", "60"))
+        self.http_dns_cache_ttl: int = int(os.getenv("COUPANG_HTTP_DNS_CACHE_TTL", "300"))
+        self.http_happy_eyeballs_delay: float = float(os.getenv("COUPANG_HTTP_HAPPY_EYEBALLS_DELAY", "0.25"))
+        # Connections pre-opened to the API gateway at server startup (0 disables warm-up)
+        self.http_warmup_connections: int = int(os.getenv("COUPANG_HTTP_WARMUP_CONNECTIONS", "2"))
+
+        # HTTP timeouts in seconds; per-endpoint totals fall back to the default total (0 = use default)
+        self.http_connect_timeout: float = float(os.getenv("COUPANG_HTTP_CONNECT_TIMEOUT", "5"))
+        self.http_read_timeout: float = float(os.getenv("COUPANG_HTTP_READ_TIMEOUT", "15"))
+        self.http_total_timeout: float = float(os.getenv("COUPANG_HTTP_TOTAL_TIMEOUT", "20"))
+        self.http_timeout_search: float = float(os.getenv("COUPANG_HTTP_TIMEOUT_SEARCH", "0"))
+        self.http_timeout_bestcategories: float = float(os.getenv("COUPANG_HTTP_TIMEOUT_BESTCATEGORIES", "0"))
+        self.http_timeout_product: float = float(os.getenv("COUPANG_HTTP_TIMEOUT_PRODUCT", "0"))
+        self.http_timeout_deeplink: float = float(os.getenv("COUPANG_HTTP_TIMEOUT_DEEPLINK", "0"))
+
+        # Circuit breaker per endpoint family
+        self.circuit_failure_threshold: int = int(os.getenv("COUPANG_CIRCUIT_FAILURE_THRESHOLD", "5"))
+        self.circuit_recovery_timeout: float = float(os.getenv("COUPANG_CIRCUIT_RECOVERY_TIMEOUT", "30"))
+
+        # Response JSON decoder: auto (orjson/msgspec if installed), orjson, msgspec or json
+        self.json_decoder: str = os.getenv("COUPANG_JSON_DECODER", "auto")
+
+        # Product list return type: models (pydantic Product), records (compact ProductRecord) or batch (columnar ProductBatch)
+        self.product_format: str = os.getenv("COUPANG_PRODUCT_FORMAT", "models")
+
+        # Validate search/category response bytes straight into Product objects (models format only)
+        self.typed_decode: bool = os.getenv("COUPANG_TYPED_DECODE", "false").lower() in ("1", "true", "yes")
+
+        # Overall time budget for one MCP tool call, including waits and retries (0 = unlimited)
+        self.tool_timeout: float = float(os.getenv("COUPANG_TOOL_TIMEOUT", "30"))
+
+        # MCP transport: stdio (one process per client) or http (streamable HTTP, many clients share one process)
+        self.transport: str = os.getenv("COUPANG_MCP_TRANSPORT", "stdio")
+        self.http_host: str = os.getenv("COUPANG_MCP_HOST", "127.0.0.1")
+        self.http_port: int = int(os.getenv("COUPANG_MCP_PORT", "8000"))
+        self.http_path: str = os.getenv("COUPANG_MCP_PATH", "/mcp")
+
+        # HTTP worker processes sharing the listening socket (rate limits and disk cache are shared through SQLite)
+        self.http_workers: int = int(os.getenv("COUPANG_MCP_WORKERS", "1"))
+
+        # Streamable HTTP: plain JSON responses instead of SSE streams, and no per-client sessions
+        self.http_json_response: bool = os.getenv("COUPANG_MCP_JSON_RESPONSE", "false").lower() in ("1", "true", "yes")
+        self.http_stateless: bool = os.getenv("COUPANG_MCP_STATELESS", "false").lower() in ("1", "true", "yes")
+
         # Validate required credentials
         self._validate()
 
@@ -57,5 +167,43 @@ class Config:
         )
 
 
-# Global config instance
-config = Config()
+@lru_cache(maxsize=None)
+def get_config() -> Config:
+    """
+    Load the configuration on first call and return the cached instance.
+
+    Returns:
+        Shared Config instance
+
+    Raises:
+        ValueError: If required credentials are missing
+    """
+    return Config()
+
+
+class _LazyConfig:
+    """
+    Stand-in for the shared Config that loads it on first attribute access.
+
+    Attribute reads and writes are forwarded to get_config(), so modules can
+    keep `from src.utils.config import config` without loading .env or
+    validating credentials at import time.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_config(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(get_config(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(get_config(), name)
+
+    def __repr__(self) -> str:
+        return repr(get_config())
+
+
+# Global config instance (loaded on first use)
+config = _LazyConfig()
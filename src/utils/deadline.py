@@ -0,0 +1,59 @@
+"""
+Request deadlines propagated through async calls.
+
+A deadline set around a tool call is visible to every coroutine and task it
+starts, so rate-limit waits, retries and HTTP timeouts can all respect the
+caller's remaining time budget.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+
+# Absolute monotonic time by which the current operation must finish
+_deadline: ContextVar[Optional[float]] = ContextVar("coupang_deadline", default=None)
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Run a block under a deadline.
+
+    Nested scopes can only shorten an enclosing deadline, never extend it.
+
+    Args:
+        seconds: Time budget for the block (None or <= 0 leaves the deadline unchanged)
+
+    Example:
+        >>> with deadline_scope(30):
+        ...     products = await client.search_products("laptop")
+    """
+    if seconds is None or seconds <= 0:
+        yield
+        return
+
+    new_deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None and current < new_deadline:
+        new_deadline = current
+
+    token = _deadline.set(new_deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """
+    Get the time left before the current deadline.
+
+    Returns:
+        Seconds remaining (may be negative once expired), or None without a deadline
+    """
+    current = _deadline.get()
+    if current is None:
+        return None
+    return current - time.monotonic()
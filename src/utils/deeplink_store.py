@@ -0,0 +1,247 @@
+"""
+Persistent memo of created deeplinks.
+
+The shortened link for a product URL and sub ID never changes, so converted
+links are stored in a SQLite database (WAL mode) keyed on the canonical URL
+and only unseen URLs have to be sent to the deeplink API.
+"""
+
+import asyncio
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+
+# Query parameters that only carry tracking information (matched case-insensitively)
+TRACKING_PARAMS = frozenset({
+    "traceid", "src", "spec", "addtag", "ctag", "lptag", "subid", "pagekey",
+    "wpcid", "wpcvendoritemid", "gclid", "fbclid",
+})
+
+# Search context carried on product page links; meaningful on search pages themselves
+PRODUCT_CONTEXT_PARAMS = frozenset({
+    "q", "searchid", "rank", "searchrank", "itemscount", "isaddedcart", "sourcetype", "clicktype",
+})
+
+# Mobile web product pages and their desktop equivalents
+_MOBILE_PRODUCT_PATH = re.compile(r"^/vm/products/")
+
+# (shortenUrl, landingUrl)
+Link = Tuple[str, str]
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a Coupang URL so equivalent links share one memo entry.
+
+    Lowercases scheme and host, upgrades to https, maps coupang.com and the
+    mobile site to www.coupang.com, collapses duplicate and trailing slashes,
+    drops the fragment and tracking parameters (utm_*, traceid, ...), drops
+    search context (q, rank, ...) from product pages and sorts the remaining
+    query parameters.
+
+    Args:
+        url: Coupang URL as given by the caller
+
+    Returns:
+        Canonical URL
+
+    Example:
+        >>> canonicalize_url("HTTP://m.coupang.com/vm/products/1?traceid=x&itemId=2")
+        'https://www.coupang.com/vp/products/1?itemId=2'
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower() or "https"
+    if scheme == "http":
+        scheme = "https"
+
+    host = (parts.hostname or "").rstrip(".")
+    path = re.sub(r"/{2,}", "/", parts.path).rstrip("/")
+    if host in ("coupang.com", "m.coupang.com"):
+        if host == "m.coupang.com":
+            path = _MOBILE_PRODUCT_PATH.sub("/vp/products/", path)
+        host = "www.coupang.com"
+    if parts.port and parts.port != 443 and parts.port != 80:
+        host = f"{host}:{parts.port}"
+
+    dropped = TRACKING_PARAMS | PRODUCT_CONTEXT_PARAMS if path.startswith("/vp/products/") else TRACKING_PARAMS
+    params = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in dropped and not name.lower().startswith("utm_")
+    )
+    return urlunsplit((scheme, host, path, urlencode(params), ""))
+
+
+class DeepLinkStore:
+    """
+    SQLite-backed memo of (canonical URL, sub ID) to created deeplinks.
+
+    Entries are also keyed on partner ID, since links carry the partner's
+    tracking code. Database work runs in a worker thread so the event loop
+    never blocks on disk I/O, and failures are logged and treated as misses.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        ttl: float = 0,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize deeplink store.
+
+        Args:
+            db_path: SQLite database file (shared by all processes using it)
+            ttl: Entry lifetime in seconds (0 = never expire)
+            clock: Wall-clock time source, comparable across processes
+        """
+        self.db_path = str(Path(db_path).expanduser())
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        # Counters for this process
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.db_path, timeout=10.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS deeplinks ("
+            "partner_id TEXT NOT NULL, sub_id TEXT NOT NULL, url TEXT NOT NULL, "
+            "shorten_url TEXT NOT NULL, landing_url TEXT NOT NULL, created_at REAL NOT NULL, "
+            "PRIMARY KEY (partner_id, sub_id, url))"
+        )
+
+    def _read(self, partner_id: str, sub_id: str, urls: list) -> Dict[str, Link]:
+        """Fetch stored links for canonical URLs."""
+        min_created = self._clock() - self.ttl if self.ttl > 0 else float("-inf")
+        found = {}
+        with self._lock:
+            # Stay well below SQLite's bound parameter limit
+            for start in range(0, len(urls), 500):
+                chunk = urls[start:start + 500]
+                rows = self._conn.execute(
+                    "SELECT url, shorten_url, landing_url FROM deeplinks "
+                    f"WHERE partner_id = ? AND sub_id = ? AND created_at > ? AND url IN ({','.join('?' * len(chunk))})",
+                    (partner_id, sub_id, min_created, *chunk)
+                )
+                for url, shorten_url, landing_url in rows:
+                    found[url] = (shorten_url, landing_url)
+        return found
+
+    def _write(self, partner_id: str, sub_id: str, links: Dict[str, Link]) -> None:
+        """Store links for canonical URLs in one transaction."""
+        with self._lock:
+            now = self._clock()
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO deeplinks "
+                    "(partner_id, sub_id, url, shorten_url, landing_url, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (partner_id, sub_id, url, shorten_url, landing_url, now)
+                        for url, (shorten_url, landing_url) in links.items()
+                    ]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    async def get_many(
+        self,
+        partner_id: str,
+        sub_id: Optional[str],
+        urls: Iterable[str]
+    ) -> Dict[str, Link]:
+        """
+        Look up stored links.
+
+        Args:
+            partner_id: Partner the links were created for
+            sub_id: Tracking sub ID (None for the default)
+            urls: Canonical URLs (see canonicalize_url)
+
+        Returns:
+            Mapping of canonical URL to (shortenUrl, landingUrl) for stored URLs
+        """
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+
+        try:
+            found = await asyncio.to_thread(self._read, partner_id, sub_id or "", urls)
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning(f"Deeplink store read failed: {e}")
+            found = {}
+
+        self.hits += len(found)
+        self.misses += len(urls) - len(found)
+        return found
+
+    async def set_many(self, partner_id: str, sub_id: Optional[str], links: Dict[str, Link]) -> None:
+        """
+        Store created links.
+
+        Args:
+            partner_id: Partner the links were created for
+            sub_id: Tracking sub ID (None for the default)
+            links: Mapping of canonical URL to (shortenUrl, landingUrl)
+        """
+        if not links:
+            return
+
+        try:
+            await asyncio.to_thread(self._write, partner_id, sub_id or "", links)
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning(f"Deeplink store write failed: {e}")
+            return
+        self.writes += len(links)
+
+    def clear(self) -> None:
+        """Remove all entries (for every process sharing the file)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM deeplinks")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> dict:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with stored entries plus this process's counters
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM deeplinks").fetchone()[0]
+
+        lookups = self.hits + self.misses
+        return {
+            "path": self.db_path,
+            "entries": entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
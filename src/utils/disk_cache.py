@@ -0,0 +1,220 @@
+"""
+Persistent response cache on local disk.
+
+Stores compressed API responses in a SQLite database (WAL mode), so cached
+results survive server restarts and are shared by all server processes on
+one host.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """
+    SQLite-backed cache of response payloads with per-family TTLs.
+
+    Payloads are zlib-compressed. Each endpoint family has its own TTL (0
+    disables caching for that family). When the stored payload size exceeds
+    `max_bytes`, expired entries and then the least recently used ones are
+    evicted. Database work runs in a worker thread so the event loop never
+    blocks on disk I/O, and failures are logged and treated as misses.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        ttls: Dict[str, float],
+        max_bytes: int = 64 * 1024 * 1024,
+        compress_level: int = 6,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize disk cache.
+
+        Args:
+            db_path: SQLite database file (shared by all processes using it)
+            ttls: Mapping of endpoint family to entry lifetime in seconds
+            max_bytes: Maximum total size of stored (compressed) payloads
+            compress_level: zlib compression level (0-9)
+            clock: Wall-clock time source, comparable across processes
+        """
+        self.db_path = str(Path(db_path).expanduser())
+        self.ttls = {family: ttl for family, ttl in ttls.items() if ttl and ttl > 0}
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        # Counters for this process
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.db_path, timeout=10.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS response_cache ("
+            "key TEXT PRIMARY KEY, family TEXT NOT NULL, expires_at REAL NOT NULL, "
+            "accessed_at REAL NOT NULL, size INTEGER NOT NULL, payload BLOB NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_response_cache_accessed ON response_cache (accessed_at)"
+        )
+
+    def enabled_for(self, family: str) -> bool:
+        """Whether responses of an endpoint family are cached."""
+        return family in self.ttls
+
+    def _read(self, key: str) -> Optional[bytes]:
+        """Fetch a live payload and mark it as recently used."""
+        with self._lock:
+            now = self._clock()
+            row = self._conn.execute(
+                "SELECT payload FROM response_cache WHERE key = ? AND expires_at > ?",
+                (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE response_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        return zlib.decompress(row[0])
+
+    def _write(self, family: str, key: str, value: bytes) -> None:
+        """Store a payload and evict entries if over the size cap."""
+        payload = zlib.compress(value, self.compress_level)
+        with self._lock:
+            now = self._clock()
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO response_cache "
+                    "(key, family, expires_at, accessed_at, size, payload) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, family, now + self.ttls[family], now, len(payload), payload)
+                )
+                evicted = self._evict(now)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        self.evictions += evicted
+
+    def _evict(self, now: float) -> int:
+        """Delete expired, then least recently used, entries until under max_bytes."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM response_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+
+        evicted = self._conn.execute(
+            "DELETE FROM response_cache WHERE expires_at <= ?", (now,)
+        ).rowcount
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM response_cache").fetchone()[0]
+
+        victims = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM response_cache ORDER BY accessed_at"
+        ):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM response_cache WHERE key = ?", victims)
+        return evicted + len(victims)
+
+    async def get(self, family: str, key: str) -> Optional[bytes]:
+        """
+        Get a cached payload.
+
+        Args:
+            family: Endpoint family of the response
+            key: Cache key
+
+        Returns:
+            Payload bytes, or None if missing, expired or the family is not cached
+        """
+        if not self.enabled_for(family):
+            return None
+
+        try:
+            value = await asyncio.to_thread(self._read, key)
+        except (sqlite3.Error, zlib.error) as e:
+            self.errors += 1
+            logger.warning(f"Disk cache read failed: {e}")
+            value = None
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, family: str, key: str, value: bytes) -> None:
+        """
+        Store a payload with the family's TTL.
+
+        Args:
+            family: Endpoint family of the response
+            key: Cache key
+            value: Payload bytes
+        """
+        if not self.enabled_for(family):
+            return
+
+        try:
+            await asyncio.to_thread(self._write, family, key, value)
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning(f"Disk cache write failed: {e}")
+            return
+        self.writes += 1
+
+    def clear(self) -> None:
+        """Remove all entries (for every process sharing the file)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM response_cache")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with stored entries and bytes plus this process's counters
+        """
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM response_cache"
+            ).fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            "path": self.db_path,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "ttls": dict(self.ttls),
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,72 @@
+"""
+Pluggable JSON decoding for API responses.
+
+Response bodies are decoded straight from bytes with the fastest available
+decoder: orjson or msgspec when installed, the standard library otherwise.
+"""
+
+import json
+from typing import Any, Callable, List
+
+
+Decoder = Callable[[bytes], Any]
+
+# Decoder names in "auto" preference order
+DECODERS = ("orjson", "msgspec", "json")
+
+
+def _load_decoder(name: str) -> Decoder:
+    """Import and return a decoder by name (raises ImportError if not installed)."""
+    if name == "orjson":
+        import orjson
+        return orjson.loads
+    if name == "msgspec":
+        import msgspec
+        return msgspec.json.Decoder().decode
+    if name == "json":
+        return json.loads
+    raise ValueError(f"Unknown JSON decoder: {name}. Choose from: auto, {', '.join(DECODERS)}")
+
+
+def available_decoders() -> List[str]:
+    """
+    List decoders that can be used in this environment.
+
+    Returns:
+        Decoder names in preference order
+    """
+    available = []
+    for name in DECODERS:
+        try:
+            _load_decoder(name)
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+def get_decoder(name: str = "auto") -> Decoder:
+    """
+    Get a bytes-to-object JSON decoder.
+
+    Args:
+        name: "auto" (fastest installed), "orjson", "msgspec" or "json"
+
+    Returns:
+        Callable decoding a JSON document from bytes
+
+    Raises:
+        ValueError: If the decoder is unknown or not installed
+
+    Example:
+        >>> decode = get_decoder("json")
+        >>> decode(b'{"rCode": "0"}')
+        {'rCode': '0'}
+    """
+    if name == "auto":
+        return _load_decoder(available_decoders()[0])
+
+    try:
+        return _load_decoder(name)
+    except ImportError:
+        raise ValueError(f"JSON decoder '{name}' is not installed")
@@ -0,0 +1,120 @@
+"""
+Lightweight runtime metrics.
+
+Provides latency recording with counts and recent-window percentiles, and
+response size recording.
+"""
+
+from collections import deque
+from typing import Deque
+
+
+class LatencyStats:
+    """
+    Records durations and reports count, mean, max and percentiles.
+
+    Percentiles are computed over the most recent `window` samples.
+    """
+
+    def __init__(self, window: int = 1000):
+        """
+        Initialize recorder.
+
+        Args:
+            window: Number of recent samples kept for percentiles
+        """
+        self.count = 0
+        self.failures = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float, ok: bool = True) -> None:
+        """
+        Record one duration.
+
+        Args:
+            seconds: Measured duration
+            ok: Whether the measured operation succeeded
+        """
+        self.count += 1
+        if not ok:
+            self.failures += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self._recent.append(seconds)
+
+    def percentile(self, q: float) -> float:
+        """
+        Get a percentile of recent samples.
+
+        Args:
+            q: Percentile between 0 and 100
+
+        Returns:
+            Duration in seconds (0 if nothing recorded)
+        """
+        if not self._recent:
+            return 0.0
+        ordered = sorted(self._recent)
+        index = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def stats(self) -> dict:
+        """
+        Get summary statistics in milliseconds.
+
+        Returns:
+            Dictionary with count, failures, mean, p50, p95 and max
+        """
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50) * 1000, 3),
+            "p95_ms": round(self.percentile(95) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class SizeStats:
+    """
+    Records response sizes and reports count, mean, max and total.
+    """
+
+    def __init__(self):
+        """Initialize recorder."""
+        self.count = 0
+        self.total_chars = 0
+        self.total_bytes = 0
+        self.max_chars = 0
+
+    def record(self, text: str) -> None:
+        """
+        Record one response.
+
+        Args:
+            text: Response text
+        """
+        chars = len(text)
+        self.count += 1
+        self.total_chars += chars
+        self.total_bytes += len(text.encode("utf-8"))
+        if chars > self.max_chars:
+            self.max_chars = chars
+
+    def stats(self) -> dict:
+        """
+        Get summary statistics.
+
+        Returns:
+            Dictionary with count, mean and max characters, and total characters and UTF-8 bytes
+        """
+        return {
+            "count": self.count,
+            "mean_chars": round(self.total_chars / self.count, 1) if self.count else 0.0,
+            "max_chars": self.max_chars,
+            "total_chars": self.total_chars,
+            "total_bytes": self.total_bytes,
+        }
@@ -0,0 +1,529 @@
+"""
+Client-side rate limiting for Coupang API calls.
+
+Implements per-endpoint token buckets with FIFO queueing, so requests stay
+within Coupang's call budgets instead of being rejected upstream, and a
+SQLite-backed sliding window shared by all server processes on one host.
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
+
+
+# Endpoint families with separate call budgets
+SEARCH = "search"
+BESTCATEGORIES = "bestcategories"
+PRODUCT = "product"
+DEEPLINK = "deeplink"
+DEFAULT = "default"
+
+
+def endpoint_family(path: str) -> str:
+    """
+    Classify an API path into its rate-limit family.
+
+    Args:
+        path: API endpoint path
+
+    Returns:
+        One of "search", "bestcategories", "product", "deeplink" or "default"
+
+    Example:
+        >>> endpoint_family("/v2/providers/affiliate_open_api/apis/openapi/products/search")
+        'search'
+    """
+    if path.endswith("/products/search"):
+        return SEARCH
+    if "/products/bestcategories/" in path:
+        return BESTCATEGORIES
+    if path.endswith("/deeplink"):
+        return DEEPLINK
+    if "/products/" in path:
+        return PRODUCT
+    return DEFAULT
+
+
+class RateLimitTimeout(Exception):
+    """Raised when a call would wait longer than allowed for a rate-limit slot."""
+
+    def __init__(self, family: str, wait: float):
+        """
+        Initialize error.
+
+        Args:
+            family: Endpoint family that is exhausted
+            wait: Estimated seconds until a slot would be available
+        """
+        super().__init__(
+            f"Rate limit for '{family}' exceeded; next slot available in {wait:.1f}s"
+        )
+        self.family = family
+        self.wait = wait
+
+
+class TokenBucket:
+    """
+    Async token bucket with FIFO waiting.
+
+    Tokens refill continuously at `rate_per_minute / 60` per second up to
+    `capacity`. Waiting callers are served strictly in arrival order.
+
+    Any minute admits up to `capacity - 1` calls on top of the rate, so the
+    default capacity of 1 never lets more than `rate_per_minute` calls into
+    a 60 s window; a larger capacity trades that guarantee for bursts.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate_per_minute: Sustained number of calls allowed per minute
+            capacity: Maximum burst size (defaults to 1, i.e. calls evenly spaced)
+            clock: Monotonic time source (overridable for tests)
+        """
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+
+        self.rate_per_minute = rate_per_minute
+        self.capacity = capacity or 1
+        self._refill_per_second = rate_per_minute / 60.0
+        self._clock = clock
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+        self._queued = 0
+
+        self.acquired = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last update."""
+        now = self._clock()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self._refill_per_second)
+            self._updated = now
+
+    def time_until_available(self) -> float:
+        """
+        Estimate how long a new caller would wait for a token.
+
+        Accounts for callers already queued ahead.
+
+        Returns:
+            Seconds until a token would be granted (0 if immediately available)
+        """
+        self._refill()
+        deficit = self._queued + 1 - self._tokens
+        if deficit <= 0:
+            return 0.0
+        return deficit / self._refill_per_second
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token without waiting.
+
+        Returns:
+            True if a token was taken, False if none is available or callers are queued
+        """
+        self._refill()
+        if self._queued == 0 and self._tokens >= 1:
+            self._tokens -= 1
+            self.acquired += 1
+            return True
+        return False
+
+    async def acquire(self, max_wait: Optional[float] = None) -> float:
+        """
+        Take a token, waiting in FIFO order if necessary.
+
+        Args:
+            max_wait: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitTimeout: If the estimated wait exceeds max_wait
+        """
+        wait = self.time_until_available()
+        if max_wait is not None and wait > max_wait:
+            self.rejected += 1
+            raise RateLimitTimeout("bucket", wait)
+
+        started = self._clock()
+        self._queued += 1
+        try:
+            async with self._lock:
+                while True:
+                    self._refill()
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        break
+                    await asyncio.sleep((1 - self._tokens) / self._refill_per_second)
+        finally:
+            self._queued -= 1
+
+        waited = self._clock() - started
+        self.acquired += 1
+        self.total_wait += waited
+        return waited
+
+    def stats(self) -> dict:
+        """
+        Get bucket statistics.
+
+        Returns:
+            Dictionary with rate, available tokens, queue length and counters
+        """
+        self._refill()
+        return {
+            "rate_per_minute": self.rate_per_minute,
+            "capacity": self.capacity,
+            "tokens": round(self._tokens, 3),
+            "queued": self._queued,
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "total_wait": round(self.total_wait, 3),
+        }
+
+
+class RateLimiter:
+    """
+    Per-endpoint-family rate limiter.
+
+    Families without a configured budget are not limited.
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, float],
+        max_queue_wait: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            limits: Mapping of endpoint family to calls per minute (0 disables the limit)
+            max_queue_wait: Default maximum seconds a call may wait for a slot
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.max_queue_wait = max_queue_wait
+        self.buckets: Dict[str, TokenBucket] = {
+            family: TokenBucket(rate, clock=clock)
+            for family, rate in limits.items()
+            if rate and rate > 0
+        }
+
+    async def acquire(self, family: str, max_wait: Optional[float] = None) -> float:
+        """
+        Wait for a call slot in an endpoint family.
+
+        Args:
+            family: Endpoint family (see endpoint_family)
+            max_wait: Maximum seconds to wait (uses max_queue_wait if not provided)
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitTimeout: If the wait would exceed max_wait
+        """
+        bucket = self.buckets.get(family)
+        if bucket is None:
+            return 0.0
+
+        if max_wait is None:
+            max_wait = self.max_queue_wait
+
+        try:
+            return await bucket.acquire(max_wait)
+        except RateLimitTimeout as e:
+            raise RateLimitTimeout(family, e.wait) from None
+
+    def try_acquire(self, family: str) -> bool:
+        """
+        Take a call slot without waiting.
+
+        Args:
+            family: Endpoint family (see endpoint_family)
+
+        Returns:
+            True if the call may proceed now
+        """
+        bucket = self.buckets.get(family)
+        return bucket is None or bucket.try_acquire()
+
+    def time_until_available(self, family: str) -> float:
+        """
+        Estimate how long a new call in a family would wait.
+
+        Args:
+            family: Endpoint family (see endpoint_family)
+
+        Returns:
+            Seconds until a slot would be granted (0 if immediately available)
+        """
+        bucket = self.buckets.get(family)
+        return bucket.time_until_available() if bucket else 0.0
+
+    def stats(self) -> dict:
+        """
+        Get statistics for all limited families.
+
+        Returns:
+            Dictionary of family to bucket statistics
+        """
+        return {family: bucket.stats() for family, bucket in self.buckets.items()}
+
+
+class SQLiteRateLimiter:
+    """
+    Per-endpoint-family sliding-window limiter shared across processes.
+
+    Every granted call is recorded in a SQLite database (WAL mode); a call is
+    allowed when fewer than the family's budget were recorded in the last
+    minute. All processes pointing at the same file share one budget, so
+    several local server processes with the same access key stay within the
+    quota without a central service. Waiting is not FIFO across processes.
+    """
+
+    WINDOW_SECONDS = 60.0
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        limits: Dict[str, float],
+        max_queue_wait: Optional[float] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize shared rate limiter.
+
+        Args:
+            db_path: SQLite database file shared by all processes
+            limits: Mapping of endpoint family to calls per minute (0 disables the limit;
+                the window counts whole calls, so fractional rates are rounded down)
+            max_queue_wait: Default maximum seconds a call may wait for a slot
+            clock: Wall-clock time source, comparable across processes
+
+        Raises:
+            ValueError: If a limit is between 0 and 1 call per minute
+        """
+        too_low = [family for family, rate in limits.items() if rate and 0 < rate < 1]
+        if too_low:
+            raise ValueError(
+                f"Shared rate limits must be at least 1 call per minute: {', '.join(too_low)}"
+            )
+
+        self.db_path = str(Path(db_path).expanduser())
+        self.max_queue_wait = max_queue_wait
+        self.limits: Dict[str, int] = {
+            family: int(rate)
+            for family, rate in limits.items()
+            if rate and rate > 0
+        }
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        # Counters for calls made by this process, per family
+        self.acquired: Dict[str, int] = {family: 0 for family in self.limits}
+        self.rejected: Dict[str, int] = {family: 0 for family in self.limits}
+        self.total_wait: Dict[str, float] = {family: 0.0 for family in self.limits}
+
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.db_path, timeout=10.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_calls (family TEXT NOT NULL, ts REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rate_limit_calls ON rate_limit_calls (family, ts)"
+        )
+
+    def _reserve(self, family: str, limit: int) -> float:
+        """
+        Record a call if the window has room.
+
+        Returns:
+            0 if the call was recorded, otherwise seconds until the oldest call leaves the window
+        """
+        with self._lock:
+            now = self._clock()
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "DELETE FROM rate_limit_calls WHERE family = ? AND ts <= ?",
+                    (family, now - self.WINDOW_SECONDS)
+                )
+                count, oldest = self._conn.execute(
+                    "SELECT COUNT(*), MIN(ts) FROM rate_limit_calls WHERE family = ?",
+                    (family,)
+                ).fetchone()
+
+                if count < limit:
+                    self._conn.execute(
+                        "INSERT INTO rate_limit_calls (family, ts) VALUES (?, ?)",
+                        (family, now)
+                    )
+                    wait = 0.0
+                else:
+                    wait = max(oldest + self.WINDOW_SECONDS - now, 0.001)
+
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        return wait
+
+    def _window_wait(self, family: str, limit: int) -> float:
+        """Seconds until the window would admit one more call (read-only)."""
+        with self._lock:
+            now = self._clock()
+            rows = self._conn.execute(
+                "SELECT ts FROM rate_limit_calls WHERE family = ? AND ts > ? ORDER BY ts",
+                (family, now - self.WINDOW_SECONDS)
+            ).fetchall()
+
+        if len(rows) < limit:
+            return 0.0
+        return max(rows[len(rows) - limit][0] + self.WINDOW_SECONDS - now, 0.0)
+
+    async def acquire(self, family: str, max_wait: Optional[float] = None) -> float:
+        """
+        Wait for a call slot in an endpoint family.
+
+        Args:
+            family: Endpoint family (see endpoint_family)
+            max_wait: Maximum seconds to wait (uses max_queue_wait if not provided)
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitTimeout: If the wait would exceed max_wait
+        """
+        limit = self.limits.get(family)
+        if limit is None:
+            return 0.0
+
+        if max_wait is None:
+            max_wait = self.max_queue_wait
+
+        waited = 0.0
+        while True:
+            wait = await asyncio.to_thread(self._reserve, family, limit)
+            if wait <= 0:
+                self.acquired[family] += 1
+                self.total_wait[family] += waited
+                return waited
+
+            if max_wait is not None and waited + wait > max_wait:
+                self.rejected[family] += 1
+                raise RateLimitTimeout(family, wait)
+
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def try_acquire(self, family: str) -> bool:
+        """
+        Take a call slot without waiting.
+
+        Args:
+            family: Endpoint family (see endpoint_family)
+
+        Returns:
+            True if the call may proceed now
+        """
+        limit = self.limits.get(family)
+        if limit is None:
+            return True
+        if self._reserve(family, limit) > 0:
+            return False
+        self.acquired[family] += 1
+        return True
+
+    def time_until_available(self, family: str) -> float:
+        """
+        Estimate how long a new call in a family would wait.
+
+        Args:
+            family: Endpoint family (see endpoint_family)
+
+        Returns:
+            Seconds until a slot would be granted (0 if immediately available)
+        """
+        limit = self.limits.get(family)
+        if limit is None:
+            return 0.0
+        return self._window_wait(family, limit)
+
+    def stats(self) -> dict:
+        """
+        Get statistics for all limited families.
+
+        Returns:
+            Dictionary of family to shared window usage and this process's counters
+        """
+        now = self._clock()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT family, COUNT(*) FROM rate_limit_calls WHERE ts > ? GROUP BY family",
+                (now - self.WINDOW_SECONDS,)
+            ).fetchall()
+        used = dict(rows)
+
+        return {
+            family: {
+                "rate_per_minute": limit,
+                "used_in_window": used.get(family, 0),
+                "acquired": self.acquired[family],
+                "rejected": self.rejected[family],
+                "total_wait": round(self.total_wait[family], 3),
+            }
+            for family, limit in self.limits.items()
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+# Either rate limiter backend; both expose acquire/try_acquire/time_until_available/stats
+AnyRateLimiter = Union[RateLimiter, SQLiteRateLimiter]
+
+
+def create_rate_limiter(
+    limits: Dict[str, float],
+    max_queue_wait: Optional[float] = None,
+    db_path: Optional[str] = None
+) -> AnyRateLimiter:
+    """
+    Create a rate limiter for the configured backend.
+
+    Args:
+        limits: Mapping of endpoint family to calls per minute
+        max_queue_wait: Default maximum seconds a call may wait for a slot
+        db_path: SQLite file for a limit shared across processes (in-process if not provided)
+
+    Returns:
+        RateLimiter or SQLiteRateLimiter instance
+    """
+    if db_path:
+        return SQLiteRateLimiter(db_path, limits, max_queue_wait=max_queue_wait)
+    return RateLimiter(limits, max_queue_wait=max_queue_wait)
@@ -0,0 +1,155 @@
+"""
+Retry policy for transient Coupang API failures.
+
+Provides exponential backoff with jitter and Retry-After handling.
+"""
+
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+
+# Methods that can be repeated without side effects
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Statuses worth retrying: throttling and transient gateway/server errors
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+        now: Current time for HTTP dates (uses current UTC time if not provided)
+
+    Returns:
+        Delay in seconds, or None if missing or unparseable
+
+    Example:
+        >>> parse_retry_after("5")
+        5.0
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return max((retry_at - now).total_seconds(), 0.0)
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+
+    Delays grow exponentially from `base_delay` by `multiplier` up to
+    `max_delay`, with a random jitter fraction subtracted so concurrent
+    clients do not retry in lockstep. A server-provided Retry-After takes
+    precedence (capped at `max_retry_after`).
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.25,
+        max_delay: float = 8.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.5,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retry_non_idempotent: bool = False,
+        max_retry_after: float = 30.0
+    ):
+        """
+        Initialize retry policy.
+
+        Args:
+            max_attempts: Total attempts including the first (1 disables retries)
+            base_delay: Delay in seconds before the first retry
+            max_delay: Upper bound for backoff delays
+            multiplier: Backoff growth factor per attempt
+            jitter: Fraction of the delay randomized away (0 = none, 1 = full jitter)
+            retry_statuses: HTTP statuses that are retried
+            retry_non_idempotent: Also retry POST/PATCH requests (opt-in)
+            max_retry_after: Upper bound for honored Retry-After delays
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_non_idempotent = retry_non_idempotent
+        self.max_retry_after = max_retry_after
+
+    def allows_method(self, method: str) -> bool:
+        """Whether requests with this HTTP method may be retried at all."""
+        return self.retry_non_idempotent or method.upper() in IDEMPOTENT_METHODS
+
+    def should_retry(self, attempt: int, status: Optional[int]) -> bool:
+        """
+        Decide whether to retry after a failed attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            status: HTTP status of the failure, or None for network errors
+
+        Returns:
+            True if another attempt should be made
+        """
+        if attempt >= self.max_attempts:
+            return False
+        return status is None or status in self.retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Compute the jittered backoff delay after a failed attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        return delay * (1 - self.jitter * random.random())
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Compute the delay before the next attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            retry_after: Server-requested delay in seconds, if any
+
+        Returns:
+            Delay in seconds
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        return self.backoff(attempt)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"RetryPolicy(max_attempts={self.max_attempts}, base_delay={self.base_delay}, "
+            f"max_delay={self.max_delay}, retry_non_idempotent={self.retry_non_idempotent})"
+        )
@@ -0,0 +1,203 @@
+"""
+Tests for columnar product batches.
+
+Tests construction, conversion, filtering, sorting and summary statistics.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.models.batch import ProductBatch
+from src.models.product import Product, ProductFilter
+from src.models.record import ProductRecord
+from src.tools.search import get_search_summary, refine_products
+
+
+def _item(product_id, price, **extra):
+    """Build a raw API product dict."""
+    item = {
+        "productId": product_id,
+        "productName": f"Product {product_id}",
+        "productPrice": price,
+        "productImage": "https://example.com/image.jpg",
+        "productUrl": "https://example.com/product",
+    }
+    item.update(extra)
+    return item
+
+
+@pytest.fixture
+def items():
+    """Raw API products with a mix of optional fields."""
+    return [
+        _item("1", 30000, isRocket=True, isFreeShipping=True, categoryName="노트북", discountRate=10),
+        _item("2", 10000, isRocket=False, categoryName="마우스"),
+        _item("3", 50000, isRocket=True, categoryName="노트북", discountRate=25, originalPrice=66000),
+        _item("4", 20000, isFreeShipping=True),
+    ]
+
+
+@pytest.fixture
+def batch(items):
+    """Batch built from the raw products."""
+    return ProductBatch.from_api(items)
+
+
+class TestProductBatch:
+    """Test cases for ProductBatch class."""
+
+    def test_from_api_round_trip(self, items, batch):
+        """Test that records read back from the batch match the API data."""
+        assert len(batch) == 4
+        assert batch.to_records() == [ProductRecord.from_api(item) for item in items]
+        assert batch.to_products() == [Product(**item) for item in items]
+
+    def test_from_api_skips_invalid_items(self, items):
+        """Test that invalid items are skipped."""
+        batch = ProductBatch.from_api([items[0], {"invalid": "data"}, items[1]])
+
+        assert batch.product_ids == ["1", "2"]
+
+    def test_from_products(self, items):
+        """Test building from Product and ProductRecord objects."""
+        products = [Product(**item) for item in items]
+
+        assert ProductBatch.from_products(products).to_products() == products
+        assert ProductBatch.from_products(ProductRecord.from_api(i) for i in items).to_products() == products
+
+    def test_categories_are_interned(self, batch):
+        """Test that each category name is stored once."""
+        assert batch.categories == ["노트북", "마우스"]
+        assert [p.category_name for p in batch] == ["노트북", "마우스", "노트북", None]
+
+    def test_sequence_protocol(self, batch):
+        """Test indexing, negative indexing, slicing and iteration."""
+        assert batch[0].product_id == "1"
+        assert batch[-1].product_id == "4"
+        assert isinstance(batch[1:3], ProductBatch)
+        assert batch[1:3].product_ids == ["2", "3"]
+        assert [p.product_id for p in batch] == ["1", "2", "3", "4"]
+        with pytest.raises(IndexError):
+            batch[4]
+
+    def test_filter_price_range(self, batch):
+        """Test inclusive price range filtering."""
+        assert batch.filter(min_price=20000, max_price=30000).product_ids == ["1", "4"]
+        assert batch.filter(min_price=25000).product_ids == ["1", "3"]
+        assert batch.filter(max_price=5000).product_ids == []
+
+    def test_filter_keeps_selection_order(self, batch):
+        """Test that filtering a sorted or sliced batch keeps its order."""
+        assert batch.sort("price", descending=True).filter(min_price=20000).product_ids == ["3", "1", "4"]
+        assert batch[1:].filter(max_price=30000).product_ids == ["2", "4"]
+
+    def test_filter_flags_and_category(self, batch):
+        """Test flag, discount and category filters, alone and combined."""
+        assert batch.filter(rocket=True).product_ids == ["1", "3"]
+        assert batch.filter(rocket=False).product_ids == ["2", "4"]
+        assert batch.filter(free_shipping=True).product_ids == ["1", "4"]
+        assert batch.filter(min_discount=20).product_ids == ["3"]
+        assert batch.filter(category="노트북", max_price=40000).product_ids == ["1"]
+        assert batch.filter(category="없음").product_ids == []
+
+    def test_sort(self, batch):
+        """Test sorting by columns in both directions."""
+        assert batch.sort("price").product_ids == ["2", "4", "1", "3"]
+        assert batch.sort("price", descending=True).product_ids == ["3", "1", "4", "2"]
+        assert batch.sort("discount_rate", descending=True).product_ids == ["3", "1", "2", "4"]
+
+    def test_sort_unknown_key(self, batch):
+        """Test that unknown sort keys are rejected."""
+        with pytest.raises(ValueError):
+            batch.sort("rating")
+
+    def test_top_k(self, batch):
+        """Test partial selection in sort order."""
+        assert batch.top_k(2, "price").product_ids == ["2", "4"]
+        assert batch.top_k(2, "price", descending=True).product_ids == ["3", "1"]
+        assert len(batch.top_k(10)) == 4
+
+    def test_summary(self, batch):
+        """Test summary statistics."""
+        assert batch.summary() == {
+            "total_count": 4,
+            "avg_price": 27500,
+            "min_price": 10000,
+            "max_price": 50000,
+            "rocket_count": 2,
+            "free_shipping_count": 2
+        }
+        assert ProductBatch().summary()["total_count"] == 0
+
+    def test_summary_of_selection(self, batch):
+        """Test that filtered and sliced batches summarize only selected products."""
+        assert batch.filter(rocket=True).summary() == {
+            "total_count": 2,
+            "avg_price": 40000,
+            "min_price": 30000,
+            "max_price": 50000,
+            "rocket_count": 2,
+            "free_shipping_count": 1
+        }
+        assert batch[:2].summary()["max_price"] == 30000
+        assert batch.filter(max_price=0).summary()["total_count"] == 0
+
+    def test_concat_dedupe(self, items):
+        """Test merging batches with and without deduplication."""
+        first = ProductBatch.from_api(items[:3])
+        second = ProductBatch.from_api(items[2:])
+
+        assert ProductBatch.concat([first, second]).product_ids == ["1", "2", "3", "3", "4"]
+        merged = ProductBatch.concat([first, second], dedupe=True)
+        assert merged.product_ids == ["1", "2", "3", "4"]
+        assert merged.filter(category="노트북").product_ids == ["1", "3"]
+
+
+class TestGetSearchSummary:
+    """Test cases for get_search_summary function."""
+
+    def test_summary_from_products_and_batch(self, items, batch):
+        """Test that lists and batches give the same summary."""
+        products = [Product(**item) for item in items]
+
+        assert get_search_summary(products) == batch.summary()
+        assert get_search_summary(batch) == batch.summary()
+
+    def test_summary_empty(self):
+        """Test summary of no products."""
+        assert get_search_summary([])["avg_price"] == 0
+
+    def test_list_summary_builds_no_batch(self, items):
+        """Test that plain lists are summarized directly, without columnar conversion."""
+        products = [Product(**item) for item in items]
+
+        with patch.object(ProductBatch, "from_products", side_effect=AssertionError("converted")):
+            summary = get_search_summary(products)
+
+        assert summary["total_count"] == len(items)
+
+
+class TestRefineProducts:
+    """Test cases for refine_products function."""
+
+    def test_filters_sorts_and_truncates(self, items):
+        """Test that filters apply before sorting and the limit."""
+        products = [Product(**item) for item in items]
+        filters = ProductFilter(max_price=40000, sort_by="price", sort_order="desc")
+
+        refined = refine_products(products, filters, limit=2)
+
+        assert refined.product_ids == ["1", "4"]
+
+    def test_flag_and_discount_filters(self, batch):
+        """Test rocket-only, free-shipping-only and minimum discount filters."""
+        assert refine_products(batch, ProductFilter(rocket_only=True), limit=10).product_ids == ["1", "3"]
+        assert refine_products(batch, ProductFilter(free_shipping_only=True), limit=10).product_ids == ["1", "4"]
+        assert refine_products(batch, ProductFilter(min_discount=20), limit=10).product_ids == ["3"]
+
+    def test_keeps_api_order_without_sort(self, batch):
+        """Test that results keep API ranking order when no sort key is given."""
+        refined = refine_products(batch, ProductFilter(min_price=15000), limit=2)
+
+        assert refined.product_ids == ["1", "3"]
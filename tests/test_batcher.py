@@ -0,0 +1,105 @@
+"""
+Tests for micro-batching.
+
+Tests merging within the window, grouping, size-triggered flushes and error
+propagation.
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.batcher import MicroBatcher
+
+
+class RecordingFlush:
+    """Flush callable recording each batch and echoing its items."""
+
+    def __init__(self, error: Exception = None):
+        self.calls = []
+        self.error = error
+
+    async def __call__(self, group, items):
+        self.calls.append((group, list(items)))
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return list(items)
+
+
+class TestMicroBatcher:
+    """Test cases for MicroBatcher class."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_submissions_merged(self):
+        """Test that submissions within the window share one flush call."""
+        flush = RecordingFlush()
+        batcher = MicroBatcher(flush, max_wait=0.01)
+
+        results = await asyncio.gather(
+            batcher.submit("sub", ["a"]),
+            batcher.submit("sub", ["b", "c"]),
+            batcher.submit("sub", ["d"])
+        )
+
+        assert flush.calls == [("sub", ["a", "b", "c", "d"])]
+        assert all(result == ["a", "b", "c", "d"] for result in results)
+        assert batcher.stats() == {"open": 0, "submissions": 3, "batches": 1}
+
+    @pytest.mark.asyncio
+    async def test_groups_are_separate(self):
+        """Test that only submissions of the same group are merged."""
+        flush = RecordingFlush()
+        batcher = MicroBatcher(flush, max_wait=0.01)
+
+        await asyncio.gather(
+            batcher.submit("a", [1]),
+            batcher.submit("b", [2]),
+            batcher.submit("a", [3])
+        )
+
+        assert sorted(flush.calls) == [("a", [1, 3]), ("b", [2])]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushed_immediately(self):
+        """Test that reaching max_batch_size flushes without waiting for the window."""
+        flush = RecordingFlush()
+        batcher = MicroBatcher(flush, max_wait=10, max_batch_size=3)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.submit("sub", [1, 2]), batcher.submit("sub", [3])),
+            timeout=1
+        )
+
+        assert results == [[1, 2, 3], [1, 2, 3]]
+
+    @pytest.mark.asyncio
+    async def test_overflowing_submission_starts_new_batch(self):
+        """Test that a submission that would exceed the size goes into the next batch."""
+        flush = RecordingFlush()
+        batcher = MicroBatcher(flush, max_wait=0.01, max_batch_size=3)
+
+        await asyncio.gather(batcher.submit("sub", [1, 2]), batcher.submit("sub", [3, 4]))
+
+        assert flush.calls == [("sub", [1, 2]), ("sub", [3, 4])]
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        """Test that a failing flush raises for all callers of the batch."""
+        batcher = MicroBatcher(RecordingFlush(error=ValueError("boom")), max_wait=0.01)
+
+        results = await asyncio.gather(
+            batcher.submit("sub", [1]), batcher.submit("sub", [2]), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_window(self):
+        """Test that max_wait=0 flushes every submission on its own."""
+        flush = RecordingFlush()
+        batcher = MicroBatcher(flush, max_wait=0)
+
+        await asyncio.gather(batcher.submit("sub", [1]), batcher.submit("sub", [2]))
+
+        assert flush.calls == [("sub", [1]), ("sub", [2])]
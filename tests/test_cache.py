@@ -0,0 +1,150 @@
+"""
+Tests for in-memory result cache.
+
+Tests TTL expiry, LRU eviction and statistics.
+"""
+
+import pytest
+
+from src.utils.cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic expiry tests."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Test cases for TTLCache class."""
+
+    @pytest.fixture
+    def clock(self):
+        """Create fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def cache(self, clock):
+        """Create TTLCache instance for testing."""
+        return TTLCache(ttl=60, max_entries=3, clock=clock)
+
+    def test_get_missing_key(self, cache):
+        """Test that missing keys return None and count as misses."""
+        assert cache.get("missing") is None
+        assert cache.misses == 1
+        assert cache.hits == 0
+
+    def test_set_and_get(self, cache):
+        """Test that stored values are returned and count as hits."""
+        cache.set("key", [1, 2, 3])
+
+        assert cache.get("key") == [1, 2, 3]
+        assert cache.hits == 1
+
+    def test_entry_expires(self, cache, clock):
+        """Test that entries expire after their TTL."""
+        cache.set("key", "value")
+
+        clock.now += 59
+        assert cache.get("key") == "value"
+
+        clock.now += 2
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_per_entry_ttl(self, cache, clock):
+        """Test that an explicit TTL overrides the default."""
+        cache.set("short", "value", ttl=5)
+
+        clock.now += 6
+        assert cache.get("short") is None
+
+    def test_lru_eviction(self, cache):
+        """Test that least recently used entries are evicted first."""
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        # Touch "a" so "b" becomes least recently used
+        cache.get("a")
+        cache.set("d", 4)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("d") == 4
+        assert cache.evictions == 1
+
+    def test_accept_predicate(self, cache):
+        """Test that rejected values count as misses but stay cached."""
+        cache.set("key", 5)
+
+        assert cache.get("key", accept=lambda value: value > 10) is None
+        assert cache.misses == 1
+        assert cache.get("key", accept=lambda value: value > 1) == 5
+
+    def test_get_stale_within_window(self, clock):
+        """Test that expired entries are served by get_stale within the stale window."""
+        cache = TTLCache(ttl=60, stale_ttl=30, clock=clock)
+        cache.set("key", "value")
+
+        clock.now += 70
+        assert cache.get("key") is None
+        assert cache.get_stale("key") == "value"
+        assert cache.stale_hits == 1
+
+        clock.now += 30
+        assert cache.get_stale("key") is None
+        assert len(cache) == 0
+
+    def test_get_stale_max_staleness(self, clock):
+        """Test that max_staleness narrows the stale window without dropping the entry."""
+        cache = TTLCache(ttl=60, stale_ttl=300, clock=clock)
+        cache.set("key", "value")
+
+        clock.now += 80
+        assert cache.get_stale("key", max_staleness=30) == "value"
+
+        clock.now += 20
+        assert cache.get_stale("key", max_staleness=30) is None
+        assert cache.get_stale("key") == "value"
+
+    def test_zero_ttl_disables_cache(self, clock):
+        """Test that a TTL of zero stores nothing."""
+        cache = TTLCache(ttl=0, clock=clock)
+        cache.set("key", "value")
+
+        assert not cache.enabled
+        assert cache.get("key") is None
+
+    def test_invalid_max_entries(self):
+        """Test that max_entries must be positive."""
+        with pytest.raises(ValueError):
+            TTLCache(max_entries=0)
+
+    def test_invalidate_and_clear(self, cache):
+        """Test explicit removal of entries."""
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.invalidate("a")
+        assert cache.get("a") is None
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_stats(self, cache):
+        """Test statistics reporting."""
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        stats = cache.stats()
+
+        assert stats["size"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
@@ -0,0 +1,163 @@
+"""
+Tests for background category prefetching.
+
+Tests cache warming, budget spacing, failure handling and task lifecycle.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.category_refresher import CategoryRefresher
+from src.coupang_client import CoupangAPIError, CoupangClient
+from src.utils.categories import CATEGORY_MAP
+from src.utils.disk_cache import DiskCache
+
+
+def _products(category_id):
+    """Create a raw API response for a category."""
+    return {"rCode": "0", "data": [{
+        "productId": f"{category_id}-1",
+        "productName": f"Best of {category_id}",
+        "productPrice": 10000,
+        "productImage": "https://example.com/1.jpg",
+        "productUrl": "https://example.com/1"
+    }]}
+
+
+@pytest.fixture
+def client():
+    """Create CoupangClient instance for testing."""
+    return CoupangClient(
+        access_key="test_access_key",
+        secret_key="test_secret_key",
+        partner_id="test_partner_id"
+    )
+
+
+@pytest.fixture
+def sleeps():
+    """Recorded sleep durations, used as a fake sleep."""
+    recorded = []
+
+    async def sleep(seconds):
+        recorded.append(seconds)
+
+    sleep.recorded = recorded
+    return sleep
+
+
+class TestCategoryRefresher:
+    """Test cases for CategoryRefresher class."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_all_warms_cache(self, client, sleeps):
+        """Test that every category is fetched once and then served from cache."""
+        refresher = CategoryRefresher(client, sleep=sleeps)
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = lambda method, path, params, **kwargs: _products(path.rsplit("/", 1)[1])
+
+            assert await refresher.refresh_all() == len(CATEGORY_MAP)
+            assert mock_request.call_count == len(CATEGORY_MAP)
+            assert all(call.args[2]["limit"] == 100 for call in mock_request.call_args_list)
+
+            products = await client.get_best_products_by_category("1016", limit=20)
+
+            assert products[0].product_id == "1016-1"
+            assert mock_request.call_count == len(CATEGORY_MAP)
+
+    @pytest.mark.asyncio
+    async def test_refresh_bypasses_disk_cache(self, tmp_path, sleeps):
+        """Test that refreshes reach the API even when the disk cache has the response."""
+        client = CoupangClient(
+            access_key="test_access_key", secret_key="test_secret_key", partner_id="test_partner_id",
+            disk_cache=DiskCache(tmp_path / "responses.db", {"bestcategories": 3600})
+        )
+        refresher = CategoryRefresher(client, category_ids=["1001"], sleep=sleeps)
+
+        with patch.object(client, '_send_request', new_callable=AsyncMock) as mock_send:
+            mock_send.return_value = _products("old")
+            await refresher.refresh_all()
+
+            mock_send.return_value = _products("new")
+            await refresher.refresh_all()
+
+            assert mock_send.call_count == 2
+
+            # A cold client on the same disk cache gets the refreshed response
+            client.category_cache.clear()
+            products = await client.get_best_products_by_category("1001", limit=100)
+
+            assert products[0].product_id == "new-1"
+            assert mock_send.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_calls_spaced_by_budget_share(self, client, sleeps):
+        """Test that calls are spaced to use only the configured share of the rate limit."""
+        refresher = CategoryRefresher(
+            client, budget_share=0.2, rate_per_minute=50, category_ids=["1001", "1002", "1010"], sleep=sleeps
+        )
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _products("1001")
+            await refresher.refresh_all()
+
+        assert refresher.spacing == 6.0
+        assert sleeps.recorded == [6.0, 6.0]
+
+    @pytest.mark.asyncio
+    async def test_waits_for_free_rate_limit_slot(self, client, sleeps):
+        """Test that refresh calls wait while the rate limiter has no free slot."""
+        refresher = CategoryRefresher(client, rate_per_minute=0, category_ids=["1001"], sleep=sleeps)
+
+        with patch.object(client, 'time_until_available', side_effect=[2.5, 0.0]), \
+                patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _products("1001")
+            await refresher.refresh_all()
+
+        assert sleeps.recorded == [2.5]
+
+    @pytest.mark.asyncio
+    async def test_failures_do_not_stop_cycle(self, client, sleeps):
+        """Test that a failing category is counted and the rest are still refreshed."""
+        refresher = CategoryRefresher(client, category_ids=["1001", "1002"], sleep=sleeps)
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = [CoupangAPIError("API error: 500", status=500), _products("1002")]
+
+            assert await refresher.refresh_all() == 1
+
+        assert refresher.stats()["failed"] == 1
+        assert refresher.stats()["refreshed"] == 1
+
+    def test_cache_ttl_covers_next_cycle(self, client):
+        """Test that prefetched entries outlive the interval plus a cycle."""
+        refresher = CategoryRefresher(client, interval=600, budget_share=0.2, rate_per_minute=50)
+
+        assert refresher.ttl >= 600 + 6 * len(CATEGORY_MAP)
+
+    def test_invalid_arguments(self, client):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            CategoryRefresher(client, budget_share=0)
+        with pytest.raises(ValueError):
+            CategoryRefresher(client, interval=0)
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self, client):
+        """Test the background task lifecycle."""
+        refresher = CategoryRefresher(client, interval=3600, category_ids=["1001"])
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = _products("1001")
+            refresher.start()
+            await asyncio.sleep(0.01)
+
+            assert refresher.running
+            assert refresher.cycles == 1
+
+            await refresher.stop()
+
+        assert not refresher.running
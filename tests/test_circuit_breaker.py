@@ -0,0 +1,102 @@
+"""
+Tests for circuit breaker.
+
+Tests state transitions between closed, open and half-open.
+"""
+
+import pytest
+
+from src.utils.circuit_breaker import CircuitBreaker, CLOSED, HALF_OPEN, OPEN
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic recovery tests."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker class."""
+
+    @pytest.fixture
+    def clock(self):
+        """Create fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def breaker(self, clock):
+        """Create CircuitBreaker instance for testing."""
+        return CircuitBreaker(failure_threshold=3, recovery_timeout=10, clock=clock)
+
+    def test_starts_closed(self, breaker):
+        """Test that a new breaker allows requests."""
+        assert breaker.state == CLOSED
+        assert breaker.allow_request()
+
+    def test_opens_after_consecutive_failures(self, breaker):
+        """Test that the threshold of consecutive failures opens the circuit."""
+        for _ in range(3):
+            breaker.record_failure()
+
+        assert breaker.state == OPEN
+        assert not breaker.allow_request()
+        assert breaker.rejected == 1
+        assert breaker.time_until_probe() == 10
+
+    def test_success_resets_failure_count(self, breaker):
+        """Test that a success in between prevents opening."""
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CLOSED
+
+    def test_half_open_after_recovery_timeout(self, breaker, clock):
+        """Test that one probe is allowed after the recovery timeout."""
+        for _ in range(3):
+            breaker.record_failure()
+
+        clock.now += 10
+
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+    def test_successful_probe_closes(self, breaker, clock):
+        """Test that a successful probe closes the circuit."""
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 10
+        breaker.allow_request()
+
+        breaker.record_success()
+
+        assert breaker.state == CLOSED
+
+    def test_failed_probe_reopens(self, breaker, clock):
+        """Test that a failed probe opens the circuit again."""
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 10
+        breaker.allow_request()
+
+        breaker.record_failure()
+
+        assert breaker.state == OPEN
+        assert breaker.times_opened == 2
+
+    def test_release_frees_probe(self, breaker, clock):
+        """Test that releasing an unsent probe lets another through."""
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 10
+        breaker.allow_request()
+
+        breaker.release()
+
+        assert breaker.allow_request()
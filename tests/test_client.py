@@ -4,12 +4,28 @@ Tests for Coupang API client.
 Tests API client functionality with mocked HTTP responses.
 """
 
+import asyncio
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from aiohttp import ClientError
 
-from src.coupang_client import CoupangClient, CoupangAPIError
+from src.coupang_client import (
+    CoupangClient,
+    CoupangAPIError,
+    CoupangCircuitOpenError,
+    CoupangRateLimitError,
+    CoupangTimeoutError,
+)
+from src.utils.cache import TTLCache
+from src.utils.deadline import deadline_scope
+from src.utils.disk_cache import DiskCache
+from src.utils.deeplink_store import DeepLinkStore
+from src.utils.rate_limit import RateLimiter
+from src.utils.retry import RetryPolicy
 from src.models.product import Product
+from src.models.record import ProductRecord
+from src.models.batch import ProductBatch
 
 
 class TestCoupangClient:
@@ -88,12 +104,46 @@ class TestCoupangClient:
         await client.close()
         assert client.session is None
 
+    @pytest.mark.asyncio
+    async def test_session_uses_tuned_connector(self, client):
+        """Test that the session is created with configured pool settings."""
+        await client._ensure_session()
+        try:
+            stats = client.pool_stats()
+
+            assert stats["open"] is True
+            assert stats["limit_per_host"] == client.session.connector.limit_per_host
+            assert stats["acquired"] == 0
+        finally:
+            await client.close()
+
+        assert client.pool_stats() == {"open": False}
+
+    @pytest.mark.asyncio
+    async def test_warm_up_counts_opened_connections(self, client):
+        """Test that warm-up opens the requested number of connections."""
+        mock_response = MagicMock()
+        mock_response.read = AsyncMock(return_value=b"")
+
+        with patch.object(client, 'session') as mock_session:
+            mock_session.head = MagicMock(return_value=MagicMock())
+            mock_session.head.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+            mock_session.head.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            assert await client.warm_up(connections=3) == 3
+            assert mock_session.head.call_count == 3
+
+            mock_session.head = MagicMock(side_effect=ClientError("unreachable"))
+            assert await client.warm_up(connections=2) == 0
+
+        assert await client.warm_up(connections=0) == 0
+
     @pytest.mark.asyncio
     async def test_make_request_success(self, client):
         """Test successful API request."""
         mock_response = MagicMock()
         mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={"data": "test"})
+        mock_response.read = AsyncMock(return_value=b'{"data": "test"}')
 
         with patch.object(client, 'session') as mock_session:
             mock_session.request = MagicMock(return_value=mock_response)
@@ -104,6 +154,20 @@ class TestCoupangClient:
 
             assert result == {"data": "test"}
 
+    @pytest.mark.asyncio
+    async def test_make_request_invalid_json(self, client):
+        """Test that an undecodable body raises an API error without retrying."""
+        with patch.object(client, 'session') as mock_session:
+            response = self._response(200)
+            response.read = AsyncMock(return_value=b"<html>not json</html>")
+            self._mock_responses(mock_session, response)
+
+            with pytest.raises(CoupangAPIError) as exc_info:
+                await client._make_request("GET", "/v2/test")
+
+            assert "decode" in str(exc_info.value)
+            assert mock_session.request.call_count == 1
+
     @pytest.mark.asyncio
     async def test_make_request_api_error(self, client):
         """Test API request with error response."""
@@ -133,6 +197,479 @@ class TestCoupangClient:
 
             assert "HTTP request failed" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_make_request_coalesces_concurrent_calls(self, client):
+        """Test that concurrent identical requests share one HTTP call."""
+        async def slow_send(*args):
+            await asyncio.sleep(0.01)
+            return {"data": "test"}
+
+        with patch.object(client, '_send_request', side_effect=slow_send) as mock_send:
+            results = await asyncio.gather(
+                client._make_request("GET", "/v2/test", {"param": "value"}),
+                client._make_request("GET", "/v2/test", {"param": "value"}),
+                client._make_request("GET", "/v2/test", {"param": "other"})
+            )
+
+            assert results[0] == results[1] == {"data": "test"}
+            assert mock_send.call_count == 2
+            assert client.get_stats()["coalescer"]["folded"] == 1
+
+    @staticmethod
+    def _mock_responses(mock_session, *responses):
+        """Make session.request return the given mock responses in order."""
+        contexts = []
+        for response in responses:
+            context = MagicMock()
+            context.__aenter__ = AsyncMock(return_value=response)
+            context.__aexit__ = AsyncMock(return_value=None)
+            contexts.append(context)
+        mock_session.request = MagicMock(side_effect=contexts)
+
+    @staticmethod
+    def _response(status, body=None, headers=None):
+        """Create a mock HTTP response."""
+        response = MagicMock()
+        response.status = status
+        response.headers = headers or {}
+        response.text = AsyncMock(return_value="error")
+        response.read = AsyncMock(return_value=json.dumps(body).encode("utf-8"))
+        return response
+
+    @pytest.mark.asyncio
+    async def test_make_request_retries_transient_errors(self, client):
+        """Test that 5xx responses are retried until success."""
+        with patch.object(client, 'session') as mock_session, \
+                patch('src.coupang_client.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            self._mock_responses(
+                mock_session,
+                self._response(503),
+                self._response(200, {"data": "test"})
+            )
+
+            result = await client._make_request("GET", "/v2/test")
+
+            assert result == {"data": "test"}
+            assert mock_session.request.call_count == 2
+            mock_sleep.assert_awaited_once()
+            assert client.get_stats()["retries"] == 1
+            assert client.get_stats()["attempt_latency"]["default"]["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_make_request_honors_retry_after(self, client):
+        """Test that a 429 Retry-After header sets the retry delay."""
+        with patch.object(client, 'session') as mock_session, \
+                patch('src.coupang_client.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+            self._mock_responses(
+                mock_session,
+                self._response(429, headers={"Retry-After": "2"}),
+                self._response(200, {"data": "test"})
+            )
+
+            await client._make_request("GET", "/v2/test")
+
+            mock_sleep.assert_awaited_once_with(2.0)
+
+    @pytest.mark.asyncio
+    async def test_make_request_gives_up_after_max_attempts(self):
+        """Test that the last failure is raised after max attempts."""
+        client = CoupangClient(
+            access_key="test_key",
+            secret_key="test_secret",
+            partner_id="test_partner",
+            retry_policy=RetryPolicy(max_attempts=2, base_delay=0)
+        )
+
+        with patch.object(client, 'session') as mock_session:
+            self._mock_responses(mock_session, self._response(500), self._response(502))
+
+            with pytest.raises(CoupangAPIError) as exc_info:
+                await client._make_request("GET", "/v2/test")
+
+            assert exc_info.value.status == 502
+            assert mock_session.request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_make_request_post_not_retried_by_default(self, client):
+        """Test that POST requests are not retried unless opted in."""
+        with patch.object(client, 'session') as mock_session:
+            self._mock_responses(mock_session, self._response(503), self._response(200, {}))
+
+            with pytest.raises(CoupangAPIError):
+                await client._make_request("POST", "/v2/test", json_body={"a": 1})
+
+            assert mock_session.request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_make_request_deadline_bounds_timeout(self, client):
+        """Test that the HTTP timeout is shortened to the remaining deadline."""
+        with patch.object(client, 'session') as mock_session:
+            self._mock_responses(mock_session, self._response(200, {"data": "test"}))
+
+            with deadline_scope(2):
+                await client._make_request("GET", "/v2/test")
+
+            timeout = mock_session.request.call_args.kwargs["timeout"]
+            assert timeout.total <= 2
+
+    @pytest.mark.asyncio
+    async def test_make_request_deadline_stops_retries(self, client):
+        """Test that a backoff longer than the deadline fails fast."""
+        with patch.object(client, 'session') as mock_session:
+            self._mock_responses(
+                mock_session,
+                self._response(429, headers={"Retry-After": "10"}),
+                self._response(200, {"data": "test"})
+            )
+
+            with deadline_scope(1):
+                with pytest.raises(CoupangTimeoutError) as exc_info:
+                    await client._make_request("GET", "/v2/test")
+
+            assert exc_info.value.status == 429
+            assert mock_session.request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_make_request_deadline_bounds_shared_wait(self, client):
+        """Test that a caller stops waiting for a slow request at its deadline."""
+        async def slow_send(*args):
+            await asyncio.sleep(1)
+            return {"data": "test"}
+
+        with patch.object(client, '_send_request', side_effect=slow_send):
+            with deadline_scope(0.05):
+                with pytest.raises(CoupangTimeoutError):
+                    await client._make_request("GET", "/v2/test")
+
+    @pytest.mark.asyncio
+    async def test_make_request_deadline_bounds_rate_limit_wait(self):
+        """Test that rate-limit queueing never exceeds the deadline."""
+        client = CoupangClient(
+            access_key="test_key",
+            secret_key="test_secret",
+            partner_id="test_partner",
+            rate_limiter=RateLimiter({"search": 1}, max_queue_wait=30)
+        )
+        path = "/v2/providers/affiliate_open_api/apis/openapi/products/search"
+
+        with patch.object(client, 'session') as mock_session:
+            self._mock_responses(mock_session, self._response(200, {"data": []}))
+
+            await client._make_request("GET", path, {"keyword": "a"})
+
+            with deadline_scope(1):
+                with pytest.raises(CoupangTimeoutError):
+                    await client._make_request("GET", path, {"keyword": "b"})
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_after_upstream_failures(self):
+        """Test that repeated 5xx failures open the circuit and fail fast."""
+        client = CoupangClient(
+            access_key="test_key",
+            secret_key="test_secret",
+            partner_id="test_partner",
+            retry_policy=RetryPolicy(max_attempts=1)
+        )
+
+        with patch.object(client, 'session') as mock_session:
+            self._mock_responses(mock_session, *[self._response(503) for _ in range(5)])
+
+            for _ in range(5):
+                with pytest.raises(CoupangAPIError):
+                    await client._make_request("GET", "/v2/test")
+
+            assert client.circuit_state("default") == "open"
+
+            with pytest.raises(CoupangCircuitOpenError) as exc_info:
+                await client._make_request("GET", "/v2/test")
+
+            assert exc_info.value.retry_after > 0
+            assert mock_session.request.call_count == 5
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_open_circuit(self, client):
+        """Test that 4xx responses count as a healthy upstream."""
+        with patch.object(client, 'session') as mock_session:
+            self._mock_responses(mock_session, *[self._response(400) for _ in range(6)])
+
+            for _ in range(6):
+                with pytest.raises(CoupangAPIError):
+                    await client._make_request("GET", "/v2/test")
+
+            assert client.circuit_state("default") == "closed"
+
+    @pytest.mark.asyncio
+    async def test_search_serves_stale_while_circuit_open(self, client):
+        """Test that an expired cached search is served while the circuit is open."""
+        mock_products = [
+            {
+                "productId": "1",
+                "productName": "Product 1",
+                "productPrice": 10000,
+                "productImage": "https://example.com/1.jpg",
+                "productUrl": "https://example.com/1"
+            }
+        ]
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"data": mock_products}
+            await client.search_products("laptop", limit=10)
+
+            # Expire the entry without leaving the stale window
+            client.search_cache.ttl = 0.001
+            client.search_cache.set("laptop", client.search_cache.get_stale("laptop"))
+            await asyncio.sleep(0.01)
+
+            mock_request.side_effect = CoupangCircuitOpenError("open", "search", 10)
+            products = await client.search_products("laptop", limit=10)
+
+            assert [p.product_id for p in products] == ["1"]
+
+            with pytest.raises(CoupangCircuitOpenError):
+                await client.search_products("phone", limit=10)
+
+    @staticmethod
+    def _product_items(*product_ids):
+        """Create raw API product dicts."""
+        return [
+            {
+                "productId": product_id,
+                "productName": f"Product {product_id}",
+                "productPrice": 10000,
+                "productImage": f"https://example.com/{product_id}.jpg",
+                "productUrl": f"https://example.com/{product_id}"
+            }
+            for product_id in product_ids
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_products_batch_runs_concurrently(self, client):
+        """Test that keywords are searched concurrently and grouped in input order."""
+        in_flight = 0
+        peak = 0
+
+        async def search(method, path, params, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"data": {"productData": self._product_items(params["keyword"])}}
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = search
+
+            results = await client.search_products_batch(["노트북", "마우스", "키보드", "노트북"], limit=1)
+
+            assert mock_request.call_count == 3
+
+        assert list(results) == ["노트북", "마우스", "키보드"]
+        assert results["마우스"][0].product_id == "마우스"
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_search_products_batch_dedupes_normalized_keywords(self, client):
+        """Test that case and whitespace variants of a keyword share one upstream call."""
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"data": {"productData": self._product_items("1")}}
+
+            results = await client.search_products_batch(["Laptop", "laptop", " laptop ", "LAPTOP  bag"], limit=5)
+
+            assert mock_request.call_count == 2
+            assert mock_request.call_args_list[0].args[2]["keyword"] == "Laptop"
+
+        assert list(results) == ["Laptop", "laptop", " laptop ", "LAPTOP  bag"]
+        assert results["Laptop"] is results["laptop"] is results[" laptop "]
+        assert results["LAPTOP  bag"][0].product_id == "1"
+
+    @pytest.mark.asyncio
+    async def test_search_products_batch_uses_cache_and_reports_errors(self, client):
+        """Test that cached keywords skip the API and a failing keyword does not fail the others."""
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"data": {"productData": self._product_items("1")}}
+            await client.search_products("laptop", limit=10)
+
+            mock_request.side_effect = CoupangAPIError("API error: 500", status=500)
+            results = await client.search_products_batch(["laptop", "phone"], limit=10)
+
+            assert mock_request.call_count == 2
+
+        assert results["laptop"][0].product_id == "1"
+        assert isinstance(results["phone"], CoupangAPIError)
+
+    @pytest.mark.asyncio
+    async def test_search_products_batch_invalid_limit(self, client):
+        """Test that an invalid limit is rejected."""
+        with pytest.raises(ValueError):
+            await client.search_products_batch(["laptop"], limit=0)
+
+    @pytest.mark.asyncio
+    async def test_search_stale_while_revalidate(self, client):
+        """Test that a recently expired search is served at once and refreshed in the background."""
+        now = [1000.0]
+        client.search_cache = TTLCache(ttl=60, stale_ttl=3600, clock=lambda: now[0])
+        client.swr_window = 300
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"data": self._product_items("1")}
+            await client.search_products("laptop", limit=10)
+
+            now[0] += 120
+            mock_request.return_value = {"data": self._product_items("2")}
+            stale = await client.search_products("laptop", limit=10)
+
+            assert [p.product_id for p in stale] == ["1"]
+            assert client.get_stats()["revalidation"]["in_flight"] == 1
+
+            await asyncio.gather(*client._refreshes.values())
+            fresh = await client.search_products("laptop", limit=10)
+
+            assert [p.product_id for p in fresh] == ["2"]
+            assert mock_request.call_count == 2
+            assert client.get_stats()["revalidation"]["started"] == 1
+
+    @pytest.mark.asyncio
+    async def test_revalidation_bypasses_disk_cache(self, tmp_path):
+        """Test that a background refresh calls the API and stores the fresh response on disk."""
+        db_path = tmp_path / "responses.db"
+        client = CoupangClient(
+            access_key="test_key", secret_key="test_secret", partner_id="test_partner",
+            disk_cache=DiskCache(db_path, {"search": 3600}),
+            cache_swr_window=300
+        )
+        now = [1000.0]
+        client.search_cache = TTLCache(ttl=60, stale_ttl=3600, clock=lambda: now[0])
+
+        with patch.object(client, '_send_request', new_callable=AsyncMock) as mock_send:
+            mock_send.return_value = {"data": self._product_items("1")}
+            await client.search_products("laptop", limit=10)
+
+            now[0] += 120
+            mock_send.return_value = {"data": self._product_items("2")}
+            await client.search_products("laptop", limit=10)
+            await asyncio.gather(*client._refreshes.values())
+
+            fresh = await client.search_products("laptop", limit=10)
+
+            assert [p.product_id for p in fresh] == ["2"]
+            assert mock_send.call_count == 2
+
+        restarted = CoupangClient(
+            access_key="test_key", secret_key="test_secret", partner_id="test_partner",
+            disk_cache=DiskCache(db_path, {"search": 3600})
+        )
+        with patch.object(restarted, '_send_request', new_callable=AsyncMock) as mock_send:
+            products = await restarted.search_products("laptop", limit=10)
+
+            mock_send.assert_not_called()
+            assert [p.product_id for p in products] == ["2"]
+
+    @pytest.mark.asyncio
+    async def test_search_past_swr_window_waits_for_api(self, client):
+        """Test that entries expired beyond the window are fetched synchronously."""
+        now = [1000.0]
+        client.search_cache = TTLCache(ttl=60, stale_ttl=3600, clock=lambda: now[0])
+        client.swr_window = 300
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"data": self._product_items("1")}
+            await client.search_products("laptop", limit=10)
+
+            now[0] += 600
+            mock_request.return_value = {"data": self._product_items("2")}
+            products = await client.search_products("laptop", limit=10)
+
+            assert [p.product_id for p in products] == ["2"]
+            assert not client._refreshes
+
+    @pytest.mark.asyncio
+    async def test_revalidation_skipped_without_rate_limit_slot(self):
+        """Test that no background refresh is started when the budget is exhausted."""
+        client = CoupangClient(
+            access_key="test_key",
+            secret_key="test_secret",
+            partner_id="test_partner",
+            rate_limiter=RateLimiter({"search": 1}, max_queue_wait=0),
+            cache_swr_window=300
+        )
+        now = [1000.0]
+        client.search_cache = TTLCache(ttl=60, stale_ttl=3600, clock=lambda: now[0])
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"data": self._product_items("1")}
+            await client.search_products("laptop", limit=10)
+            await client.rate_limiter.acquire("search")
+
+            now[0] += 120
+            stale = await client.search_products("laptop", limit=10)
+
+            assert [p.product_id for p in stale] == ["1"]
+            assert not client._refreshes
+            assert client.refreshes_skipped == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_revalidation_keeps_stale_entry(self, client):
+        """Test that a failed refresh is counted and the stale entry stays usable."""
+        now = [1000.0]
+        client.search_cache = TTLCache(ttl=60, stale_ttl=3600, clock=lambda: now[0])
+        client.swr_window = 300
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"data": self._product_items("1")}
+            await client.search_products("laptop", limit=10)
+
+            now[0] += 120
+            mock_request.side_effect = CoupangAPIError("API error: 500", status=500)
+            await client.search_products("laptop", limit=10)
+            await asyncio.gather(*client._refreshes.values())
+
+            products = await client.search_products("laptop", limit=10)
+
+            assert [p.product_id for p in products] == ["1"]
+            assert client.refreshes_failed == 1
+
+    @pytest.mark.asyncio
+    async def test_category_best_products_cached(self, client):
+        """Test that category best products are cached and sliced for smaller limits."""
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"rCode": "0", "data": self._product_items("1", "2", "3")}
+
+            products = await client.get_best_products_by_category("1001", limit=20)
+            smaller = await client.get_best_products_by_category("1001", limit=2)
+
+            assert [p.product_id for p in products] == ["1", "2", "3"]
+            assert [p.product_id for p in smaller] == ["1", "2"]
+            mock_request.assert_called_once()
+            assert mock_request.call_args.args[2]["limit"] == 20
+
+    @pytest.mark.asyncio
+    async def test_make_request_rate_limited(self):
+        """Test that requests beyond the budget fail fast with a rate limit error."""
+        client = CoupangClient(
+            access_key="test_key",
+            secret_key="test_secret",
+            partner_id="test_partner",
+            rate_limiter=RateLimiter({"search": 1}, max_queue_wait=0)
+        )
+        path = "/v2/providers/affiliate_open_api/apis/openapi/products/search"
+
+        with patch.object(client, 'session') as mock_session:
+            mock_response = MagicMock()
+            mock_response.status = 200
+            mock_response.read = AsyncMock(return_value=b'{"data": []}')
+            mock_session.request = MagicMock(return_value=mock_response)
+            mock_session.request.return_value.__aenter__ = AsyncMock(return_value=mock_response)
+            mock_session.request.return_value.__aexit__ = AsyncMock(return_value=None)
+
+            await client._make_request("GET", path, {"keyword": "a"})
+
+            with pytest.raises(CoupangRateLimitError) as exc_info:
+                await client._make_request("GET", path, {"keyword": "b"})
+
+            assert exc_info.value.family == "search"
+            assert client.time_until_available("search") > 0
+            assert mock_session.request.call_count == 1
+
     @pytest.mark.asyncio
     async def test_search_products_success(self, client):
         """Test successful product search."""
@@ -163,6 +700,8 @@ class TestCoupangClient:
             assert products[1].product_name == "Product 2"
             mock_request.assert_called_once()
 
+        assert client.get_stats()["parse_latency"]["search"]["count"] == 1
+
     @pytest.mark.asyncio
     async def test_search_products_empty_results(self, client):
         """Test product search with no results."""
@@ -198,6 +737,473 @@ class TestCoupangClient:
 
             assert products == []
 
+    @pytest.mark.asyncio
+    async def test_search_products_cached(self, client):
+        """Test that repeated searches are served from cache."""
+        mock_products = [
+            {
+                "productId": "1",
+                "productName": "Product 1",
+                "productPrice": 10000,
+                "productImage": "https://example.com/1.jpg",
+                "productUrl": "https://example.com/1"
+            }
+        ]
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"data": mock_products}
+
+            first = await client.search_products("Laptop", limit=10)
+            second = await client.search_products("  laptop ", limit=10)
+
+            assert len(first) == len(second) == 1
+            mock_request.assert_called_once()
+
+        stats = client.get_stats()["search_cache"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_search_products_cache_disabled(self):
+        """Test that a zero TTL disables the search cache."""
+        client = CoupangClient(
+            access_key="test_key",
+            secret_key="test_secret",
+            partner_id="test_partner",
+            search_cache_ttl=0
+        )
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"data": []}
+
+            await client.search_products("laptop", limit=10)
+            await client.search_products("laptop", limit=10)
+
+            assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_products_smaller_limit_from_cache(self, client):
+        """Test that a smaller limit is sliced from a cached larger result."""
+        mock_products = [
+            {
+                "productId": str(i),
+                "productName": f"Product {i}",
+                "productPrice": 1000 * i,
+                "productImage": f"https://example.com/{i}.jpg",
+                "productUrl": f"https://example.com/{i}"
+            }
+            for i in range(1, 6)
+        ]
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"data": mock_products}
+
+            await client.search_products("laptop", limit=5)
+            products = await client.search_products("laptop", limit=2)
+
+            assert [p.product_id for p in products] == ["1", "2"]
+            mock_request.assert_called_once()
+
+            # A larger limit than cached requires a new request
+            mock_request.return_value = {"data": mock_products + mock_products}
+            await client.search_products("laptop", limit=10)
+
+            assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_products_overfetch(self):
+        """Test that over-fetching requests the maximum page on a miss."""
+        client = CoupangClient(
+            access_key="test_key",
+            secret_key="test_secret",
+            partner_id="test_partner",
+            search_overfetch=True
+        )
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"data": []}
+
+            await client.search_products("laptop", limit=10)
+            await client.search_products("laptop", limit=50)
+
+            mock_request.assert_called_once()
+            assert mock_request.call_args.args[2]["limit"] == 100
+
+    @pytest.mark.asyncio
+    async def test_search_products_as_records(self):
+        """Test that the records product format returns and caches ProductRecords."""
+        client = CoupangClient(
+            access_key="test_key",
+            secret_key="test_secret",
+            partner_id="test_partner",
+            product_format="records"
+        )
+        mock_products = [
+            {
+                "productId": 1,
+                "productName": "Product 1",
+                "productPrice": 10000,
+                "productImage": "https://example.com/1.jpg",
+                "productUrl": "https://example.com/1"
+            },
+            {"invalid": "data"}
+        ]
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"data": mock_products}
+
+            products = await client.search_products("laptop", limit=10)
+            cached = await client.search_products("laptop", limit=10)
+
+            assert len(products) == 1
+            assert isinstance(products[0], ProductRecord)
+            assert products[0].product_id == "1"
+            assert isinstance(cached[0], ProductRecord)
+            mock_request.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_search_products_as_batch(self):
+        """Test that the batch product format returns sliceable ProductBatches."""
+        client = CoupangClient(
+            access_key="test_key",
+            secret_key="test_secret",
+            partner_id="test_partner",
+            product_format="batch"
+        )
+        mock_products = [
+            {
+                "productId": str(i),
+                "productName": f"Product {i}",
+                "productPrice": 1000 * i,
+                "productImage": f"https://example.com/{i}.jpg",
+                "productUrl": f"https://example.com/{i}"
+            }
+            for i in range(1, 6)
+        ]
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"data": mock_products}
+
+            products = await client.search_products("laptop", limit=5)
+            cached = await client.search_products("laptop", limit=2)
+
+            assert isinstance(products, ProductBatch)
+            assert products.summary()["max_price"] == 5000
+            assert cached.product_ids == ["1", "2"]
+            mock_request.assert_called_once()
+
+    def test_unknown_product_format(self):
+        """Test that an unknown product format is rejected."""
+        with pytest.raises(ValueError, match="product format"):
+            CoupangClient(
+                access_key="test_key",
+                secret_key="test_secret",
+                partner_id="test_partner",
+                product_format="dataframe"
+            )
+
+    def test_typed_decode_requires_models(self):
+        """Test that typed decode is rejected for the records and batch formats."""
+        with pytest.raises(ValueError, match="Typed decode"):
+            CoupangClient(
+                access_key="test_key",
+                secret_key="test_secret",
+                partner_id="test_partner",
+                product_format="records",
+                typed_decode=True
+            )
+
+    @pytest.mark.asyncio
+    async def test_typed_decode_from_body_bytes(self):
+        """Test that typed decode validates search and category bodies straight into Products."""
+        client = CoupangClient(
+            access_key="test_key", secret_key="test_secret", partner_id="test_partner", typed_decode=True
+        )
+        item = {
+            "productId": 1, "productName": "노트북", "productPrice": 10000,
+            "productImage": "https://example.com/1.jpg", "productUrl": "https://example.com/1"
+        }
+        with patch.object(client, 'session') as mock_session, \
+                patch.object(client, 'json_decoder') as mock_decoder:
+            self._mock_responses(
+                mock_session,
+                self._response(200, {"rCode": "0", "data": {"productData": [item, {"productId": "bad"}]}}),
+                self._response(200, {"rCode": "0", "data": [item]})
+            )
+
+            searched = await client.search_products("노트북", limit=10)
+            best = await client.get_best_products_by_category("1016", limit=10)
+
+            mock_decoder.assert_not_called()
+
+        assert [type(p) for p in searched] == [Product]
+        assert best[0].product_id == "1"
+        assert client.parse_latency["search"].count == 1
+        assert client.parse_latency["bestcategories"].count == 1
+
+    @pytest.mark.asyncio
+    async def test_typed_decode_disk_cache(self, tmp_path):
+        """Test that typed decode stores raw bodies on disk that both decode paths can read."""
+        db_path = tmp_path / "responses.db"
+        body = {"rCode": "0", "data": {"productData": [{
+            "productId": "1", "productName": "디스크 캐시 상품", "productPrice": 10000,
+            "productImage": "https://example.com/1.jpg", "productUrl": "https://example.com/1"
+        }]}}
+        raw = json.dumps(body).encode("utf-8")
+
+        typed = CoupangClient(
+            access_key="test_key", secret_key="test_secret", partner_id="test_partner",
+            disk_cache=DiskCache(db_path, {"search": 60}), typed_decode=True
+        )
+        with patch.object(typed, '_send_request', new_callable=AsyncMock) as mock_send:
+            mock_send.return_value = raw
+            products = await typed.search_products("laptop", limit=10)
+
+            mock_send.assert_called_once()
+        assert products[0].product_name == "디스크 캐시 상품"
+
+        for typed_decode in (True, False):
+            restarted = CoupangClient(
+                access_key="test_key", secret_key="test_secret", partner_id="test_partner",
+                disk_cache=DiskCache(db_path, {"search": 60}), typed_decode=typed_decode
+            )
+            with patch.object(restarted, '_send_request', new_callable=AsyncMock) as mock_send:
+                products = await restarted.search_products("laptop", limit=10)
+
+                mock_send.assert_not_called()
+            assert products[0].product_name == "디스크 캐시 상품"
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_survives_restart(self, tmp_path):
+        """Test that a new client is served from the disk cache without network calls."""
+        db_path = tmp_path / "responses.db"
+        response = {"rCode": "0", "data": {"productData": [{
+            "productId": "1",
+            "productName": "디스크 캐시 상품",
+            "productPrice": 10000,
+            "productImage": "https://example.com/1.jpg",
+            "productUrl": "https://example.com/1"
+        }]}}
+
+        first = CoupangClient(
+            access_key="test_key", secret_key="test_secret", partner_id="test_partner",
+            disk_cache=DiskCache(db_path, {"search": 60})
+        )
+        with patch.object(first, '_send_request', new_callable=AsyncMock) as mock_send:
+            mock_send.return_value = response
+            await first.search_products("laptop", limit=10)
+            await first.search_products("laptop", limit=10)
+
+            mock_send.assert_called_once()
+
+        restarted = CoupangClient(
+            access_key="test_key", secret_key="test_secret", partner_id="test_partner",
+            disk_cache=DiskCache(db_path, {"search": 60})
+        )
+        with patch.object(restarted, '_send_request', new_callable=AsyncMock) as mock_send:
+            products = await restarted.search_products("laptop", limit=10)
+
+            mock_send.assert_not_called()
+            assert products[0].product_name == "디스크 캐시 상품"
+
+        assert restarted.get_stats()["disk_cache"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_skips_post_and_other_partners(self, tmp_path):
+        """Test that POST requests bypass the disk cache and keys are per partner."""
+        db_path = tmp_path / "responses.db"
+        path = "/v2/providers/affiliate_open_api/apis/openapi/products/123"
+        clients = [
+            CoupangClient(
+                access_key="test_key", secret_key="test_secret", partner_id=partner_id,
+                disk_cache=DiskCache(db_path, {"product": 60, "deeplink": 60})
+            )
+            for partner_id in ("partner_a", "partner_b")
+        ]
+
+        for client in clients:
+            with patch.object(client, '_send_request', new_callable=AsyncMock) as mock_send:
+                mock_send.return_value = {"data": []}
+                await client._make_request("GET", path)
+                await client._make_request("POST", "/v2/providers/affiliate_open_api/apis/openapi/deeplink",
+                                           json_body={"coupangUrls": []})
+                await client._make_request("POST", "/v2/providers/affiliate_open_api/apis/openapi/deeplink",
+                                           json_body={"coupangUrls": []})
+
+                assert mock_send.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_deeplink_store_sends_only_unseen_urls(self, tmp_path):
+        """Test that stored deeplinks are answered locally and only new canonical URLs are sent."""
+        client = CoupangClient(
+            access_key="test_key", secret_key="test_secret", partner_id="test_partner",
+            deeplink_store=DeepLinkStore(tmp_path / "deeplinks.db")
+        )
+
+        def convert(method, path, json_body):
+            return {"rCode": "0", "data": [
+                {"originalUrl": url, "shortenUrl": f"https://coupa.ng/{url[-1]}", "landingUrl": f"https://link/{url[-1]}"}
+                for url in json_body["coupangUrls"]
+            ]}
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = convert
+
+            first = await client.create_deeplinks(
+                ["https://www.coupang.com/vp/products/1", "https://www.coupang.com/vp/products/1?traceid=x"],
+                sub_id="sub"
+            )
+            second = await client.create_deeplinks(
+                ["http://coupang.com/vp/products/1/", "https://www.coupang.com/vp/products/2"],
+                sub_id="sub"
+            )
+
+            assert mock_request.call_count == 2
+            assert mock_request.call_args_list[0].kwargs["json_body"]["coupangUrls"] == [
+                "https://www.coupang.com/vp/products/1"
+            ]
+            assert mock_request.call_args_list[1].kwargs["json_body"]["coupangUrls"] == [
+                "https://www.coupang.com/vp/products/2"
+            ]
+
+            third = await client.create_deeplinks(["https://www.coupang.com/vp/products/2"], sub_id="sub")
+
+            assert mock_request.call_count == 2
+
+        assert [link.shorten_url for link in first] == ["https://coupa.ng/1", "https://coupa.ng/1"]
+        assert [link.original_url for link in second] == [
+            "http://coupang.com/vp/products/1/", "https://www.coupang.com/vp/products/2"
+        ]
+        assert third[0].landing_url == "https://link/2"
+        assert client.get_stats()["deeplink_store"]["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_deeplink_store_keyed_on_sub_id(self, tmp_path):
+        """Test that a different sub ID is converted again."""
+        client = CoupangClient(
+            access_key="test_key", secret_key="test_secret", partner_id="test_partner",
+            deeplink_store=DeepLinkStore(tmp_path / "deeplinks.db")
+        )
+        url = "https://www.coupang.com/vp/products/1"
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"rCode": "0", "data": [
+                {"originalUrl": url, "shortenUrl": "https://coupa.ng/1", "landingUrl": "https://link/1"}
+            ]}
+
+            await client.create_deeplinks([url], sub_id="a")
+            await client.create_deeplinks([url], sub_id="b")
+
+            assert mock_request.call_count == 2
+
+    @staticmethod
+    def _convert_deeplinks(method, path, json_body):
+        """Fake deeplink API response converting every requested URL."""
+        return {"rCode": "0", "data": [
+            {"originalUrl": url, "shortenUrl": f"https://coupa.ng/{url.rsplit('/', 1)[1]}", "landingUrl": url + "?lptag=AF"}
+            for url in json_body["coupangUrls"]
+        ]}
+
+    @pytest.mark.asyncio
+    async def test_create_deeplinks_chunks_large_batches(self, client):
+        """Test that large batches are deduplicated, chunked and returned in input order."""
+        urls = [f"https://www.coupang.com/vp/products/{i}" for i in range(45)]
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = self._convert_deeplinks
+
+            links = await client.create_deeplinks(urls + urls[:5], sub_id="sub")
+
+            sizes = sorted(len(call.kwargs["json_body"]["coupangUrls"]) for call in mock_request.call_args_list)
+            assert sizes == [5, 20, 20]
+
+        assert [link.original_url for link in links] == urls + urls[:5]
+        assert links[44].shorten_url == "https://coupa.ng/44"
+
+    @pytest.mark.asyncio
+    async def test_create_deeplinks_bounded_concurrency(self, client):
+        """Test that at most deeplink_concurrency chunks are in flight."""
+        client.deeplink_chunk_size = 2
+        client.deeplink_concurrency = 3
+        in_flight = 0
+        peak = 0
+
+        async def convert(method, path, json_body):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return self._convert_deeplinks(method, path, json_body)
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = convert
+
+            links = await client.create_deeplinks([f"https://www.coupang.com/vp/products/{i}" for i in range(20)])
+
+            assert mock_request.call_count == 10
+
+        assert len(links) == 20
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_create_deeplinks_batch_reports_failures_per_url(self, client):
+        """Test that a failed chunk only fails its own URLs."""
+        client.deeplink_chunk_size = 2
+        urls = [f"https://www.coupang.com/vp/products/{i}" for i in range(5)]
+
+        def convert(method, path, json_body):
+            if urls[2] in json_body["coupangUrls"]:
+                raise CoupangAPIError("API error: 500", status=500)
+            response = self._convert_deeplinks(method, path, json_body)
+            # The API silently drops URLs it cannot convert
+            response["data"] = [item for item in response["data"] if item["originalUrl"] != urls[4]]
+            return response
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = convert
+
+            result = await client.create_deeplinks_batch(urls)
+
+        assert [link.original_url for link in result.links] == urls[:2]
+        assert result.errors == {
+            urls[2]: "API error: 500",
+            urls[3]: "API error: 500",
+            urls[4]: "Not converted by the API",
+        }
+
+    @pytest.mark.asyncio
+    async def test_create_deeplinks_raises_when_all_fail(self, client):
+        """Test that create_deeplinks raises when no URL could be converted."""
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = CoupangAPIError("API error: 500", status=500)
+
+            with pytest.raises(CoupangAPIError):
+                await client.create_deeplinks(["https://www.coupang.com/vp/products/1"])
+
+    @pytest.mark.asyncio
+    async def test_concurrent_deeplink_calls_share_one_request(self, client):
+        """Test that concurrent calls within the batch window are sent as one request."""
+        client.deeplink_batcher.max_wait = 0.01
+        urls = [f"https://www.coupang.com/vp/products/{i}" for i in range(3)]
+
+        with patch.object(client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.side_effect = self._convert_deeplinks
+
+            first, second, other = await asyncio.gather(
+                client.create_deeplinks(urls[:2], sub_id="sub"),
+                client.create_deeplinks_batch([urls[1], urls[2]], sub_id="sub"),
+                client.create_deeplinks([urls[0]], sub_id="other")
+            )
+
+            assert mock_request.call_count == 2
+            sent = sorted(call.kwargs["json_body"]["coupangUrls"] for call in mock_request.call_args_list)
+            assert sent == [urls[:1], urls]
+
+        assert [link.original_url for link in first] == urls[:2]
+        assert [link.original_url for link in second.links] == urls[1:]
+        assert [link.original_url for link in other] == urls[:1]
+
     @pytest.mark.asyncio
     async def test_get_product_details_success(self, client):
         """Test successful product details retrieval."""
@@ -0,0 +1,108 @@
+"""
+Tests for request coalescing.
+
+Tests request key construction and single-flight call sharing.
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.coalesce import RequestCoalescer, make_request_key
+
+
+class TestMakeRequestKey:
+    """Test cases for make_request_key function."""
+
+    def test_same_request_same_key(self):
+        """Test that identical requests produce identical keys."""
+        key1 = make_request_key("GET", "/v2/search", "keyword=laptop&limit=10")
+        key2 = make_request_key("get", "/v2/search", "keyword=laptop&limit=10")
+
+        assert key1 == key2
+
+    def test_body_order_does_not_matter(self):
+        """Test that JSON bodies are hashed independent of key order."""
+        key1 = make_request_key("POST", "/v2/deeplink", json_body={"a": 1, "b": [1, 2]})
+        key2 = make_request_key("POST", "/v2/deeplink", json_body={"b": [1, 2], "a": 1})
+
+        assert key1 == key2
+
+    def test_different_query_different_key(self):
+        """Test that different queries produce different keys."""
+        key1 = make_request_key("GET", "/v2/search", "keyword=laptop")
+        key2 = make_request_key("GET", "/v2/search", "keyword=phone")
+
+        assert key1 != key2
+
+
+class TestRequestCoalescer:
+    """Test cases for RequestCoalescer class."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_folded(self):
+        """Test that concurrent identical calls share one execution."""
+        coalescer = RequestCoalescer()
+        executions = 0
+
+        async def fetch():
+            nonlocal executions
+            executions += 1
+            await asyncio.sleep(0.01)
+            return {"data": "shared"}
+
+        results = await asyncio.gather(*[
+            coalescer.run("key", fetch) for _ in range(5)
+        ])
+
+        assert executions == 1
+        assert all(result == {"data": "shared"} for result in results)
+        assert coalescer.stats() == {"in_flight": 0, "calls": 1, "folded": 4}
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_folded(self):
+        """Test that completed calls are not reused."""
+        coalescer = RequestCoalescer()
+
+        async def fetch():
+            return "value"
+
+        await coalescer.run("key", fetch)
+        await coalescer.run("key", fetch)
+
+        assert coalescer.calls == 2
+        assert coalescer.folded == 0
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared(self):
+        """Test that all waiting callers receive the call's exception."""
+        coalescer = RequestCoalescer()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream failed")
+
+        results = await asyncio.gather(
+            coalescer.run("key", fail),
+            coalescer.run("key", fail),
+            return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_call(self):
+        """Test that cancelling one caller leaves the shared call running."""
+        coalescer = RequestCoalescer()
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return "value"
+
+        first = asyncio.create_task(coalescer.run("key", fetch))
+        second = asyncio.create_task(coalescer.run("key", fetch))
+        await asyncio.sleep(0)
+
+        first.cancel()
+
+        assert await second == "value"
@@ -6,10 +6,12 @@ Tests environment variable loading and validation.
 
 import pytest
 import os
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
-from src.utils.config import Config
+from src.utils.config import Config, config, get_config
 
 
 class TestConfig:
@@ -83,3 +85,36 @@ class TestConfig:
         assert config.access_key == "test_access"
         assert config.secret_key == "test_secret"
         assert config.partner_id == "test_partner"
+
+
+class TestLazyConfig:
+    """Test cases for the lazily loaded global config."""
+
+    def test_get_config_is_cached(self):
+        """Test that the config is loaded once and shared."""
+        assert get_config() is get_config()
+
+    def test_global_config_forwards_to_loaded_config(self, monkeypatch):
+        """Test that reads and writes on the global config reach the shared instance."""
+        monkeypatch.setattr(config, "tool_timeout", 5.0)
+
+        assert get_config().tool_timeout == 5.0
+        assert config.tool_timeout == 5.0
+        assert config.partner_id == get_config().partner_id
+
+    def test_import_does_not_load_config(self):
+        """Test that importing the server neither loads the config nor requires credentials."""
+        env = {name: value for name, value in os.environ.items() if not name.startswith("COUPANG_")}
+        code = (
+            "import sys, src.server; from src.utils.config import get_config; "
+            "print(get_config.cache_info().currsize, 'aiohttp' in sys.modules)"
+        )
+
+        with patch.dict(os.environ, env, clear=True):
+            output = subprocess.run(
+                [sys.executable, "-c", code], cwd=Path(__file__).parent.parent,
+                capture_output=True, text=True, check=True
+            ).stdout
+
+        assert output.split() == ["0", "False"]
+
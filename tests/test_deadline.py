@@ -0,0 +1,50 @@
+"""
+Tests for deadline propagation.
+
+Tests deadline scopes, nesting and visibility in child tasks.
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.deadline import deadline_scope, remaining
+
+
+class TestDeadline:
+    """Test cases for deadline_scope and remaining."""
+
+    def test_no_deadline(self):
+        """Test that remaining is None outside any scope."""
+        assert remaining() is None
+
+    def test_scope_sets_and_resets(self):
+        """Test that a scope sets a deadline only inside the block."""
+        with deadline_scope(10):
+            assert 9 < remaining() <= 10
+
+        assert remaining() is None
+
+    def test_nested_scope_cannot_extend(self):
+        """Test that nested scopes only shorten the deadline."""
+        with deadline_scope(1):
+            with deadline_scope(100):
+                assert remaining() <= 1
+            with deadline_scope(0.5):
+                assert remaining() <= 0.5
+
+    def test_disabled_scope(self):
+        """Test that a zero budget leaves the deadline unchanged."""
+        with deadline_scope(0):
+            assert remaining() is None
+
+    @pytest.mark.asyncio
+    async def test_visible_in_child_tasks(self):
+        """Test that tasks started inside a scope inherit its deadline."""
+        async def child():
+            return remaining()
+
+        with deadline_scope(5):
+            time_left = await asyncio.create_task(child())
+
+        assert 4 < time_left <= 5
@@ -0,0 +1,125 @@
+"""
+Tests for the persistent deeplink memo.
+
+Tests URL canonicalization, per-partner/sub ID keys, expiry and sharing one
+database file between instances.
+"""
+
+import pytest
+
+from src.utils.deeplink_store import DeepLinkStore, canonicalize_url
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Shared fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path to a fresh store database."""
+    return tmp_path / "store" / "deeplinks.db"
+
+
+class TestCanonicalizeUrl:
+    """Test cases for canonicalize_url function."""
+
+    def test_strips_tracking_params(self):
+        """Test that tracking and search context parameters are removed."""
+        url = ("https://www.coupang.com/vp/products/184614775?itemId=1023216541&vendorItemId=70064597513"
+               "&q=laptop&traceid=V0-183&utm_source=blog&searchId=abc&rank=3")
+
+        assert canonicalize_url(url) == (
+            "https://www.coupang.com/vp/products/184614775?itemId=1023216541&vendorItemId=70064597513"
+        )
+
+    def test_normalizes_host_scheme_and_path(self):
+        """Test host, scheme, slash and fragment normalization."""
+        expected = "https://www.coupang.com/vp/products/184614775"
+
+        assert canonicalize_url("http://COUPANG.com//vp/products/184614775/") == expected
+        assert canonicalize_url("https://www.coupang.com:443/vp/products/184614775#reviews") == expected
+        assert canonicalize_url("  https://m.coupang.com/vm/products/184614775  ") == expected
+
+    def test_sorts_params(self):
+        """Test that parameter order does not matter."""
+        assert canonicalize_url("https://www.coupang.com/vp/products/1?vendorItemId=3&itemId=2") == \
+            canonicalize_url("https://www.coupang.com/vp/products/1?itemId=2&vendorItemId=3")
+
+    def test_keeps_product_identity(self):
+        """Test that different products stay different."""
+        assert canonicalize_url("https://www.coupang.com/vp/products/1?itemId=2") != \
+            canonicalize_url("https://www.coupang.com/vp/products/1?itemId=3")
+        assert canonicalize_url("https://www.coupang.com/np/search?component=&q=laptop") != \
+            canonicalize_url("https://www.coupang.com/np/search?component=")
+
+
+class TestDeepLinkStore:
+    """Test cases for DeepLinkStore class."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, db_path, clock):
+        """Test storing and reading back links."""
+        store = DeepLinkStore(db_path, clock=clock)
+
+        assert await store.get_many("partner", "sub", ["https://a", "https://b"]) == {}
+        await store.set_many("partner", "sub", {"https://a": ("https://coupa.ng/a", "https://link/a")})
+
+        assert await store.get_many("partner", "sub", ["https://a", "https://b"]) == {
+            "https://a": ("https://coupa.ng/a", "https://link/a")
+        }
+        stats = store.stats()
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 3
+
+    @pytest.mark.asyncio
+    async def test_keys_include_partner_and_sub_id(self, db_path, clock):
+        """Test that links are only shared within a partner and sub ID."""
+        store = DeepLinkStore(db_path, clock=clock)
+        await store.set_many("partner", None, {"https://a": ("short", "landing")})
+
+        assert await store.get_many("partner", "", ["https://a"]) != {}
+        assert await store.get_many("partner", "other", ["https://a"]) == {}
+        assert await store.get_many("other", None, ["https://a"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self, db_path, clock):
+        """Test that entries expire after ttl when set."""
+        store = DeepLinkStore(db_path, ttl=60, clock=clock)
+        await store.set_many("partner", "sub", {"https://a": ("short", "landing")})
+
+        clock.now += 61
+
+        assert await store.get_many("partner", "sub", ["https://a"]) == {}
+
+    @pytest.mark.asyncio
+    async def test_large_lookup(self, db_path, clock):
+        """Test lookups beyond the per-query parameter chunk."""
+        store = DeepLinkStore(db_path, clock=clock)
+        links = {f"https://p/{i}": (f"s{i}", f"l{i}") for i in range(1200)}
+        await store.set_many("partner", "sub", links)
+
+        assert await store.get_many("partner", "sub", list(links)) == links
+
+    @pytest.mark.asyncio
+    async def test_shared_between_instances(self, db_path, clock):
+        """Test that a second instance on the same file sees stored links."""
+        first = DeepLinkStore(db_path, clock=clock)
+        await first.set_many("partner", "sub", {"https://a": ("short", "landing")})
+        first.close()
+
+        second = DeepLinkStore(db_path, clock=clock)
+
+        assert await second.get_many("partner", "sub", ["https://a"]) == {"https://a": ("short", "landing")}
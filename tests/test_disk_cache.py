@@ -0,0 +1,128 @@
+"""
+Tests for persistent disk cache.
+
+Tests TTL expiry, per-family settings, size-capped LRU eviction and sharing
+one database file between instances.
+"""
+
+import pytest
+
+from src.utils.disk_cache import DiskCache
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Shared fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path to a fresh cache database."""
+    return tmp_path / "cache" / "responses.db"
+
+
+class TestDiskCache:
+    """Test cases for DiskCache class."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, db_path, clock):
+        """Test storing and reading back a payload."""
+        cache = DiskCache(db_path, {"search": 60}, clock=clock)
+
+        assert await cache.get("search", "k") is None
+        await cache.set("search", "k", b'{"rCode": "0"}')
+
+        assert await cache.get("search", "k") == b'{"rCode": "0"}'
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_payloads_are_compressed(self, db_path, clock):
+        """Test that stored sizes are compressed sizes."""
+        cache = DiskCache(db_path, {"search": 60}, clock=clock)
+        payload = b'{"productName": "laptop"}' * 200
+
+        await cache.set("search", "k", payload)
+
+        assert cache.stats()["bytes"] < len(payload) / 10
+
+    @pytest.mark.asyncio
+    async def test_ttl_per_family(self, db_path, clock):
+        """Test that each family expires on its own TTL and 0 disables it."""
+        cache = DiskCache(db_path, {"search": 60, "product": 600, "bestcategories": 0}, clock=clock)
+        await cache.set("search", "s", b"search")
+        await cache.set("product", "p", b"product")
+        await cache.set("bestcategories", "b", b"category")
+
+        clock.now += 120
+
+        assert await cache.get("search", "s") is None
+        assert await cache.get("product", "p") == b"product"
+        assert not cache.enabled_for("bestcategories")
+        assert cache.stats()["entries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_over_size_cap(self, db_path, clock):
+        """Test that the least recently used entries are evicted first."""
+        cache = DiskCache(db_path, {"search": 60}, max_bytes=250, compress_level=0, clock=clock)
+        for key in ("a", "b"):
+            clock.now += 1
+            await cache.set("search", key, key.encode() * 100)
+
+        clock.now += 1
+        assert await cache.get("search", "a") is not None
+
+        clock.now += 1
+        await cache.set("search", "c", b"c" * 100)
+
+        assert await cache.get("search", "b") is None
+        assert await cache.get("search", "a") is not None
+        assert await cache.get("search", "c") is not None
+        assert cache.stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_evicted_first(self, db_path, clock):
+        """Test that expired entries go before live ones when over the cap."""
+        cache = DiskCache(db_path, {"search": 60, "product": 600}, max_bytes=250, compress_level=0, clock=clock)
+        await cache.set("product", "live", b"p" * 100)
+        await cache.set("search", "old", b"s" * 100)
+
+        clock.now += 120
+        await cache.set("search", "new", b"n" * 100)
+
+        assert await cache.get("product", "live") is not None
+        assert cache.stats()["entries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_between_instances(self, db_path, clock):
+        """Test that a second instance (or process) sees stored entries."""
+        first = DiskCache(db_path, {"search": 60}, clock=clock)
+        await first.set("search", "k", b"shared")
+        first.close()
+
+        second = DiskCache(db_path, {"search": 60}, clock=clock)
+
+        assert await second.get("search", "k") == b"shared"
+
+    @pytest.mark.asyncio
+    async def test_errors_are_misses(self, db_path, clock):
+        """Test that database failures are logged and treated as misses."""
+        cache = DiskCache(db_path, {"search": 60}, clock=clock)
+        cache.close()
+
+        await cache.set("search", "k", b"value")
+
+        assert await cache.get("search", "k") is None
+        assert cache.errors == 2
@@ -0,0 +1,32 @@
+"""
+Tests for JSON decoder selection.
+
+Tests decoder lookup and decoding from raw bytes.
+"""
+
+import pytest
+
+from src.utils.json_codec import available_decoders, get_decoder
+
+
+class TestJsonCodec:
+    """Test cases for JSON decoder functions."""
+
+    def test_stdlib_always_available(self):
+        """Test that the standard library decoder is always listed last."""
+        assert available_decoders()[-1] == "json"
+
+    @pytest.mark.parametrize("name", ["auto", "json"])
+    def test_decode_bytes(self, name):
+        """Test decoding UTF-8 bytes including Korean text."""
+        decode = get_decoder(name)
+
+        assert decode('{"name": "노트북", "price": 1000}'.encode("utf-8")) == {
+            "name": "노트북",
+            "price": 1000
+        }
+
+    def test_unknown_decoder(self):
+        """Test that unknown decoder names are rejected."""
+        with pytest.raises(ValueError):
+            get_decoder("yaml")
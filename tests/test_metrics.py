@@ -0,0 +1,61 @@
+"""
+Tests for runtime metrics.
+
+Tests latency recording, percentile reporting and response size recording.
+"""
+
+from src.utils.metrics import LatencyStats, SizeStats
+
+
+class TestLatencyStats:
+    """Test cases for LatencyStats class."""
+
+    def test_empty_stats(self):
+        """Test statistics before anything is recorded."""
+        stats = LatencyStats().stats()
+
+        assert stats["count"] == 0
+        assert stats["mean_ms"] == 0.0
+        assert stats["p95_ms"] == 0.0
+
+    def test_record_and_summarize(self):
+        """Test count, failures, mean and max."""
+        latency = LatencyStats()
+        latency.record(0.010)
+        latency.record(0.030, ok=False)
+
+        stats = latency.stats()
+
+        assert stats["count"] == 2
+        assert stats["failures"] == 1
+        assert stats["mean_ms"] == 20.0
+        assert stats["max_ms"] == 30.0
+
+    def test_percentiles_use_recent_window(self):
+        """Test that percentiles only consider the most recent samples."""
+        latency = LatencyStats(window=10)
+        for _ in range(10):
+            latency.record(1.0)
+        for i in range(10):
+            latency.record(i / 1000)
+
+        assert latency.percentile(50) < 0.01
+        assert latency.max == 1.0
+
+
+class TestSizeStats:
+    """Test cases for SizeStats class."""
+
+    def test_records_chars_and_bytes(self):
+        """Test that characters and UTF-8 bytes are both accounted."""
+        stats = SizeStats()
+        stats.record("ab")
+        stats.record("노트북")
+
+        assert stats.stats() == {
+            "count": 2,
+            "mean_chars": 2.5,
+            "max_chars": 3,
+            "total_chars": 5,
+            "total_bytes": 11,
+        }
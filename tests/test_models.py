@@ -4,10 +4,21 @@ Tests for data models.
 Tests Pydantic models for products and search parameters.
 """
 
+import json
+
 import pytest
 from pydantic import ValidationError
 
-from src.models.product import Product, ProductSearchResponse, SearchParams
+from src.models.product import (
+    DeepLink,
+    Product,
+    ProductFilter,
+    ProductSearchResponse,
+    SearchParams,
+    parse_deeplinks,
+    parse_products,
+    parse_products_json,
+)
 
 
 class TestProduct:
@@ -141,6 +152,30 @@ class TestProductSearchResponse:
         assert response.total_count is None
 
 
+class TestProductFilter:
+    """Test cases for ProductFilter model."""
+
+    def test_defaults_inactive(self):
+        """Test that no options means no filtering."""
+        assert not ProductFilter().is_active
+
+    def test_any_option_activates(self):
+        """Test that a single filter or sort option activates filtering."""
+        assert ProductFilter(max_price=50000).is_active
+        assert ProductFilter(rocket_only=True).is_active
+        assert ProductFilter(sort_by="price").is_active
+
+    def test_invalid_price_range(self):
+        """Test that min_price above max_price is rejected."""
+        with pytest.raises(ValidationError):
+            ProductFilter(min_price=20000, max_price=10000)
+
+    def test_invalid_sort_key(self):
+        """Test that unknown sort keys are rejected."""
+        with pytest.raises(ValidationError):
+            ProductFilter(sort_by="rating")
+
+
 class TestSearchParams:
     """Test cases for SearchParams model."""
 
@@ -207,3 +242,66 @@ class TestSearchParams:
 
         params2 = SearchParams(keyword="iPhone 15 Pro", limit=10)
         assert params2.keyword == "iPhone 15 Pro"
+
+
+class TestParseProducts:
+    """Test cases for batch product parsing."""
+
+    @staticmethod
+    def _item(product_id):
+        """Create a raw API product dict."""
+        return {
+            "productId": product_id,
+            "productName": f"Product {product_id}",
+            "productPrice": 10000,
+            "productImage": "https://example.com/img.jpg",
+            "productUrl": "https://example.com/product"
+        }
+
+    def test_parse_valid_batch(self):
+        """Test that a valid array is parsed in order."""
+        products = parse_products([self._item(1), self._item("2")])
+
+        assert all(isinstance(p, Product) for p in products)
+        assert [p.product_id for p in products] == ["1", "2"]
+
+    def test_parse_skips_invalid_items(self):
+        """Test that invalid items are skipped without dropping valid ones."""
+        products = parse_products([self._item("1"), {"invalid": "data"}, self._item("3")])
+
+        assert [p.product_id for p in products] == ["1", "3"]
+
+    def test_parse_empty_and_unexpected_shapes(self):
+        """Test that empty arrays and non-list payloads yield no products."""
+        assert parse_products([]) == []
+        assert parse_products({"unexpected": "shape"}) == []
+
+    def test_parse_deeplinks(self):
+        """Test batch deeplink parsing."""
+        deeplinks = parse_deeplinks([
+            {
+                "originalUrl": "https://www.coupang.com/vp/products/1",
+                "shortenUrl": "https://coupa.ng/a",
+                "landingUrl": "https://link.coupang.com/a"
+            },
+            {"originalUrl": "missing fields"}
+        ])
+
+        assert len(deeplinks) == 1
+        assert isinstance(deeplinks[0], DeepLink)
+        assert deeplinks[0].shorten_url == "https://coupa.ng/a"
+
+    def test_parse_products_json_both_shapes(self):
+        """Test typed decoding of search and category response bodies."""
+        items = [self._item("1"), self._item(2)]
+        search_body = json.dumps({"rCode": "0", "data": {"productData": items}}).encode()
+        category_body = json.dumps({"rCode": "0", "data": items}).encode()
+
+        assert [p.product_id for p in parse_products_json(search_body)] == ["1", "2"]
+        assert [p.product_id for p in parse_products_json(category_body)] == ["1", "2"]
+
+    def test_parse_products_json_skips_invalid_items(self):
+        """Test that typed decoding falls back when an item is invalid."""
+        body = json.dumps({"data": [self._item("1"), {"invalid": "data"}]}).encode()
+
+        assert [p.product_id for p in parse_products_json(body)] == ["1"]
@@ -0,0 +1,131 @@
+"""
+Tests for compact tool output formats.
+
+Tests option validation, field selection and the compact_json and table
+renderings of products and deeplinks.
+"""
+
+import json
+
+import pytest
+
+from src.models.batch import ProductBatch
+from src.models.product import DeepLink, Product
+from src.tools.output import (
+    DEFAULT_FIELDS,
+    format_deeplinks,
+    format_product_groups,
+    format_products,
+    validate_output_options,
+)
+from src.tools.search import format_search_results
+
+
+@pytest.fixture
+def products():
+    """Products with and without optional fields."""
+    return [
+        Product(productId="1", productName="LG 그램", productPrice=1899000, productImage="https://example.com/1.jpg",
+                productUrl="https://link.coupang.com/1", isRocket=True, discountRate=10),
+        Product(productId="2", productName="갤럭시북", productPrice=1499000, productImage="https://example.com/2.jpg",
+                productUrl="https://link.coupang.com/2", isRocket=False),
+    ]
+
+
+class TestValidateOutputOptions:
+    """Test cases for validate_output_options function."""
+
+    def test_defaults(self):
+        """Test that missing options mean text with default fields."""
+        assert validate_output_options() == ("text", DEFAULT_FIELDS)
+
+    def test_requested_fields_deduplicated(self):
+        """Test that requested fields keep their order without duplicates."""
+        assert validate_output_options("table", ["price", "id", "price"]) == ("table", ("price", "id"))
+
+    def test_unknown_format_or_field(self):
+        """Test that unknown formats and fields are rejected."""
+        with pytest.raises(ValueError):
+            validate_output_options("xml")
+        with pytest.raises(ValueError):
+            validate_output_options("table", ["rating"])
+
+    @pytest.mark.parametrize("fields", ["id", "id,price", {"id": True}, [1, 2]])
+    def test_fields_must_be_list_of_names(self, fields):
+        """Test that fields given as a string or other non-list are rejected with a clear message."""
+        with pytest.raises(ValueError, match="fields must be a list of field names"):
+            validate_output_options("table", fields)
+
+
+class TestFormatProducts:
+    """Test cases for product output formats."""
+
+    def test_compact_json(self, products):
+        """Test that compact JSON has only requested fields and omits empty values."""
+        text = format_products(products, "compact_json", ("id", "price", "rocket", "discount"), {"keyword": "노트북"})
+
+        assert json.loads(text) == {
+            "keyword": "노트북",
+            "count": 2,
+            "products": [
+                {"id": "1", "price": 1899000, "rocket": True, "discount": 10},
+                {"id": "2", "price": 1499000},
+            ],
+        }
+        assert " " not in text
+
+    def test_table(self, products):
+        """Test the tab-separated table with meta lines."""
+        text = format_products(products, "table", ("id", "name", "discount"), {"keyword": "노트북"})
+
+        assert text.split("\n") == [
+            "# keyword: 노트북",
+            "id\tname\tdiscount",
+            "1\tLG 그램\t10",
+            "2\t갤럭시북\t",
+        ]
+
+    def test_batch_input(self, products):
+        """Test that a ProductBatch renders like the product list."""
+        batch = ProductBatch.from_products(products)
+
+        assert format_products(batch, "compact_json") == format_products(products, "compact_json")
+
+    def test_smaller_than_text(self, products):
+        """Test that compact formats are smaller than the text format, and much smaller with few fields."""
+        text = format_search_results(products * 50, "노트북")
+
+        assert len(format_products(products * 50, "compact_json")) < len(text)
+        assert len(format_products(products * 50, "table")) < len(text) * 0.6
+        assert len(format_products(products * 50, "table", ("id", "price"))) < len(text) / 5
+
+    def test_groups_with_errors(self, products):
+        """Test grouped output including a failed keyword."""
+        groups = {"노트북": products[:1], "마우스": ValueError("API error: 500")}
+
+        assert json.loads(format_product_groups(groups, "compact_json", ("id",))) == [
+            {"keyword": "노트북", "count": 1, "products": [{"id": "1"}]},
+            {"keyword": "마우스", "error": "API error: 500", "count": 0, "products": []},
+        ]
+
+
+class TestFormatDeeplinks:
+    """Test cases for deeplink output formats."""
+
+    def test_compact_json_and_table(self):
+        """Test both compact renderings with an unconverted URL."""
+        links = [DeepLink(originalUrl="https://www.coupang.com/vp/products/1", shortenUrl="https://coupa.ng/a",
+                          landingUrl="https://link.coupang.com/re/a")]
+        errors = {"https://www.coupang.com/vp/products/2": "Not converted by the API"}
+
+        assert json.loads(format_deeplinks(links, errors, "compact_json")) == {
+            "count": 1,
+            "links": [{"url": "https://www.coupang.com/vp/products/1", "short": "https://coupa.ng/a",
+                       "landing": "https://link.coupang.com/re/a"}],
+            "errors": errors,
+        }
+        assert format_deeplinks(links, errors, "table").split("\n") == [
+            "url\tshort\tlanding",
+            "https://www.coupang.com/vp/products/1\thttps://coupa.ng/a\thttps://link.coupang.com/re/a",
+            "# error: https://www.coupang.com/vp/products/2: Not converted by the API",
+        ]
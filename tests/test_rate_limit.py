@@ -0,0 +1,227 @@
+"""
+Tests for rate limiting.
+
+Tests endpoint classification, token buckets and the per-family limiter.
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.rate_limit import (
+    RateLimiter,
+    RateLimitTimeout,
+    SQLiteRateLimiter,
+    TokenBucket,
+    create_rate_limiter,
+    endpoint_family,
+)
+
+
+BASE_PATH = "/v2/providers/affiliate_open_api/apis/openapi"
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic refill tests."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestEndpointFamily:
+    """Test cases for endpoint_family function."""
+
+    @pytest.mark.parametrize("path,family", [
+        (f"{BASE_PATH}/products/search", "search"),
+        (f"{BASE_PATH}/products/bestcategories/1001", "bestcategories"),
+        (f"{BASE_PATH}/products/1234567890", "product"),
+        (f"{BASE_PATH}/deeplink", "deeplink"),
+        ("/v2/test", "default"),
+    ])
+    def test_classification(self, path, family):
+        """Test that API paths map to the right family."""
+        assert endpoint_family(path) == family
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket class."""
+
+    @pytest.fixture
+    def clock(self):
+        """Create fake clock."""
+        return FakeClock()
+
+    def test_burst_up_to_capacity(self, clock):
+        """Test that a full bucket allows a burst of capacity calls."""
+        bucket = TokenBucket(rate_per_minute=60, capacity=3, clock=clock)
+
+        assert all(bucket.try_acquire() for _ in range(3))
+        assert not bucket.try_acquire()
+
+    def test_refill_over_time(self, clock):
+        """Test that tokens refill at the configured rate."""
+        bucket = TokenBucket(rate_per_minute=60, capacity=1, clock=clock)
+        bucket.try_acquire()
+
+        assert bucket.time_until_available() == pytest.approx(1.0)
+
+        clock.now += 1
+        assert bucket.time_until_available() == 0
+        assert bucket.try_acquire()
+
+    def test_invalid_rate(self):
+        """Test that the rate must be positive."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate_per_minute=0)
+
+    @pytest.mark.parametrize("rate", [1, 6, 50, 100])
+    def test_default_capacity_stays_within_one_minute(self, clock, rate):
+        """Test that a fresh bucket admits at most rate_per_minute calls in its first minute."""
+        bucket = TokenBucket(rate_per_minute=rate, clock=clock)
+        started = clock.now
+        calls = 0
+
+        # Call as fast as the bucket allows for one full minute
+        while clock.now < started + 60:
+            if bucket.try_acquire():
+                calls += 1
+            clock.now += 0.01
+
+        # Never above the upstream limit; at most one call lost to float rounding of the clock
+        assert rate - 1 <= calls <= rate
+
+    @pytest.mark.asyncio
+    async def test_acquire_rejects_long_wait(self, clock):
+        """Test that acquire fails fast when the wait exceeds max_wait."""
+        bucket = TokenBucket(rate_per_minute=6, capacity=1, clock=clock)
+        await bucket.acquire()
+
+        with pytest.raises(RateLimitTimeout) as exc_info:
+            await bucket.acquire(max_wait=1)
+
+        assert exc_info.value.wait == pytest.approx(10.0)
+        assert bucket.rejected == 1
+
+    @pytest.mark.asyncio
+    async def test_waiters_served_in_order(self):
+        """Test that queued callers are granted tokens in FIFO order."""
+        bucket = TokenBucket(rate_per_minute=3000, capacity=1)
+        order = []
+
+        async def call(index):
+            await bucket.acquire()
+            order.append(index)
+
+        await asyncio.gather(*[call(i) for i in range(4)])
+
+        assert order == [0, 1, 2, 3]
+        assert bucket.acquired == 4
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter class."""
+
+    @pytest.mark.asyncio
+    async def test_unlimited_family(self):
+        """Test that families without a budget are never delayed."""
+        limiter = RateLimiter({"search": 1})
+
+        for _ in range(10):
+            assert await limiter.acquire("default") == 0.0
+        assert limiter.time_until_available("default") == 0.0
+
+    @pytest.mark.asyncio
+    async def test_zero_limit_disables_family(self):
+        """Test that a zero budget leaves the family unlimited."""
+        limiter = RateLimiter({"search": 0})
+
+        assert "search" not in limiter.buckets
+
+    @pytest.mark.asyncio
+    async def test_families_are_independent(self):
+        """Test that each family has its own budget."""
+        limiter = RateLimiter({"search": 1, "deeplink": 1}, max_queue_wait=0)
+
+        await limiter.acquire("search")
+        await limiter.acquire("deeplink")
+
+        with pytest.raises(RateLimitTimeout) as exc_info:
+            await limiter.acquire("search")
+
+        assert exc_info.value.family == "search"
+        assert limiter.time_until_available("search") > 0
+
+
+class TestSQLiteRateLimiter:
+    """Test cases for SQLiteRateLimiter class."""
+
+    @pytest.fixture
+    def clock(self):
+        """Create fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """Path to a temporary shared database."""
+        return tmp_path / "rate_limit.db"
+
+    def test_budget_shared_between_instances(self, db_path, clock):
+        """Test that two limiters on one file share a single budget."""
+        first = SQLiteRateLimiter(db_path, {"search": 2}, clock=clock)
+        second = SQLiteRateLimiter(db_path, {"search": 2}, clock=clock)
+
+        assert first.try_acquire("search")
+        assert second.try_acquire("search")
+        assert not first.try_acquire("search")
+        assert not second.try_acquire("search")
+
+        assert second.stats()["search"]["used_in_window"] == 2
+
+    def test_window_slides(self, db_path, clock):
+        """Test that calls leave the window after a minute."""
+        limiter = SQLiteRateLimiter(db_path, {"search": 1}, clock=clock)
+        limiter.try_acquire("search")
+
+        clock.now += 30
+        assert limiter.time_until_available("search") == pytest.approx(30.0)
+
+        clock.now += 31
+        assert limiter.time_until_available("search") == 0.0
+        assert limiter.try_acquire("search")
+
+    @pytest.mark.asyncio
+    async def test_acquire_rejects_long_wait(self, db_path, clock):
+        """Test that acquire fails fast when the wait exceeds max_wait."""
+        limiter = SQLiteRateLimiter(db_path, {"search": 1}, max_queue_wait=5, clock=clock)
+
+        await limiter.acquire("search")
+
+        with pytest.raises(RateLimitTimeout) as exc_info:
+            await limiter.acquire("search")
+
+        assert exc_info.value.family == "search"
+        assert await limiter.acquire("deeplink") == 0.0
+
+    def test_rate_below_one_rejected(self, db_path):
+        """Test that limits the minute window cannot represent are rejected."""
+        with pytest.raises(ValueError, match="search"):
+            SQLiteRateLimiter(db_path, {"search": 0.5})
+
+    def test_fractional_rate_rounded_down(self, db_path, clock):
+        """Test that a fractional limit never admits more calls than configured."""
+        limiter = SQLiteRateLimiter(db_path, {"search": 1.5, "deeplink": 0}, clock=clock)
+
+        assert limiter.try_acquire("search")
+        assert not limiter.try_acquire("search")
+        assert "deeplink" not in limiter.limits
+
+    def test_create_rate_limiter_backend(self, db_path):
+        """Test that a database path selects the shared backend."""
+        assert isinstance(create_rate_limiter({"search": 50}), RateLimiter)
+        assert isinstance(
+            create_rate_limiter({"search": 50}, db_path=str(db_path)),
+            SQLiteRateLimiter
+        )
@@ -0,0 +1,132 @@
+"""
+Tests for compact product records.
+
+Tests construction from API dicts, conversion to and from Product, and parsing.
+"""
+
+import sys
+
+import pytest
+
+from src.models.product import Product
+from src.models.record import ProductRecord, parse_product_records
+
+
+def _item(product_id, **overrides):
+    """Build a raw API product dict."""
+    item = {
+        "productId": product_id,
+        "productName": f"Product {product_id}",
+        "productPrice": 10000,
+        "productImage": "https://example.com/image.jpg",
+        "productUrl": "https://example.com/product",
+        "categoryName": "Electronics",
+        "isRocket": True,
+        "isFreeShipping": False,
+        "discountRate": 15,
+        "originalPrice": 11765,
+    }
+    item.update(overrides)
+    return item
+
+
+class TestProductRecord:
+    """Test cases for ProductRecord class."""
+
+    def test_from_api_matches_product(self):
+        """Test that records carry the same values as validated Products."""
+        item = _item(1234567890)
+
+        record = ProductRecord.from_api(item)
+        product = Product(**item)
+
+        assert record.to_dict() == product.model_dump()
+        assert record.product_id == "1234567890"
+
+    def test_from_api_optional_fields(self):
+        """Test that missing optional fields default to None."""
+        record = ProductRecord.from_api({
+            "productId": "1",
+            "productName": "Test",
+            "productPrice": 1000,
+            "productImage": "https://example.com/image.jpg",
+            "productUrl": "https://example.com/product",
+        })
+
+        assert record.category_name is None
+        assert record.is_rocket is None
+        assert record.discount_rate is None
+
+    def test_from_api_coerces_like_product(self):
+        """Test numeric and boolean string coercion."""
+        item = _item("1", productPrice="25000", isRocket="false", discountRate="10")
+
+        record = ProductRecord.from_api(item)
+
+        assert record.to_dict() == Product(**item).model_dump()
+        assert record.product_price == 25000
+        assert record.is_rocket is False
+
+    @pytest.mark.parametrize("item", [
+        {"productId": "1"},
+        _item("1", productPrice="free"),
+        _item("1", productName=None),
+        _item("1", isRocket="maybe"),
+        "not a dict",
+    ])
+    def test_from_api_invalid(self, item):
+        """Test that invalid items raise ValueError."""
+        with pytest.raises(ValueError):
+            ProductRecord.from_api(item)
+
+    def test_product_round_trip(self):
+        """Test conversion to and from Product."""
+        product = Product(**_item("42"))
+
+        record = ProductRecord.from_product(product)
+
+        assert record.to_product() == product
+        assert ProductRecord.from_product(record.to_product()) == record
+
+    def test_to_dict_by_alias(self):
+        """Test API field names in dict output."""
+        item = _item("7")
+
+        assert ProductRecord.from_api(item).to_dict(by_alias=True) == item | {"productId": "7"}
+
+    def test_equality(self):
+        """Test value equality between records."""
+        assert ProductRecord.from_api(_item("1")) == ProductRecord.from_api(_item("1"))
+        assert ProductRecord.from_api(_item("1")) != ProductRecord.from_api(_item("2"))
+
+    def test_slots(self):
+        """Test that records have no per-instance dict and are smaller than Products."""
+        record = ProductRecord.from_api(_item("1"))
+        product = Product(**_item("1"))
+
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.extra = "value"
+        assert sys.getsizeof(record) < sys.getsizeof(product) + sys.getsizeof(product.__dict__)
+
+
+class TestParseProductRecords:
+    """Test cases for parse_product_records function."""
+
+    def test_parse_valid_batch(self):
+        """Test parsing a batch of valid items."""
+        records = parse_product_records([_item("1"), _item(2)])
+
+        assert [r.product_id for r in records] == ["1", "2"]
+        assert all(isinstance(r, ProductRecord) for r in records)
+
+    def test_parse_skips_invalid_items(self):
+        """Test that invalid items are skipped without dropping valid ones."""
+        records = parse_product_records([_item("1"), {"invalid": "data"}, _item("3")])
+
+        assert [r.product_id for r in records] == ["1", "3"]
+
+    def test_parse_empty_and_unexpected_shapes(self):
+        """Test that empty arrays and non-list payloads yield no records."""
+        assert parse_product_records([]) == []
+        assert parse_product_records({"unexpected": "shape"}) == []
@@ -0,0 +1,90 @@
+"""
+Tests for retry policy.
+
+Tests backoff computation, retry decisions and Retry-After parsing.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from src.utils.retry import RetryPolicy, parse_retry_after
+
+
+class TestParseRetryAfter:
+    """Test cases for parse_retry_after function."""
+
+    def test_seconds(self):
+        """Test delay-seconds values."""
+        assert parse_retry_after("5") == 5.0
+        assert parse_retry_after(" 2.5 ") == 2.5
+
+    def test_http_date(self):
+        """Test HTTP-date values relative to now."""
+        now = datetime(2024, 10, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+        assert parse_retry_after("Tue, 15 Oct 2024 12:00:10 GMT", now=now) == 10.0
+
+    def test_past_date_is_zero(self):
+        """Test that dates in the past mean no delay."""
+        now = datetime(2024, 10, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+        assert parse_retry_after("Tue, 15 Oct 2024 11:00:00 GMT", now=now) == 0.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon", 42])
+    def test_invalid_values(self, value):
+        """Test that missing or invalid values return None."""
+        assert parse_retry_after(value) is None
+
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy class."""
+
+    def test_allows_method(self):
+        """Test that only idempotent methods are retried by default."""
+        policy = RetryPolicy()
+
+        assert policy.allows_method("GET")
+        assert not policy.allows_method("POST")
+        assert RetryPolicy(retry_non_idempotent=True).allows_method("POST")
+
+    def test_should_retry(self):
+        """Test retry decisions by status and attempt number."""
+        policy = RetryPolicy(max_attempts=3)
+
+        assert policy.should_retry(1, 429)
+        assert policy.should_retry(1, 503)
+        assert policy.should_retry(2, None)
+        assert not policy.should_retry(1, 400)
+        assert not policy.should_retry(1, 404)
+        assert not policy.should_retry(3, 503)
+
+    def test_backoff_without_jitter(self):
+        """Test exponential growth capped at max_delay."""
+        policy = RetryPolicy(base_delay=1, multiplier=2, max_delay=5, jitter=0)
+
+        assert policy.backoff(1) == 1
+        assert policy.backoff(2) == 2
+        assert policy.backoff(3) == 4
+        assert policy.backoff(4) == 5
+
+    def test_backoff_with_jitter(self):
+        """Test that jitter keeps delays within the expected range."""
+        policy = RetryPolicy(base_delay=1, jitter=0.5)
+
+        for _ in range(50):
+            assert 0.5 <= policy.backoff(1) <= 1
+
+    def test_retry_after_takes_precedence(self):
+        """Test that Retry-After overrides backoff, up to the cap."""
+        policy = RetryPolicy(max_retry_after=10)
+
+        assert policy.delay(1, retry_after=3) == 3
+        assert policy.delay(1, retry_after=60) == 10
+
+    def test_invalid_arguments(self):
+        """Test argument validation."""
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+        with pytest.raises(ValueError):
+            RetryPolicy(jitter=2)
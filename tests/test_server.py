@@ -0,0 +1,566 @@
+"""
+Tests for the MCP server.
+
+Tests tool handlers against a mocked client, the streamable HTTP app serving
+several sessions from one shared client, and transport selection on the
+command line.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from starlette.testclient import TestClient
+
+import src.server as server
+from src.coupang_client import CoupangAPIError
+from src.models.product import DeepLink, DeepLinkBatchResult, Product
+from src.utils.config import Config, config
+
+HEADERS = {"Accept": "application/json, text/event-stream", "Content-Type": "application/json"}
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {"protocolVersion": "2025-03-26", "capabilities": {}, "clientInfo": {"name": "test", "version": "1"}},
+}
+
+
+PRODUCTS = [
+    Product(
+        productId=str(i), productName=f"노트북 {i}", productPrice=price, productImage=f"https://example.com/{i}.jpg",
+        productUrl=f"https://link.coupang.com/{i}", categoryName="노트북", isRocket=rocket, isFreeShipping=False,
+        discountRate=discount
+    )
+    for i, (price, rocket, discount) in enumerate([
+        (900000, True, 10), (450000, False, 30), (700000, True, 0), (300000, True, 20), (1200000, True, 5),
+    ], 1)
+]
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Shared client replaced by a mock returning PRODUCTS."""
+    mock = MagicMock()
+    mock.search_products = AsyncMock(side_effect=lambda keyword, limit: PRODUCTS[:limit])
+    mock.get_best_products_by_category = AsyncMock(side_effect=lambda category_id, limit: PRODUCTS[:limit])
+    mock.search_products_batch = AsyncMock(return_value={
+        "노트북": PRODUCTS[:1],
+        "마우스": CoupangAPIError("API error: 500"),
+    })
+    mock.create_deeplinks_batch = AsyncMock(return_value=DeepLinkBatchResult(
+        links=[DeepLink(
+            originalUrl="https://www.coupang.com/vp/products/1",
+            shortenUrl="https://link.coupang.com/a/1",
+            landingUrl="https://www.coupang.com/vp/products/1?lptag=AF1"
+        )],
+        errors={"https://www.coupang.com/vp/products/2": "Not converted by the API"}
+    ))
+    monkeypatch.setattr(server, "client", mock)
+    return mock
+
+
+@pytest.fixture
+def unset_store_paths(monkeypatch):
+    """Unset the shared store paths and restore them after share_local_stores sets them."""
+    for name in ("COUPANG_RATE_LIMIT_DB", "COUPANG_DISK_CACHE_PATH"):
+        # setenv first so monkeypatch records the original value even when it was unset
+        monkeypatch.setenv(name, "")
+        monkeypatch.delenv(name)
+
+
+def _text(result) -> str:
+    """Text of a single-content tool result."""
+    assert len(result) == 1
+    return result[0].text
+
+
+@pytest.fixture
+def http_client(monkeypatch):
+    """Test client for the HTTP app with JSON responses and no connection warm-up."""
+    monkeypatch.setattr(config, "http_json_response", True)
+    monkeypatch.setattr(server, "client", None)
+    with patch("src.coupang_client.CoupangClient.warm_up", new_callable=AsyncMock, return_value=0):
+        with TestClient(server.create_http_app()) as test_client:
+            yield test_client
+
+
+class TestToolFilters:
+    """Test cases for filter and sort options through the tool handlers."""
+
+    @pytest.mark.asyncio
+    async def test_search_filters_and_sorts(self, mock_client):
+        """Test that search results are filtered and sorted from a full candidate page."""
+        text = _text(await server.call_tool("search_products", {
+            "keyword": "노트북", "limit": 2, "max_price": 1000000, "rocket_only": True, "sort_by": "price"
+        }))
+
+        mock_client.search_products.assert_awaited_once_with(keyword="노트북", limit=server.FILTER_CANDIDATES)
+        assert text.startswith("Found 2 product(s) for '노트북' matching filters (of 5 searched):")
+        assert text.index("노트북 4") < text.index("노트북 3")
+        assert "노트북 1" not in text and "노트북 2" not in text
+
+    @pytest.mark.asyncio
+    async def test_search_without_filters_uses_limit(self, mock_client):
+        """Test that unfiltered searches fetch only the requested limit."""
+        text = _text(await server.call_tool("search_products", {"keyword": "노트북", "limit": 3}))
+
+        mock_client.search_products.assert_awaited_once_with(keyword="노트북", limit=3)
+        assert text.startswith("Found 3 product(s) for '노트북':")
+
+    @pytest.mark.asyncio
+    async def test_category_filters_sort_desc(self, mock_client):
+        """Test discount filtering with a descending sort on category best products."""
+        text = _text(await server.call_tool("get_best_products_by_category", {
+            "category_id": "1016", "limit": 5, "min_discount": 10, "sort_by": "discount_rate", "sort_order": "desc"
+        }))
+
+        mock_client.get_best_products_by_category.assert_awaited_once_with(
+            category_id="1016", limit=server.FILTER_CANDIDATES
+        )
+        assert text.startswith("Found 3 best product(s) in category '1016' matching filters (of 5 best products):")
+        assert text.index("노트북 2") < text.index("노트북 4") < text.index("노트북 1")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit", [-3, 0, 101, "many"])
+    async def test_category_limit_validated_with_filters(self, mock_client, limit):
+        """Test that an out-of-range limit is rejected even though filtering fetches every candidate."""
+        text = _text(await server.call_tool("get_best_products_by_category", {
+            "category_id": "1016", "limit": limit, "rocket_only": True
+        }))
+
+        assert text.startswith("Error: Invalid parameters.")
+        assert "limit" in text
+        mock_client.get_best_products_by_category.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_category_numeric_string_limit(self, mock_client):
+        """Test that a numeric string limit is coerced like the search tool does."""
+        text = _text(await server.call_tool("get_best_products_by_category", {
+            "category_id": "1016", "limit": "2", "rocket_only": True
+        }))
+
+        assert text.startswith("Found 2 best product(s) in category '1016' matching filters (of 5 best products):")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("keywords", [["", "  "], ["노트북", " \t"]])
+    async def test_batch_blank_keywords_rejected(self, mock_client, keywords):
+        """Test that blank batch keywords are rejected before any search is sent."""
+        text = _text(await server.call_tool("search_products_batch", {"keywords": keywords}))
+
+        assert text.startswith("Error: Invalid parameters.")
+        assert "keywords must not be empty or blank" in text
+        mock_client.search_products_batch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_batch_keywords_stripped(self, mock_client):
+        """Test that batch keywords are searched without surrounding whitespace."""
+        await server.call_tool("search_products_batch", {"keywords": [" 노트북 "], "limit": 1})
+
+        mock_client.search_products_batch.assert_awaited_once_with(keywords=["노트북"], limit=1)
+
+    @pytest.mark.asyncio
+    async def test_no_matches(self, mock_client):
+        """Test the message when no candidate matches the filters."""
+        text = _text(await server.call_tool("search_products", {"keyword": "노트북", "min_price": 2000000}))
+
+        assert text == "No products found for keyword: '노트북' matching the given filters"
+
+    @pytest.mark.asyncio
+    async def test_candidates_in_compact_output(self, mock_client):
+        """Test that compact output reports how many candidates were filtered."""
+        text = _text(await server.call_tool("search_products", {
+            "keyword": "노트북", "free_shipping_only": True, "output_format": "compact_json"
+        }))
+
+        assert json.loads(text) == {"keyword": "노트북", "candidates": 5, "count": 0, "products": []}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("arguments", [
+        {"min_price": 500000, "max_price": 100000},
+        {"sort_by": "rating"},
+        {"min_discount": 150},
+    ])
+    async def test_invalid_filters_rejected(self, mock_client, arguments):
+        """Test that invalid filter options are reported without calling the API."""
+        text = _text(await server.call_tool("search_products", {"keyword": "노트북", **arguments}))
+
+        assert text.startswith("Error: Invalid parameters.")
+        mock_client.search_products.assert_not_awaited()
+
+
+class TestToolOutputFormats:
+    """Test cases for compact_json and table output through the tool handlers."""
+
+    FIELDS = {"fields": ["id", "price", "rocket"]}
+
+    @pytest.mark.asyncio
+    async def test_search_compact_json(self, mock_client):
+        """Test compact JSON output of search_products with selected fields."""
+        text = _text(await server.call_tool("search_products", {
+            "keyword": "노트북", "limit": 2, "output_format": "compact_json", **self.FIELDS
+        }))
+
+        assert json.loads(text) == {"keyword": "노트북", "count": 2, "products": [
+            {"id": "1", "price": 900000, "rocket": True},
+            {"id": "2", "price": 450000},
+        ]}
+
+    @pytest.mark.asyncio
+    async def test_search_table(self, mock_client):
+        """Test table output of search_products with selected fields."""
+        text = _text(await server.call_tool("search_products", {
+            "keyword": "노트북", "limit": 2, "output_format": "table", **self.FIELDS
+        }))
+
+        assert text == "# keyword: 노트북\nid\tprice\trocket\n1\t900000\t1\n2\t450000\t"
+
+    @pytest.mark.asyncio
+    async def test_batch_compact_json(self, mock_client):
+        """Test compact JSON output of search_products_batch, including a failed keyword."""
+        text = _text(await server.call_tool("search_products_batch", {
+            "keywords": ["노트북", "마우스"], "output_format": "compact_json", **self.FIELDS
+        }))
+
+        assert json.loads(text) == [
+            {"keyword": "노트북", "count": 1, "products": [{"id": "1", "price": 900000, "rocket": True}]},
+            {"keyword": "마우스", "error": "API error: 500", "count": 0, "products": []},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batch_table(self, mock_client):
+        """Test table output of search_products_batch: one table per keyword."""
+        text = _text(await server.call_tool("search_products_batch", {
+            "keywords": ["노트북", "마우스"], "output_format": "table", **self.FIELDS
+        }))
+
+        assert text == (
+            "# keyword: 노트북\nid\tprice\trocket\n1\t900000\t1\n\n"
+            "# keyword: 마우스\n# error: API error: 500\nid\tprice\trocket"
+        )
+
+    @pytest.mark.asyncio
+    async def test_category_compact_json(self, mock_client):
+        """Test compact JSON output of get_best_products_by_category."""
+        text = _text(await server.call_tool("get_best_products_by_category", {
+            "category_id": "1016", "limit": 1, "output_format": "compact_json", **self.FIELDS
+        }))
+
+        assert json.loads(text) == {
+            "category_id": "1016", "count": 1, "products": [{"id": "1", "price": 900000, "rocket": True}]
+        }
+
+    @pytest.mark.asyncio
+    async def test_category_table(self, mock_client):
+        """Test table output of get_best_products_by_category."""
+        text = _text(await server.call_tool("get_best_products_by_category", {
+            "category_id": "1016", "limit": 1, "output_format": "table", **self.FIELDS
+        }))
+
+        assert text == "# category_id: 1016\nid\tprice\trocket\n1\t900000\t1"
+
+    @pytest.mark.asyncio
+    async def test_deeplinks_compact_json(self, mock_client):
+        """Test compact JSON output of create_deeplinks with a failed URL."""
+        text = _text(await server.call_tool("create_deeplinks", {
+            "coupang_urls": ["https://www.coupang.com/vp/products/1", "https://www.coupang.com/vp/products/2"],
+            "output_format": "compact_json"
+        }))
+
+        assert json.loads(text) == {
+            "count": 1,
+            "links": [{
+                "url": "https://www.coupang.com/vp/products/1",
+                "short": "https://link.coupang.com/a/1",
+                "landing": "https://www.coupang.com/vp/products/1?lptag=AF1",
+            }],
+            "errors": {"https://www.coupang.com/vp/products/2": "Not converted by the API"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_deeplinks_table(self, mock_client):
+        """Test table output of create_deeplinks with a failed URL."""
+        text = _text(await server.call_tool("create_deeplinks", {
+            "coupang_urls": ["https://www.coupang.com/vp/products/1", "https://www.coupang.com/vp/products/2"],
+            "output_format": "table"
+        }))
+
+        assert text == (
+            "url\tshort\tlanding\n"
+            "https://www.coupang.com/vp/products/1\thttps://link.coupang.com/a/1\t"
+            "https://www.coupang.com/vp/products/1?lptag=AF1\n"
+            "# error: https://www.coupang.com/vp/products/2: Not converted by the API"
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("tool,arguments", [
+        ("search_products", {"keyword": "노트북"}),
+        ("search_products_batch", {"keywords": ["노트북"]}),
+        ("get_best_products_by_category", {"category_id": "1016"}),
+    ])
+    async def test_fields_string_rejected(self, mock_client, tool, arguments):
+        """Test that fields given as a string are rejected with a clear message."""
+        text = _text(await server.call_tool(tool, {**arguments, "output_format": "table", "fields": "id"}))
+
+        assert text.startswith("Error: Invalid parameters. fields must be a list of field names")
+
+    @pytest.mark.asyncio
+    async def test_unknown_format_rejected(self, mock_client):
+        """Test that an unknown output format is rejected before calling the API."""
+        text = _text(await server.call_tool("create_deeplinks", {
+            "coupang_urls": ["https://www.coupang.com/vp/products/1"], "output_format": "xml"
+        }))
+
+        assert text.startswith("Error: Invalid parameters. Unknown output_format: xml")
+        mock_client.create_deeplinks_batch.assert_not_awaited()
+
+
+class TestHttpTransport:
+    """Test cases for the streamable HTTP transport."""
+
+    def test_sessions_share_one_client(self, http_client):
+        """Test that separate MCP sessions are served by the same CoupangClient."""
+        shared = server.client
+        session_ids = set()
+
+        for _ in range(2):
+            response = http_client.post(config.http_path, json=INITIALIZE, headers=HEADERS)
+            assert response.status_code == 200
+            assert response.json()["result"]["serverInfo"]["name"] == "coupang-mcp-server"
+            session_ids.add(response.headers["mcp-session-id"])
+
+        assert len(session_ids) == 2
+        assert shared is not None and server.client is shared
+
+    def test_list_tools_in_session(self, http_client):
+        """Test a tool listing within an initialized session."""
+        response = http_client.post(config.http_path, json=INITIALIZE, headers=HEADERS)
+        headers = {**HEADERS, "mcp-session-id": response.headers["mcp-session-id"]}
+        http_client.post(
+            config.http_path, json={"jsonrpc": "2.0", "method": "notifications/initialized"}, headers=headers
+        )
+
+        response = http_client.post(
+            config.http_path, json={"jsonrpc": "2.0", "id": 2, "method": "tools/list"}, headers=headers
+        )
+
+        names = [tool["name"] for tool in response.json()["result"]["tools"]]
+        assert "search_products" in names
+
+    def test_health(self, http_client):
+        """Test the health endpoint reporting shared client statistics."""
+        response = http_client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ok"
+        assert "search_cache" in response.json()["client"]
+
+
+class TestDeferredStartup:
+    """Test cases for creating the client in the background (stdio)."""
+
+    @pytest.mark.asyncio
+    async def test_client_created_after_list_tools(self, monkeypatch):
+        """Test that a deferred client is created once list_tools has been answered."""
+        monkeypatch.setattr(server, "client", None)
+        monkeypatch.setattr(server, "CLIENT_PRELOAD_DELAY", 60)
+
+        with patch("src.coupang_client.CoupangClient.warm_up", new_callable=AsyncMock, return_value=0):
+            await server.startup(defer_client=True)
+            try:
+                await asyncio.sleep(0.05)
+                assert server.client is None
+
+                await server.list_tools()
+                await asyncio.wait_for(server.warmup_task, timeout=5)
+                assert server.client is not None
+            finally:
+                await server.cleanup()
+                monkeypatch.setattr(server, "tools_listed", None)
+
+
+class TestMain:
+    """Test cases for transport selection."""
+
+    def test_http_transport_runs_uvicorn(self):
+        """Test that --transport http serves the HTTP app on the given address."""
+        with patch("uvicorn.run") as mock_run:
+            server.main(["--transport", "http", "--host", "0.0.0.0", "--port", "9000"])
+
+        assert mock_run.call_args.kwargs["host"] == "0.0.0.0"
+        assert mock_run.call_args.kwargs["port"] == 9000
+
+    def test_unknown_transport_rejected(self):
+        """Test that unknown transports are rejected."""
+        with pytest.raises(SystemExit):
+            server.main(["--transport", "websocket"])
+
+    def test_workers_run_app_factory(self, monkeypatch, tmp_path, unset_store_paths):
+        """Test that --workers starts uvicorn worker processes from the app factory."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+        with patch("uvicorn.run") as mock_run:
+            server.main(["--transport", "http", "--port", "9000", "--workers", "2"])
+
+        assert mock_run.call_args.args == ("src.server:create_http_app",)
+        assert mock_run.call_args.kwargs["factory"] is True
+        assert mock_run.call_args.kwargs["workers"] == 2
+
+    def test_workers_force_stateless_json(self, monkeypatch, tmp_path, unset_store_paths):
+        """Test that worker processes serve stateless JSON responses, since sessions cannot span workers."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        monkeypatch.setenv("COUPANG_MCP_STATELESS", "false")
+        monkeypatch.setenv("COUPANG_MCP_JSON_RESPONSE", "false")
+
+        with patch("uvicorn.run"):
+            server.main(["--transport", "http", "--port", "9000", "--workers", "2"])
+
+        worker_config = Config()
+        assert worker_config.http_stateless is True
+        assert worker_config.http_json_response is True
+
+    def test_workers_reject_shared_directory(self, monkeypatch, tmp_path, unset_store_paths):
+        """Test that --workers exits with a usage error when the store directory is not private."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        (tmp_path / "coupang-mcp-9000").mkdir(mode=0o777)
+        (tmp_path / "coupang-mcp-9000").chmod(0o777)
+
+        with patch("uvicorn.run") as mock_run, pytest.raises(SystemExit):
+            server.main(["--transport", "http", "--port", "9000", "--workers", "2"])
+
+        mock_run.assert_not_called()
+
+    def test_workers_require_http(self):
+        """Test that multiple workers are rejected for the stdio transport."""
+        with pytest.raises(SystemExit):
+            server.main(["--transport", "stdio", "--workers", "2"])
+
+
+class TestCategoryRefresherLock:
+    """Test cases for running one category refresher per shared rate budget."""
+
+    @pytest.fixture
+    def shared_budget(self, monkeypatch, tmp_path):
+        """Enable prefetching with a shared rate limit database."""
+        monkeypatch.setattr(config, "rate_limit_db", str(tmp_path / "rate_limit.db"))
+        monkeypatch.setattr(config, "category_refresh_interval", 3600.0)
+        monkeypatch.setattr(server, "category_refresher", None)
+        monkeypatch.setattr(server, "refresher_lock", None)
+        yield
+        if server.refresher_lock:
+            server.refresher_lock.close()
+
+    def test_one_process_holds_lock(self, shared_budget, monkeypatch):
+        """Test that a second process sharing the rate limit database does not get the lock."""
+        assert server._acquire_refresher_lock() is True
+        first = server.refresher_lock
+        monkeypatch.setattr(server, "refresher_lock", None)  # As seen from another worker process
+
+        assert server._acquire_refresher_lock() is False
+
+        first.close()
+        assert server._acquire_refresher_lock() is True
+
+    def test_no_shared_budget_always_refreshes(self, shared_budget, monkeypatch):
+        """Test that a process without a shared rate limit database refreshes on its own."""
+        monkeypatch.setattr(config, "rate_limit_db", None)
+
+        assert server._acquire_refresher_lock() is True
+        assert server._acquire_refresher_lock() is True
+        assert server.refresher_lock is None
+
+    def test_refresher_skipped_without_lock(self, shared_budget, monkeypatch):
+        """Test that only the lock holder starts a CategoryRefresher."""
+        assert server._acquire_refresher_lock() is True
+        held = server.refresher_lock
+        monkeypatch.setattr(server, "refresher_lock", None)
+
+        with patch("src.category_refresher.CategoryRefresher") as refresher_class:
+            server.start_category_refresher()
+
+        refresher_class.assert_not_called()
+        assert server.category_refresher is None
+        held.close()
+
+
+@pytest.mark.usefixtures("unset_store_paths")
+class TestShareLocalStores:
+    """Test cases for the stores shared by worker processes."""
+
+    def test_defaults_per_port(self, monkeypatch, tmp_path):
+        """Test that unset store paths default to a per-port runtime directory."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+        paths = server.share_local_stores(9000)
+
+        assert paths["COUPANG_RATE_LIMIT_DB"] == str(tmp_path / "coupang-mcp-9000" / "rate_limit.db")
+        assert paths["COUPANG_DISK_CACHE_PATH"] == str(tmp_path / "coupang-mcp-9000" / "responses.db")
+        assert server.os.environ["COUPANG_RATE_LIMIT_DB"] == paths["COUPANG_RATE_LIMIT_DB"]
+
+    def test_directory_private_to_user(self, monkeypatch, tmp_path):
+        """Test that the store directory is created with mode 0700."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+
+        server.share_local_stores(9000)
+
+        assert (tmp_path / "coupang-mcp-9000").stat().st_mode & 0o777 == 0o700
+
+    def test_cache_dir_without_runtime_dir(self, monkeypatch, tmp_path):
+        """Test that ~/.cache/coupang-mcp is used when XDG_RUNTIME_DIR is unset."""
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        monkeypatch.setenv("HOME", str(tmp_path))
+
+        paths = server.share_local_stores(9000)
+
+        assert paths["COUPANG_RATE_LIMIT_DB"] == str(tmp_path / ".cache" / "coupang-mcp" / "9000" / "rate_limit.db")
+
+    def test_open_directory_rejected(self, monkeypatch, tmp_path):
+        """Test that a pre-existing directory other users can access is rejected."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        (tmp_path / "coupang-mcp-9000").mkdir()
+        (tmp_path / "coupang-mcp-9000").chmod(0o755)
+
+        with pytest.raises(PermissionError, match="accessible to other users"):
+            server.share_local_stores(9000)
+
+        assert "COUPANG_RATE_LIMIT_DB" not in server.os.environ
+
+    def test_foreign_owner_rejected(self, monkeypatch, tmp_path):
+        """Test that a directory owned by another user is rejected."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        monkeypatch.setattr(server.os, "getuid", lambda: (tmp_path / "..").stat().st_uid + 1)
+
+        with pytest.raises(PermissionError, match="another user"):
+            server.share_local_stores(9000)
+
+    def test_symlink_rejected(self, monkeypatch, tmp_path):
+        """Test that a symlink planted at the directory path is not followed."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        target = tmp_path / "elsewhere"
+        target.mkdir(mode=0o700)
+        (tmp_path / "coupang-mcp-9000").symlink_to(target)
+
+        with pytest.raises(PermissionError, match="not a directory"):
+            server.share_local_stores(9000)
+
+    def test_configured_paths_kept(self, monkeypatch, tmp_path):
+        """Test that explicitly configured store paths are not overridden."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        monkeypatch.setenv("COUPANG_RATE_LIMIT_DB", "/data/limits.db")
+
+        paths = server.share_local_stores(9000)
+
+        assert paths["COUPANG_RATE_LIMIT_DB"] == "/data/limits.db"
+        assert paths["COUPANG_DISK_CACHE_PATH"].startswith(str(tmp_path))
+
+    def test_configured_paths_create_no_directory(self, monkeypatch, tmp_path):
+        """Test that no default directory is created when both store paths are configured."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        monkeypatch.setenv("COUPANG_RATE_LIMIT_DB", "/data/limits.db")
+        monkeypatch.setenv("COUPANG_DISK_CACHE_PATH", "/data/responses.db")
+
+        server.share_local_stores(9000)
+
+        assert not (tmp_path / "coupang-mcp-9000").exists()